@@ -0,0 +1,134 @@
+"""
+core 패키지 import 시간/메모리 벤치마크.
+항목마다 새 인터프리터에서 import하고, 불러오면 안 되는 무거운 모듈이 로드되면 실패합니다.
+
+    python benchmarks/import_time.py --output import_baseline.json
+    python benchmarks/import_time.py --baseline import_baseline.json --tolerance 0.3
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PLOTTING = ('matplotlib', 'seaborn', 'missingno')
+NOTEBOOK = ('ipywidgets', 'IPython')
+SKLEARN = ('sklearn',)
+STYLER = ('jinja2', 'pandas.io.formats.style')
+
+# (이름, import 문, 로드되면 안 되는 모듈)
+CASES = [
+    ('core', 'import core', ('pandas',) + PLOTTING + NOTEBOOK + SKLEARN),
+    ('DataPreprocessor', 'from core import DataPreprocessor', PLOTTING + NOTEBOOK + SKLEARN),
+    ('TransformPlan', 'from core import TransformPlan', PLOTTING + NOTEBOOK + SKLEARN),
+    ('EDA', 'from core import EDA', PLOTTING + NOTEBOOK + SKLEARN),
+    ('DataAnalysisPipeline', 'from core import DataAnalysisPipeline', PLOTTING + NOTEBOOK + SKLEARN),
+    ('FeatureEngineer', 'from core import FeatureEngineer', PLOTTING + NOTEBOOK + SKLEARN),
+    ('ModelEvaluator', 'from core import ModelEvaluator', PLOTTING + NOTEBOOK),
+    ('load_pipeline', 'from core import load_pipeline', PLOTTING + NOTEBOOK + SKLEARN),
+    ('pandas_setup', 'import core.pandas.pandas_setup_Final', PLOTTING + NOTEBOOK + STYLER),
+    # seaborn이 import 시 ipywidgets를 직접 불러오므로 시각화 모듈은 시간/RSS만 기준과 비교
+    ('visualization_setup', 'import core.visualisation.visualization_setup', ()),
+    ('visualization_setup_pro', 'import core.visualisation.visualization_setup_pro', ()),
+]
+
+# 자식 프로세스에서 실행: 인터프리터 기본 비용을 뺀 import 시간/최대 RSS 증가량과 로드된 무거운 모듈
+PROBE = """
+import json, resource, sys, time
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+exec({statement!r})
+seconds = time.perf_counter() - start
+print(json.dumps({{
+    'seconds': seconds,
+    'rss_mb': (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss) / 1024,
+    'loaded': [name for name in {forbidden!r} if name in sys.modules],
+}}))
+"""
+
+
+def probe(statement, forbidden=()):
+    """새 인터프리터에서 statement 한 번 실행"""
+    code = PROBE.format(statement=statement, forbidden=list(forbidden))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get('PYTHONPATH')])))
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True, env=env, cwd=ROOT)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def run(repeat=3, only=None):
+    """항목별 시간(최소값)/RSS 증가량(최소값)과 금지 모듈 로드 여부"""
+    results = []
+    for name, statement, forbidden in CASES:
+        if only and not any(name.startswith(prefix) for prefix in only):
+            continue
+        runs = [probe(statement, forbidden) for _ in range(repeat)]
+        loaded = sorted({module for result in runs for module in result['loaded']})
+        result = {
+            'name': name,
+            'seconds': min(result['seconds'] for result in runs),
+            'rss_mb': min(result['rss_mb'] for result in runs),
+            'forbidden_loaded': loaded,
+        }
+        results.append(result)
+        status = f"FORBIDDEN: {', '.join(loaded)}" if loaded else 'ok'
+        print(f"{name:<26} {result['seconds']:8.3f}s  rss=+{result['rss_mb']:7.1f}MB  {status}")
+    return {
+        'meta': {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+        },
+        'results': results,
+    }
+
+
+def compare(current, baseline, tolerance=0.3):
+    """기준 결과 대비 시간/RSS가 tolerance 이상 늘어난 항목 목록"""
+    reference = {r['name']: r for r in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        base = reference.get(result['name'])
+        if base is None:
+            continue
+        for metric in ('seconds', 'rss_mb'):
+            ratio = result[metric] / base[metric] if base[metric] > 0 else 1.0
+            status = 'REGRESSION' if ratio > 1 + tolerance else 'ok'
+            print(f"{result['name']:<26} {metric:<8} x{ratio:5.2f}  {status}")
+            if status != 'ok':
+                regressions.append((result['name'], metric, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='core package import-time benchmark')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--only', nargs='+', help='이름 접두어로 항목 선택 (예: DataPreprocessor EDA)')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    parser.add_argument('--baseline', help='비교할 기준 결과 JSON')
+    parser.add_argument('--tolerance', type=float, default=0.3, help='허용 증가율 (0.3 = 30%%)')
+    args = parser.parse_args(argv)
+
+    current = run(repeat=args.repeat, only=args.only)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(current, f, indent=2)
+        print(f'Results saved: {args.output}')
+
+    failures = [result['name'] for result in current['results'] if result['forbidden_loaded']]
+    if failures:
+        print(f'{len(failures)} case(s) loaded forbidden modules: {failures}')
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(current, json.load(f), tolerance=args.tolerance)
+        if regressions:
+            print(f'{len(regressions)} regression(s) found.')
+    return 1 if failures or regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,161 @@
+"""
+전처리/EDA/피처 엔지니어링/모델 평가 벤치마크.
+
+    python benchmarks/run_benchmarks.py --rows 1e4 1e5 --output results.json
+    python benchmarks/run_benchmarks.py --rows 1e4 1e5 --baseline results.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import matplotlib
+
+matplotlib.use('Agg')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.dirname(os.path.abspath(__file__))]
+
+import matplotlib.pyplot as plt
+from sklearn.linear_model import LogisticRegression
+
+from core import EDA, ApproxColumnProfile, ColumnProfile, DataPreprocessor, FeatureEngineer, ModelEvaluator
+from synthetic_data import make_synthetic_frame
+
+DEFAULT_ROWS = [10_000, 100_000, 1_000_000, 10_000_000]
+
+
+def _call(func):
+    with contextlib.redirect_stdout(io.StringIO()):
+        func()
+
+
+def measure(func, repeat=1):
+    """
+    실행 시간(최소값)과 tracemalloc 최대 메모리 측정.
+    tracemalloc은 Python 객체 할당마다 비용을 더해 pandas/object 위주 단계의 시간을 왜곡하므로
+    시간은 추적 없이 repeat번 재고, 최대 메모리는 별도 추적 실행 한 번으로 잽니다.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _call(func)
+        timings.append(time.perf_counter() - start)
+        plt.close('all')
+
+    tracemalloc.start()
+    try:
+        _call(func)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+        plt.close('all')
+    return min(timings), peak / 1024 ** 2
+
+
+def benchmark_cases(df):
+    """(이름, 함수) 목록. 함수마다 입력을 새로 복사해 캐시/제자리 수정 영향을 없앰"""
+    numeric_cols = [col for col in df.columns if col.startswith('num_')]
+    categorical_cols = [col for col in df.columns if col.startswith('cat_')]
+    features = df[numeric_cols].fillna(0)
+    model = LogisticRegression(max_iter=200).fit(features, df['target'])
+
+    cases = [
+        ('preprocess', lambda: DataPreprocessor(df.copy()).preprocess(remove_outliers_cols=numeric_cols[:2])),
+        ('feature.one_hot_encode', lambda: FeatureEngineer(df.copy()).one_hot_encode(categorical_cols[0])),
+        ('feature.one_hot_encode_many', lambda: FeatureEngineer(df.copy()).one_hot_encode_many(categorical_cols, output='csr')),
+        ('feature.encode_labels', lambda: FeatureEngineer(df.copy()).encode_labels(categorical_cols[0])),
+        ('model_evaluator.evaluate', lambda: ModelEvaluator(model, features, df['target']).evaluate()),
+    ]
+    for method in ('summary', 'missing_values', 'outlier_summary', 'distribution_stats'):
+        cases.append((f'eda.{method}', lambda method=method: getattr(EDA(df), method)()))
+    # 근사 모드(EDA(approximate=True))가 정확한 프로파일보다 빠른지 비교
+    cases.append(('eda.profile_exact', lambda: ColumnProfile(df)))
+    cases.append(('eda.profile_approx', lambda: ApproxColumnProfile.from_frame(df)))
+    return cases
+
+
+def run(rows_list, repeat=1, only=None, **data_kwargs):
+    results = []
+    for rows in rows_list:
+        df = make_synthetic_frame(rows=rows, **data_kwargs)
+        for name, func in benchmark_cases(df):
+            if only and not any(name.startswith(prefix) for prefix in only):
+                continue
+            seconds, peak_mb = measure(func, repeat=repeat)
+            results.append({'name': name, 'rows': rows, 'seconds': seconds, 'peak_mb': peak_mb})
+            print(f'{name:<32} rows={rows:>10,}  {seconds:9.4f}s  peak={peak_mb:9.1f}MB')
+    return {
+        'meta': {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'data': data_kwargs,
+        },
+        'results': results,
+    }
+
+
+def compare(current, baseline, tolerance=0.2):
+    """기준 결과 대비 시간/메모리가 tolerance 이상 늘어난 항목 목록"""
+    reference = {(r['name'], r['rows']): r for r in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        base = reference.get((result['name'], result['rows']))
+        if base is None:
+            continue
+        for metric in ('seconds', 'peak_mb'):
+            ratio = result[metric] / base[metric] if base[metric] else 1.0
+            status = 'REGRESSION' if ratio > 1 + tolerance else 'ok'
+            print(f"{result['name']:<32} rows={result['rows']:>10,}  {metric:<8} x{ratio:5.2f}  {status}")
+            if status != 'ok':
+                regressions.append((result['name'], result['rows'], metric, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='DS core module benchmarks')
+    parser.add_argument('--rows', nargs='+', type=float, default=DEFAULT_ROWS, help='행 수 목록 (예: 1e4 1e5)')
+    parser.add_argument('--numeric-cols', type=int, default=8)
+    parser.add_argument('--categorical-cols', type=int, default=4)
+    parser.add_argument('--null-rate', type=float, default=0.05)
+    parser.add_argument('--cardinality', type=int, default=20)
+    parser.add_argument('--outlier-rate', type=float, default=0.01)
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--only', nargs='+', help='이름 접두어로 벤치마크 선택 (예: eda preprocess)')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    parser.add_argument('--baseline', help='비교할 기준 결과 JSON')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='허용 증가율 (0.2 = 20%%)')
+    args = parser.parse_args(argv)
+
+    current = run(
+        [int(rows) for rows in args.rows],
+        repeat=args.repeat,
+        only=args.only,
+        numeric_cols=args.numeric_cols,
+        categorical_cols=args.categorical_cols,
+        null_rate=args.null_rate,
+        cardinality=args.cardinality,
+        outlier_rate=args.outlier_rate,
+    )
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(current, f, indent=2)
+        print(f'Results saved: {args.output}')
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(current, json.load(f), tolerance=args.tolerance)
+        if regressions:
+            print(f'{len(regressions)} regression(s) found.')
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
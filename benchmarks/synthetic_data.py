@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+
+
+def make_synthetic_frame(rows=10_000, numeric_cols=8, categorical_cols=4, null_rate=0.05, cardinality=20, outlier_rate=0.01, seed=42):
+    """
+    벤치마크용 합성 데이터 생성.
+
+    Args:
+        rows (int): 행 수
+        numeric_cols (int): 수치형 컬럼 수 (num_0, num_1, ...)
+        categorical_cols (int): 범주형 컬럼 수 (cat_0, cat_1, ...)
+        null_rate (float): 컬럼별 결측치 비율
+        cardinality (int): 범주형 컬럼의 고유값 수
+        outlier_rate (float): 수치형 컬럼에 섞을 극단값 비율
+        seed (int): 난수 시드
+
+    Returns:
+        pd.DataFrame: 합성 데이터 + 이진 타깃 컬럼 'target'
+    """
+    rng = np.random.default_rng(seed)
+    data = {}
+    numeric = rng.normal(loc=50, scale=10, size=(rows, numeric_cols))
+    n_outliers = int(rows * outlier_rate)
+    for i in range(numeric_cols):
+        values = numeric[:, i]
+        if n_outliers:
+            positions = rng.choice(rows, n_outliers, replace=False)
+            values[positions] += rng.choice([-1, 1], n_outliers) * rng.uniform(10, 50, n_outliers) * 10
+        data[f'num_{i}'] = values
+
+    categories = np.array([f'level_{j}' for j in range(cardinality)], dtype=object)
+    for i in range(categorical_cols):
+        data[f'cat_{i}'] = categories[rng.integers(0, cardinality, rows)]
+
+    df = pd.DataFrame(data)
+    if null_rate:
+        for col in df.columns:
+            df.loc[rng.random(rows) < null_rate, col] = np.nan
+
+    logits = numeric[:, :min(3, numeric_cols)].sum(axis=1) if numeric_cols else rng.normal(size=rows)
+    df['target'] = (logits > np.median(logits)).astype(np.int64)
+    return df
@@ -0,0 +1,56 @@
+"""
+데이터 분석 공통 모듈 패키지.
+
+    from core import DataPreprocessor, EDA
+
+공개 이름은 처음 접근할 때 해당 모듈만 import합니다.
+matplotlib/seaborn/missingno, ipywidgets/IPython, sklearn 같은 무거운 의존성은
+그림/위젯/모델이 필요한 메서드 안에서만 import되므로 전처리만 하는 배치 작업은 이 비용을 내지 않습니다.
+"""
+import importlib
+
+# pandas/는 __init__.py 없는 네임스페이스 패키지로 둠 (core/가 sys.path에 있을 때 진짜 pandas를 가리지 않도록)
+SUBPACKAGES = ('eda', 'feature', 'model', 'pandas', 'preprocessor', 'visualisation')
+
+# 공개 이름 -> 정의된 모듈
+_EXPORTS = {
+    'ApproxColumnProfile': 'eda.approx_profile',
+    'ColumnProfile': 'eda.column_profile',
+    'EDA': 'eda.eda_setup',
+    'build_report': 'eda.report_builder',
+    'BatchOneHotEncoder': 'feature.one_hot_encoder',
+    'FeatureEngineer': 'feature.feature_engineer',
+    'ConfusionAccumulator': 'model.metrics',
+    'DataAnalysisPipeline': 'model.data_analysis_pipeline',
+    'ModelEvaluator': 'model.model_evaluator',
+    'ModelTrainer': 'model.model_trainer',
+    'run_batch': 'model.batch_runner',
+    'PipelineProfiler': 'model.pipeline_profiler',
+    'StageCache': 'model.stage_cache',
+    'load_pipeline': 'model.pipeline_store',
+    'save_pipeline': 'model.pipeline_store',
+    'ChunkedPreprocessor': 'preprocessor.chunked_preprocessor',
+    'DataPreprocessor': 'preprocessor.data_preprocessor',
+    'TransformPlan': 'preprocessor.transform_plan',
+    'detect_outliers': 'preprocessor.outlier_engine',
+    'optimize_memory': 'preprocessor.memory_optimizer',
+    'export_figures': 'visualisation.figure_export',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+    elif name in SUBPACKAGES:
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # 다음 접근부터는 일반 속성으로 바로 찾도록 캐시
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS) | set(SUBPACKAGES))
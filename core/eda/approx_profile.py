@@ -0,0 +1,197 @@
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from .column_profile import ColumnProfile
+from .sketches import HyperLogLog, KLLSketch
+
+
+def _chunk_moments(values):
+    """청크의 컬럼별 (개수, 평균, 2~4차 중심적률 합)"""
+    missing = np.isnan(values)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        n = values.shape[0] - missing.sum(axis=0).astype('float64')
+        # nansum은 호출마다 NaN을 0으로 바꾼 복사본을 만들므로 결측 마스크를 한 번만 적용
+        dev = np.where(missing, 0.0, values)
+        mean = np.where(n > 0, dev.sum(axis=0) / np.where(n > 0, n, 1), 0.0)
+        dev -= mean
+        dev[missing] = 0.0
+        dev2 = dev * dev
+        return n, mean, dev2.sum(axis=0), (dev2 * dev).sum(axis=0), (dev2 * dev2).sum(axis=0)
+
+
+def _merge_moments(a, b):
+    """두 적률 집합 병합 (Pébay의 병렬 공식, 컬럼 벡터 연산)"""
+    na, mean_a, m2a, m3a, m4a = a
+    nb, mean_b, m2b, m3b, m4b = b
+    n = na + nb
+    with np.errstate(invalid='ignore', divide='ignore'):
+        safe_n = np.where(n > 0, n, 1)
+        delta = mean_b - mean_a
+        mean = mean_a + delta * nb / safe_n
+        m2 = m2a + m2b + delta ** 2 * na * nb / safe_n
+        m3 = (m3a + m3b + delta ** 3 * na * nb * (na - nb) / safe_n ** 2
+              + 3 * delta * (na * m2b - nb * m2a) / safe_n)
+        m4 = (m4a + m4b + delta ** 4 * na * nb * (na ** 2 - na * nb + nb ** 2) / safe_n ** 3
+              + 6 * delta ** 2 * (na ** 2 * m2b + nb ** 2 * m2a) / safe_n ** 2
+              + 4 * delta * (na * m3b - nb * m3a) / safe_n)
+    return n, mean, m2, m3, m4
+
+
+class ApproxColumnProfile(ColumnProfile):
+    """
+    근사 컬럼 프로파일: 분위수는 KLL, 고유값 수는 HyperLogLog, 상위 빈도는 크기 제한 카운터로 계산.
+    청크/파티션별 프로파일을 merge로 합칠 수 있어 큰 데이터도 메모리 제한 안에서 한 번만 읽습니다.
+    ColumnProfile과 같은 속성/메서드를 제공하므로 EDA가 그대로 사용합니다.
+    """
+
+    def __init__(self, top_k=10, kll_k=200, hll_error=0.01, counter_capacity=1000, seed=42):
+        self.n_rows = 0
+        self.top_k = top_k
+        self.kll_k = kll_k
+        self.hll_error = hll_error
+        self.counter_capacity = counter_capacity
+        self.seed = seed
+        self.dtypes = None
+        self.numeric_cols = pd.Index([])
+        self.categorical_cols = pd.Index([])
+        self._nulls = None
+        self._moments = None
+        self._kll = {}
+        self._hll = {}
+        self._counters = {}
+        self._min = None
+        self._max = None
+
+    @classmethod
+    def from_frame(cls, df, chunksize=1_000_000, **kwargs):
+        """메모리 안의 데이터프레임을 청크 단위로 스캔"""
+        profile = cls(**kwargs)
+        for start in range(0, max(len(df), 1), chunksize):
+            profile.update(df.iloc[start:start + chunksize])
+        return profile
+
+    @classmethod
+    def from_chunks(cls, chunks, **kwargs):
+        """청크 이터러블(예: pd.read_csv(..., chunksize=...))을 한 번만 스캔"""
+        profile = cls(**kwargs)
+        for chunk in chunks:
+            profile.update(chunk)
+        return profile
+
+    def _init_schema(self, chunk):
+        self.dtypes = chunk.dtypes
+        self.numeric_cols = chunk.select_dtypes(include=self.NUMERIC_DTYPES).columns
+        self.categorical_cols = chunk.select_dtypes(include=self.CATEGORICAL_DTYPES).columns
+        self._nulls = pd.Series(0, index=chunk.columns)
+        width = len(self.numeric_cols)
+        self._moments = tuple(np.zeros(width) for _ in range(5))
+        self._min = np.full(width, np.inf)
+        self._max = np.full(width, -np.inf)
+        # 고유값 수는 비수치형 컬럼만 보고하므로 HyperLogLog도 비수치형에만 둠
+        for i, col in enumerate(chunk.columns):
+            if col in self.numeric_cols:
+                self._kll[col] = KLLSketch(k=self.kll_k, seed=self.seed + i)
+            else:
+                self._hll[col] = HyperLogLog(error=self.hll_error)
+                self._counters[col] = Counter()
+
+    def _prune(self, counter):
+        """카운터를 상위 counter_capacity개로 제한 (근사 상위 빈도)"""
+        if len(counter) > self.counter_capacity:
+            return Counter(dict(counter.most_common(self.counter_capacity)))
+        return counter
+
+    def update(self, chunk):
+        """청크 하나를 스케치에 반영"""
+        if self.dtypes is None:
+            self._init_schema(chunk)
+        self.n_rows += len(chunk)
+        nulls = pd.Series(0, index=chunk.columns)
+        values = chunk[self.numeric_cols].to_numpy(dtype='float64', na_value=np.nan)
+        moments = _chunk_moments(values)
+        nulls[self.numeric_cols] = len(chunk) - moments[0].astype('int64')
+        self._moments = _merge_moments(self._moments, moments)
+        if len(values):
+            with np.errstate(invalid='ignore'):
+                self._min = np.fmin(self._min, np.nanmin(values, axis=0, initial=np.inf))
+                self._max = np.fmax(self._max, np.nanmax(values, axis=0, initial=-np.inf))
+        for i, col in enumerate(self.numeric_cols):
+            self._kll[col].update(values[:, i])
+        for col in self._counters:
+            # 청크 빈도표 한 번으로 결측치 수/상위 빈도/HyperLogLog를 모두 갱신 (HLL은 고유값만 해싱해도 결과가 같음)
+            counts = chunk[col].value_counts()
+            nulls[col] = len(chunk) - int(counts.sum())
+            self._hll[col].update(counts.index.to_numpy())
+            self._counters[col].update(counts.to_dict())
+            self._counters[col] = self._prune(self._counters[col])
+        self._nulls = self._nulls.add(nulls, fill_value=0).astype('int64')
+        return self
+
+    def merge(self, other):
+        """다른 청크/파티션의 프로파일 병합"""
+        if other.dtypes is None:
+            return self
+        if self.dtypes is None:
+            self._init_schema(pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in other.dtypes.items()}))
+        self.n_rows += other.n_rows
+        self._nulls = self._nulls.add(other._nulls, fill_value=0).astype('int64')
+        self._moments = _merge_moments(self._moments, other._moments)
+        self._min = np.fmin(self._min, other._min)
+        self._max = np.fmax(self._max, other._max)
+        for col, sketch in other._kll.items():
+            self._kll[col].merge(sketch)
+        for col, sketch in other._hll.items():
+            self._hll[col].merge(sketch)
+        for col, counter in other._counters.items():
+            self._counters[col] = self._prune(self._counters[col] + counter)
+        return self
+
+    @property
+    def nulls(self):
+        return self._nulls
+
+    @property
+    def counts(self):
+        return self.n_rows - self._nulls
+
+    @property
+    def unique(self):
+        """HyperLogLog 고유값 수 추정치"""
+        return {col: int(round(self._hll[col].cardinality())) for col in self._counters}
+
+    @property
+    def top_values(self):
+        return {
+            col: pd.Series(dict(counter.most_common(self.top_k)), name='count', dtype='int64')
+            for col, counter in self._counters.items()
+        }
+
+    @property
+    def numeric(self):
+        n, mean, m2, m3, m4 = self._moments
+        with np.errstate(invalid='ignore', divide='ignore'):
+            skew = np.sqrt(n - 1) * n / (n - 2) * m3 / m2 ** 1.5
+            skew = np.where(n < 3, np.nan, np.where(m2 == 0, 0.0, skew))
+            kurt = n * (n + 1) * (n - 1) * m4 / ((n - 2) * (n - 3) * m2 ** 2) - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+            kurt = np.where(n < 4, np.nan, np.where(m2 == 0, 0.0, kurt))
+            stats = {
+                'count': n,
+                'mean': np.where(n > 0, mean, np.nan),
+                'std': np.sqrt(m2 / (n - 1)),
+                'min': np.where(n > 0, self._min, np.nan),
+            }
+        for q in self.QUANTILES:
+            stats[f'{q:.0%}'] = [self._kll[col].quantile(q) for col in self.numeric_cols]
+        stats['max'] = np.where(n > 0, self._max, np.nan)
+        stats['skew'] = skew
+        stats['kurtosis'] = kurt
+        return pd.DataFrame(stats, index=self.numeric_cols)
+
+    def quantile_error(self):
+        """컬럼별 분위수 순위 오차 / 고유값 수 상대 오차 추정치"""
+        return pd.DataFrame({
+            'rank_error': pd.Series({col: sketch.rank_error for col, sketch in self._kll.items()}, dtype='float64'),
+            'distinct_relative_error': pd.Series({col: sketch.relative_error for col, sketch in self._hll.items()}),
+        })
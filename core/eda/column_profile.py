@@ -0,0 +1,99 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+
+class ColumnProfile:
+    """
+    컬럼 프로파일: 개수, 결측치, 적률, 분위수, 왜도/첨도, 상위 빈도값을
+    수치형 블록 한 번의 벡터 연산으로 계산해 두고 EDA 메서드들이 공유합니다.
+    """
+
+    NUMERIC_DTYPES = ['number']
+    CATEGORICAL_DTYPES = ['object', 'category']
+    QUANTILES = [0.25, 0.5, 0.75]
+
+    def __init__(self, df, top_k=10):
+        self.n_rows = len(df)
+        self.top_k = top_k
+        self.dtypes = df.dtypes
+        self.numeric_cols = df.select_dtypes(include=self.NUMERIC_DTYPES).columns
+        self.categorical_cols = df.select_dtypes(include=self.CATEGORICAL_DTYPES).columns
+        self.nulls = df.isnull().sum()
+        self.counts = self.n_rows - self.nulls
+        self.numeric = self._numeric_stats(df[self.numeric_cols].to_numpy(dtype='float64', na_value=np.nan))
+        self._frequency_stats(df[[col for col in df.columns if col not in self.numeric_cols]])
+
+    def _numeric_stats(self, values):
+        """수치형 블록 통계 (컬럼 축 벡터 연산)"""
+        with warnings.catch_warnings(), np.errstate(invalid='ignore', divide='ignore'):
+            warnings.simplefilter('ignore', RuntimeWarning)
+            n = (~np.isnan(values)).sum(axis=0).astype('float64')
+            mean = np.nansum(values, axis=0) / n
+            dev = values - mean
+            dev2 = dev * dev
+            m2 = np.nansum(dev2, axis=0)
+            m3 = np.nansum(dev2 * dev, axis=0)
+            m4 = np.nansum(dev2 * dev2, axis=0)
+            del dev, dev2
+            quantiles = np.nanquantile(values, self.QUANTILES, axis=0) if values.size else np.full((len(self.QUANTILES), values.shape[1]), np.nan)
+
+            # pandas.Series.skew / kurtosis 와 같은 편향 보정식
+            skew = np.sqrt(n - 1) * n / (n - 2) * m3 / m2 ** 1.5
+            skew = np.where(n < 3, np.nan, np.where(m2 == 0, 0.0, skew))
+            kurt = n * (n + 1) * (n - 1) * m4 / ((n - 2) * (n - 3) * m2 ** 2) - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+            kurt = np.where(n < 4, np.nan, np.where(m2 == 0, 0.0, kurt))
+
+            stats = {
+                'count': n,
+                'mean': mean,
+                'std': np.where(n > 1, np.sqrt(m2 / (n - 1)), np.nan),
+                'min': np.nanmin(values, axis=0) if values.size else np.full(values.shape[1], np.nan),
+            }
+            for q, row in zip(self.QUANTILES, quantiles):
+                stats[f'{q:.0%}'] = row
+            stats['max'] = np.nanmax(values, axis=0) if values.size else np.full(values.shape[1], np.nan)
+            stats['skew'] = skew
+            stats['kurtosis'] = kurt
+        return pd.DataFrame(stats, index=self.numeric_cols)
+
+    def _frequency_stats(self, df):
+        """비수치형 컬럼의 고유값 수와 상위 top_k 빈도"""
+        self.unique = {}
+        self.top_values = {}
+        for col in df.columns:
+            counts = df[col].value_counts()
+            self.unique[col] = len(counts)
+            self.top_values[col] = counts.head(self.top_k)
+
+    def quantile(self, q):
+        """프로파일에 계산된 분위수 조회 (QUANTILES 중 하나)"""
+        key = f'{q:.0%}'
+        if key not in self.numeric.columns:
+            raise ValueError(f"Quantile {q} is not profiled. Available: {self.QUANTILES}")
+        return self.numeric[key]
+
+    def describe(self):
+        """describe(include='all') 형태의 요약표"""
+        rows = ['count', 'unique', 'top', 'freq', 'mean', 'std', 'min'] + [f'{q:.0%}' for q in self.QUANTILES] + ['max']
+        numeric, counts, unique, top_values = self.numeric, self.counts, self.unique, self.top_values
+        summary = {}
+        for col in self.dtypes.index:
+            if col in numeric.index:
+                stats = numeric.loc[col]
+                summary[col] = {row: stats[row] for row in rows if row in stats.index}
+            else:
+                top = top_values[col]
+                summary[col] = {
+                    'count': counts[col],
+                    'unique': unique[col],
+                    'top': top.index[0] if len(top) else np.nan,
+                    'freq': top.iloc[0] if len(top) else np.nan,
+                }
+        summary = pd.DataFrame(summary, index=rows, columns=self.dtypes.index)
+        return summary.dropna(how='all')
+
+    def distribution_stats(self):
+        """수치형 변수의 왜도와 첨도"""
+        return self.numeric[['skew', 'kurtosis']].rename(columns={'skew': 'Skewness', 'kurtosis': 'Kurtosis'})
@@ -0,0 +1,130 @@
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from .fingerprint import frame_fingerprint
+
+# (데이터 지문, method, dtype) -> 상관 행렬. EDA와 시각화 함수가 같은 계산 결과를 공유
+_CACHE = OrderedDict()
+CACHE_SIZE = 8
+
+
+def _pairwise_block(Xi, Mi, Xj, Mj):
+    """결측치가 있을 때 두 컬럼 블록의 pairwise-complete 피어슨 상관 (행렬곱 5번)"""
+    n = Mi.T @ Mj
+    sum_x = Xi.T @ Mj
+    sum_y = Mi.T @ Xj
+    sum_xy = Xi.T @ Xj
+    sum_x2 = (Xi * Xi).T @ Mj
+    sum_y2 = Mi.T @ (Xj * Xj)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cov = sum_xy - sum_x * sum_y / n
+        var_x = sum_x2 - sum_x ** 2 / n
+        var_y = sum_y2 - sum_y ** 2 / n
+        corr = cov / np.sqrt(var_x * var_y)
+    corr[n < 2] = np.nan
+    return corr
+
+
+def _compute(values, dtype, block_size):
+    """컬럼 블록 단위 상관 계산 (중심화 후 float32 행렬곱)"""
+    mask = ~np.isnan(values)
+    values = values - np.nanmean(values, axis=0)
+    p = values.shape[1]
+    corr = np.empty((p, p), dtype=dtype)
+
+    if mask.all():
+        std = values.std(axis=0)
+        std[std == 0] = np.nan
+        Z = (values / std).astype(dtype)
+        for i in range(0, p, block_size):
+            for j in range(i, p, block_size):
+                block = Z[:, i:i + block_size].T @ Z[:, j:j + block_size] / len(Z)
+                corr[i:i + block_size, j:j + block_size] = block
+                corr[j:j + block_size, i:i + block_size] = block.T
+    else:
+        X = np.where(mask, values, 0).astype(dtype)
+        M = mask.astype(dtype)
+        for i in range(0, p, block_size):
+            for j in range(i, p, block_size):
+                block = _pairwise_block(X[:, i:i + block_size], M[:, i:i + block_size], X[:, j:j + block_size], M[:, j:j + block_size])
+                corr[i:i + block_size, j:j + block_size] = block
+                corr[j:j + block_size, i:i + block_size] = block.T
+    np.clip(corr, -1, 1, out=corr)
+    diagonal = np.diag_indices(p)
+    corr[diagonal] = np.where(np.isnan(corr[diagonal]), np.nan, 1.0)
+    return corr
+
+
+def correlation(df, columns=None, method='pearson', dtype=np.float32, block_size=512, cache=True):
+    """
+    수치형 컬럼 상관 행렬 (블록 단위 float32 계산, 같은 데이터는 캐시 재사용).
+
+    Args:
+        df (pd.DataFrame): 데이터프레임
+        columns (list, optional): 대상 컬럼 (기본: 수치형 전체)
+        method (str): 'pearson' 또는 'spearman' (순위 변환 후 피어슨)
+        dtype: 계산/결과 dtype (기본 float32)
+        block_size (int): 한 번에 곱할 컬럼 블록 크기
+    """
+    if method not in ('pearson', 'spearman'):
+        raise ValueError("Invalid method. Choose 'pearson' or 'spearman'.")
+    columns = list(df.select_dtypes(include='number').columns if columns is None else columns)
+    data = df[columns]
+    key = (frame_fingerprint(data), method, np.dtype(dtype).str) if cache else None
+    if key is not None and key in _CACHE:
+        _CACHE.move_to_end(key)
+        return _CACHE[key]
+
+    if method == 'spearman':
+        data = data.rank(method='average')
+    corr = _compute(data.to_numpy(dtype='float64', na_value=np.nan), dtype, block_size)
+    corr = pd.DataFrame(corr, index=columns, columns=columns)
+
+    if key is not None:
+        _CACHE[key] = corr
+        while len(_CACHE) > CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return corr
+
+
+def clear_cache():
+    _CACHE.clear()
+
+
+def top_k_pairs(corr, k=20, absolute=True):
+    """상관이 가장 강한 컬럼 쌍 k개 (상삼각만 사용)"""
+    values = corr.to_numpy()
+    rows, cols = np.triu_indices(len(values), k=1)
+    pair_values = values[rows, cols]
+    strength = np.abs(pair_values) if absolute else pair_values
+    strength = np.where(np.isnan(strength), -np.inf, strength)
+    k = min(k, len(strength))
+    top = np.argpartition(-strength, k - 1)[:k] if k else np.array([], dtype=int)
+    top = top[np.argsort(-strength[top], kind='stable')]
+    return pd.DataFrame({
+        'feature_a': corr.index[rows[top]],
+        'feature_b': corr.columns[cols[top]],
+        'correlation': pair_values[top],
+    })
+
+
+def heatmap_view(corr, max_features=50, cluster=True):
+    """
+    히트맵용 축소 뷰: 평균 |상관|이 큰 max_features개 컬럼만 남기고,
+    cluster=True면 계층적 군집 순서로 재정렬
+    """
+    if len(corr) > max_features:
+        strength = corr.abs().mean().sort_values(ascending=False)
+        keep = strength.index[:max_features]
+        corr = corr.loc[keep, keep]
+    if cluster and len(corr) > 2:
+        from scipy.cluster.hierarchy import leaves_list, linkage
+        from scipy.spatial.distance import squareform
+
+        distance = 1 - np.abs(np.nan_to_num(corr.to_numpy(dtype='float64')))
+        np.fill_diagonal(distance, 0)
+        order = leaves_list(linkage(squareform(distance, checks=False), method='average'))
+        corr = corr.iloc[order, order]
+    return corr
@@ -0,0 +1,117 @@
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+def _as_naive(x):
+    """시간 축을 pd.Series로 (tz-aware datetime은 UTC 기준 tz-naive datetime64로 변환)"""
+    x = pd.Series(x)
+    if isinstance(x.dtype, pd.DatetimeTZDtype):
+        x = x.dt.tz_convert(None)
+    return x
+
+
+def _as_float(x):
+    """시간 축을 계산용 float 배열로 변환 (datetime은 ns 정수 기준)"""
+    x = _as_naive(x).to_numpy()
+    if np.issubdtype(x.dtype, np.datetime64) or np.issubdtype(x.dtype, np.timedelta64):
+        return x.view('int64').astype('float64')
+    return x.astype('float64')
+
+
+def lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets: 모양을 가장 잘 보존하는 n_out개 점의 위치 (x는 정렬되어 있어야 함)"""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = _as_float(x)
+    y = np.asarray(y, dtype='float64')
+    every = (n - 2) / (n_out - 2)
+    bounds = np.minimum((np.arange(n_out) * every).astype(np.int64) + 1, n)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        start, end = bounds[i], bounds[i + 1]
+        # 다음 버킷의 평균점 (마지막 버킷은 끝점)
+        next_start, next_end = bounds[i + 1], max(bounds[i + 2], bounds[i + 1] + 1)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        area = np.abs((x[prev] - avg_x) * (y[start:end] - y[prev]) - (x[prev] - x[start:end]) * (avg_y - y[prev]))
+        prev = start + int(np.argmax(area))
+        selected[i + 1] = prev
+    return selected
+
+
+def minmax_indices(x, y, n_buckets):
+    """x 범위를 n_buckets(픽셀 폭)개 구간으로 나눠 구간별 최소/최대 점 위치만 유지"""
+    n = len(x)
+    if 2 * n_buckets >= n:
+        return np.arange(n)
+    x = _as_float(x)
+    span = x[-1] - x[0]
+    bucket = np.zeros(n, dtype=np.int64) if span == 0 else np.minimum(((x - x[0]) / span * n_buckets).astype(np.int64), n_buckets - 1)
+    grouped = pd.Series(np.asarray(y, dtype='float64')).groupby(bucket)
+    indices = np.concatenate([grouped.idxmin().to_numpy(), grouped.idxmax().to_numpy(), [0, n - 1]])
+    return np.unique(indices)
+
+
+class DownsampledSeries:
+    """
+    시계열 다운샘플링 캐시: 시간 컬럼을 한 번만 정렬해 두고,
+    (구간, 점 개수, 방식)별 다운샘플 결과를 LRU로 보관해 범위를 바꿔 다시 그려도 빠르게 반환합니다.
+    """
+
+    def __init__(self, x, y, cache_size=16):
+        x = pd.Series(x).reset_index(drop=True)
+        y = pd.Series(y).reset_index(drop=True)
+        # tz-aware 시간은 UTC 기준 datetime64로 정렬/검색하고 결과를 돌려줄 때 원래 시간대로 복원
+        self.tz = x.dt.tz if isinstance(x.dtype, pd.DatetimeTZDtype) else None
+        x = _as_naive(x)
+        valid = (x.notna() & y.notna()).to_numpy()
+        order = np.argsort(x.to_numpy()[valid], kind='stable')
+        self.x = x.to_numpy()[valid][order]
+        self.y = y.to_numpy(dtype='float64')[valid][order]
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        return len(self.x)
+
+    def view(self, n_points, method='lttb', start=None, end=None):
+        """[start, end] 구간을 n_points 근처로 다운샘플한 (x, y)"""
+        key = (n_points, method, start, end)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        lo = 0 if start is None else np.searchsorted(self.x, self._axis_value(start), side='left')
+        hi = len(self.x) if end is None else np.searchsorted(self.x, self._axis_value(end), side='right')
+        x, y = self.x[lo:hi], self.y[lo:hi]
+        if method == 'lttb':
+            indices = lttb_indices(x, y, n_points)
+        elif method == 'minmax':
+            indices = minmax_indices(x, y, max(n_points // 2, 1))
+        elif method is None:
+            indices = np.arange(len(x))
+        else:
+            raise ValueError("Invalid method. Choose 'lttb', 'minmax' or None.")
+
+        x = x[indices]
+        if self.tz is not None:
+            x = pd.DatetimeIndex(x).tz_localize('UTC').tz_convert(self.tz)
+        result = (x, y[indices])
+        self._cache[key] = result
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result
+
+    def _axis_value(self, value):
+        """구간 경계를 정렬된 시간 축과 같은 기준으로 변환 (tz 없는 경계는 컬럼 시간대로 해석)"""
+        if self.tz is None:
+            return np.asarray(value, dtype=self.x.dtype)
+        value = pd.Timestamp(value)
+        if value.tz is None:
+            value = value.tz_localize(self.tz)
+        return np.asarray(value.tz_convert(None).to_datetime64(), dtype=self.x.dtype)
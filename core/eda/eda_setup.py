@@ -1,53 +1,124 @@
+import os
+from contextlib import contextmanager
 from datetime import datetime
 
-import matplotlib.pyplot as plt
-import missingno as msno
 import numpy as np
 import pandas as pd
-import seaborn as sns
+
+from ..preprocessor.outlier_engine import detect_outliers, iqr_bounds
+from .approx_profile import ApproxColumnProfile
+from .column_profile import ColumnProfile
+from .correlation import correlation, heatmap_view, top_k_pairs
+from .downsampling import DownsampledSeries
+from .fingerprint import column_buffers, column_fingerprint
+from .report_builder import ColumnReportCache, build_report, write_report
 
 
 class EDA:
-    def __init__(self, df):
+    def __init__(self, df, approximate=False, sketch_options=None):
+        """
+        Args:
+            df (pd.DataFrame): 데이터프레임
+            approximate (bool): True면 KLL/HyperLogLog 스케치 기반 근사 통계 사용 (큰 데이터용)
+            sketch_options (dict, optional): ApproxColumnProfile 옵션 (kll_k, hll_error, chunksize 등)
+        """
         self.df = df
+        self.approximate = approximate
+        self.sketch_options = sketch_options or {}
+        self._profile = None
+        self._profile_frame = None
+        self._profile_key = None
+        self._pinned_profile = None
+        self._timeseries_cache = {}
+    
+    @property
+    def profile(self):
+        """
+        컬럼 프로파일 (df를 새로 할당했거나 컬럼/shape/dtype이 바뀌었거나 컬럼에 새 값을 대입한 경우에만 다시 계산).
+        df.loc[i, col] = v처럼 기존 배열 안의 값을 제자리에서 고쳤다면 refresh_profile()을 호출하세요.
+        """
+        if self._pinned_profile is not None:
+            return self._pinned_profile
+        # 내용 해시는 describe()만큼 비싸므로 접근마다 계산하지 않고 객체 동일성 + 스키마 + 컬럼별 값 배열 식별자만 비교
+        key = (self.df.shape, tuple(self.df.dtypes.items()), column_buffers(self.df))
+        if self._profile is None or self._profile_frame is not self.df or key != self._profile_key:
+            if self.approximate:
+                self._profile = ApproxColumnProfile.from_frame(self.df, **self.sketch_options)
+            else:
+                self._profile = ColumnProfile(self.df)
+            self._profile_frame = self.df
+            self._profile_key = key
+        return self._profile
+    
+    def refresh_profile(self):
+        """df 값을 제자리에서 수정한 뒤 다음 접근 때 프로파일을 다시 계산하도록 표시"""
+        self._profile = None
+    
+    @contextmanager
+    def pinned_profile(self):
+        """여러 메서드를 연달아 호출하는 동안 같은 프로파일 사용"""
+        self._pinned_profile = self.profile
+        try:
+            yield self._pinned_profile
+        finally:
+            self._pinned_profile = None
     
     def summary(self):
         """기본적인 데이터프레임 요약"""
-        return self.df.describe(include='all')
+        return self.profile.describe()
     
     def missing_values(self):
         """결측치 확인"""
-        return self.df.isnull().sum()
+        return self.profile.nulls
     
     def data_types(self):
         """데이터 타입 확인"""
         return self.df.dtypes
     
-    def correlation_matrix(self):
-        """상관 행렬 출력 (수치형 열에 대해서만)"""
-        numeric_df = self.df.select_dtypes(include=['float64', 'int64'])
-        if numeric_df.empty:
+    def correlation_matrix(self, method='pearson', max_features=50, annot_limit=20):
+        """상관 행렬 출력 (수치형 열에 대해서만, 컬럼이 많으면 상위 max_features개를 군집 순서로 표시)"""
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
+        numeric_cols = self.profile.numeric_cols
+        if numeric_cols.empty:
             print("No numeric columns available for correlation.")
             return
-        corr = numeric_df.corr()
+        corr = correlation(self.df, columns=numeric_cols, method=method)
+        view = heatmap_view(corr, max_features=max_features)
+        annot = len(view) <= annot_limit
         plt.figure(figsize=(10, 8))
-        sns.heatmap(corr, annot=True, cmap='coolwarm', fmt='.2f', linewidths=0.5)
-        plt.title('Correlation Matrix')
+        sns.heatmap(view, annot=annot, cmap='coolwarm', fmt='.2f', linewidths=0.5 if annot else 0)
+        plt.title('Correlation Matrix' if len(view) == len(corr) else f'Correlation Matrix (top {len(view)} of {len(corr)})')
         plt.show()
+        return corr
+    
+    def top_correlations(self, k=20, method='pearson'):
+        """상관이 가장 강한 수치형 변수 쌍 k개"""
+        numeric_cols = self.profile.numeric_cols
+        if len(numeric_cols) < 2:
+            print("At least two numeric columns are required for correlation.")
+            return
+        return top_k_pairs(correlation(self.df, columns=numeric_cols, method=method), k=k)
     
     def plot_histograms(self, sample_size=None):
         """히스토그램 출력 (수치형 데이터만, 선택적 샘플링)"""
+        import matplotlib.pyplot as plt
+        
         df = self.df if sample_size is None else self.df.sample(n=sample_size, random_state=42)
-        numeric_df = df.select_dtypes(include=['float64', 'int64'])
-        if numeric_df.empty:
+        numeric_cols = self.profile.numeric_cols
+        if numeric_cols.empty:
             print("No numeric columns available for histograms.")
             return
-        numeric_df.hist(bins=30, figsize=(15, 10))
+        df[numeric_cols].hist(bins=30, figsize=(15, 10))
         plt.suptitle('Histograms for Numeric Features')
         plt.show()
     
     def boxplot(self, column):
         """박스플롯 출력 (이상치 확인용)"""
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
         if column not in self.df.columns:
             raise ValueError(f"Column '{column}' does not exist in the DataFrame.")
         plt.figure(figsize=(6, 4))
@@ -57,6 +128,9 @@ class EDA:
         
     def plot_categorical(self, column):
         """범주형 데이터 카운트 플롯"""
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
         if column not in self.df.columns:
             raise ValueError(f"Column '{column}' does not exist in the DataFrame.")
         plt.figure(figsize=(8, 6))
@@ -66,7 +140,10 @@ class EDA:
         
     def missing_values_visual(self):
         """결측치 패턴 시각화"""
-        if self.df.isnull().sum().sum() == 0:
+        import matplotlib.pyplot as plt
+        import missingno as msno
+        
+        if self.profile.nulls.sum() == 0:
             print("No missing values in the DataFrame.")
             return
         plt.figure(figsize=(10, 6))
@@ -76,52 +153,51 @@ class EDA:
         
     def categorical_summary(self, top_n=5):
         """범주형 변수의 빈도 분석 (상위 N개 범주)"""
-        categorical_cols = self.df.select_dtypes(include=['object', 'category']).columns
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
+        profile = self.profile
+        categorical_cols = profile.categorical_cols
         if categorical_cols.empty:
             print("No categorical columns available.")
             return
         
         for col in categorical_cols:
+            counts = profile.top_values[col] if top_n <= profile.top_k else self.df[col].value_counts()
             print(f"\nFrequency counts for {col}:")
-            print(self.df[col].value_counts().head(top_n))
+            print(counts.head(top_n))
             
             plt.figure(figsize=(8, 6))
-            sns.countplot(x=self.df[col], order=self.df[col].value_counts().index[:top_n])
+            sns.countplot(x=self.df[col], order=counts.index[:top_n])
             plt.title(f'Top {top_n} Categories in {col}')
             plt.xticks(rotation=45)
             plt.show()
             
-    def outlier_summary(self, threshold=1.5):
-        """수치형 열의 이상치 요약 (IQR 기준)"""
-        numeric_cols = self.df.select_dtypes(include=['float64', 'int64']).columns
+    def outlier_summary(self, threshold=1.5, sample_size=20):
+        """수치형 열의 이상치 요약 (IQR 기준, 이상치 값은 컬럼당 sample_size개 표본만 보관)"""
+        profile = self.profile
+        numeric_cols = profile.numeric_cols
         if numeric_cols.empty:
             print("No numeric columns available.")
             return
         
-        outliers_info = {}
-        for col in numeric_cols:
-            Q1 = self.df[col].quantile(0.25)
-            Q3 = self.df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - threshold * IQR
-            upper_bound = Q3 + threshold * IQR
-            outliers = self.df[(self.df[col] < lower_bound) | (self.df[col] > upper_bound)][col]
-            outliers_info[col] = {
-                'outlier_count': len(outliers),
-                'outlier_values': outliers.tolist()
-            }
+        bounds = iqr_bounds(self.df, numeric_cols, threshold=threshold, quartiles=(profile.quantile(0.25), profile.quantile(0.75)))
+        outliers_info = detect_outliers(self.df, numeric_cols, bounds=bounds, sample_size=sample_size).to_dict()
         
         for col, info in outliers_info.items():
             print(f"\nColumn: {col}")
             print(f"Number of outliers: {info['outlier_count']}")
             if info['outlier_count'] > 0:
-                print(f"Outlier values: {info['outlier_values']}")
+                print(f"Outlier values (sample): {info['outlier_values']}")
         
         return outliers_info
     
     def plot_kde(self):
         """수치형 열의 KDE 플롯"""
-        numeric_cols = self.df.select_dtypes(include=['float64', 'int64']).columns
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
+        numeric_cols = self.profile.numeric_cols
         if numeric_cols.empty:
             print("No numeric columns available for KDE plot.")
             return
@@ -132,13 +208,30 @@ class EDA:
             plt.title(f'KDE Plot for {col}')
             plt.show()
             
-    def pair_plot(self, hue=None):
-        """수치형 변수 간 쌍 플롯 (선택적으로 범주형 hue 사용)"""
-        numeric_cols = self.df.select_dtypes(include=['float64', 'int64']).columns
+    def pair_plot(self, hue=None, large_data=None, row_budget=1_000_000, max_columns=6):
+        """
+        수치형 변수 간 쌍 플롯 (선택적으로 범주형 hue 사용)
+        large_data=None이면 행/컬럼이 많을 때 자동으로 구간화(2D 히스토그램) 모드 사용
+        """
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
+        from ..visualisation.binned_pairplot import binned_pairplot, use_binned_mode
+        
+        numeric_cols = self.profile.numeric_cols
         if len(numeric_cols) < 2:
             print("At least two numeric columns are required for pair plot.")
             return
         
+        if large_data is None:
+            large_data = use_binned_mode(self.df, numeric_cols, max_columns=max_columns)
+        if large_data:
+            columns = [col for col in numeric_cols if col != hue]
+            binned_pairplot(self.df, columns=columns, hue=hue, row_budget=row_budget, max_columns=max_columns)
+            plt.suptitle('Pair Plot of Numeric Features', y=1.02)
+            plt.show()
+            return
+        
         plt.figure(figsize=(10, 10))
         sns.pairplot(self.df, vars=numeric_cols, hue=hue, diag_kind='kde')
         plt.suptitle('Pair Plot of Numeric Features', y=1.02)
@@ -146,26 +239,45 @@ class EDA:
         
     def distribution_stats(self):
         """수치형 변수의 왜도와 첨도 계산"""
-        numeric_cols = self.df.select_dtypes(include=['float64', 'int64']).columns
-        if numeric_cols.empty:
+        profile = self.profile
+        if profile.numeric_cols.empty:
             print("No numeric columns available.")
             return
         
-        stats = pd.DataFrame({
-            'Skewness': self.df[numeric_cols].skew(),
-            'Kurtosis': self.df[numeric_cols].kurtosis()
-        })
+        stats = profile.distribution_stats()
         print("\nDistribution Statistics:")
         print(stats)
         return stats
     
-    def plot_timeseries(self, time_col, value_col):
-        """시계열 데이터 플롯"""
+    def _timeseries(self, time_col, value_col):
+        """시간 컬럼으로 한 번 정렬된 다운샘플 캐시 (두 컬럼 내용이 바뀔 때만 다시 생성)"""
+        key = (time_col, value_col)
+        fingerprint = (column_fingerprint(self.df[time_col]), column_fingerprint(self.df[value_col]))
+        cached = self._timeseries_cache.get(key)
+        if cached is None or cached[0] != fingerprint:
+            cached = (fingerprint, DownsampledSeries(self.df[time_col], self.df[value_col]))
+            self._timeseries_cache[key] = cached
+        return cached[1]
+    
+    def plot_timeseries(self, time_col, value_col, downsample='lttb', max_points=None, start=None, end=None):
+        """
+        시계열 데이터 플롯 (긴 시계열은 다운샘플링)
+        
+        Args:
+            downsample (str, optional): 'lttb', 'minmax' 또는 None(전체 점)
+            max_points (int, optional): 그릴 점 개수 (기본: 그림 너비의 픽셀 수)
+            start, end (optional): 표시할 시간 구간
+        """
+        import matplotlib.pyplot as plt
+        
         if time_col not in self.df.columns or value_col not in self.df.columns:
             raise ValueError("Specified columns do not exist in the DataFrame.")
         
-        plt.figure(figsize=(12, 6))
-        plt.plot(self.df[time_col], self.df[value_col])
+        fig = plt.figure(figsize=(12, 6))
+        if max_points is None:
+            max_points = int(fig.get_figwidth() * fig.dpi)
+        x, y = self._timeseries(time_col, value_col).view(max_points, method=downsample, start=start, end=end)
+        plt.plot(x, y)
         plt.title(f'Time Series Plot: {value_col} over {time_col}')
         plt.xlabel(time_col)
         plt.ylabel(value_col)
@@ -175,7 +287,7 @@ class EDA:
         
     def generate_report(self, output_file='eda_report.txt'):
         """EDA 요약 보고서 생성"""
-        with open(output_file, 'w') as f:
+        with self.pinned_profile(), open(output_file, 'w') as f:
             f.write("=== EDA Report ===\n\n")
             f.write("1. Data Summary:\n")
             f.write(str(self.summary()) + "\n\n")
@@ -188,4 +300,20 @@ class EDA:
             f.write("5. Outlier Summary:\n")
             f.write(str(self.outlier_summary()) + "\n\n")
         
-        print(f"Report generated: {output_file}")
\ No newline at end of file
+        print(f"Report generated: {output_file}")
+    
+    def generate_structured_report(self, output_dir='eda_report', use_cache=True, **options):
+        """
+        JSON + 정적 HTML 보고서 생성. 컬럼별 내용 해시를 output_dir에 캐시해 두고
+        다음 실행에서는 내용이 바뀐 컬럼만 다시 계산합니다.
+        
+        Args:
+            output_dir (str): report.json, report.html, column_cache.json 저장 폴더
+            use_cache (bool): 컬럼 통계 캐시 사용 여부
+            **options: build_report 옵션 (top_k, threshold, sample_size)
+        """
+        cache = ColumnReportCache(os.path.join(output_dir, 'column_cache.json') if use_cache else None)
+        report = build_report(self.df, cache=cache, **options)
+        json_path, html_path = write_report(report, output_dir)
+        print(f"Report generated: {json_path}, {html_path} ({len(report['recomputed'])}/{report['n_columns']} columns recomputed)")
+        return report
\ No newline at end of file
@@ -0,0 +1,38 @@
+import hashlib
+
+import pandas as pd
+
+
+def column_fingerprint(series):
+    """컬럼 하나의 내용 해시 (컬럼명, dtype, 인덱스, 값 기준)"""
+    hashed = pd.util.hash_pandas_object(series, index=True).to_numpy()
+    digest = hashlib.sha1(f'{series.name}|{series.dtype}|'.encode())
+    digest.update(hashed.tobytes())
+    return digest.hexdigest()
+
+
+def column_buffers(df):
+    """
+    컬럼별 값 배열 식별자 (값은 읽지 않으므로 컬럼 수에만 비례).
+    컬럼에 새 배열을 대입하면 달라지지만, 같은 배열 안의 값을 제자리에서 고치면(df.loc[i, col] = v) 그대로입니다.
+    """
+    buffers = []
+    for _, series in df.items():
+        if isinstance(series.dtype, pd.api.extensions.ExtensionDtype):
+            buffers.append(id(series.array))
+        else:
+            buffers.append(series.values.__array_interface__['data'][0])
+    return tuple(buffers)
+
+
+def column_fingerprints(df):
+    """컬럼별 내용 해시 딕셔너리"""
+    return {col: column_fingerprint(df[col]) for col in df.columns}
+
+
+def frame_fingerprint(df):
+    """데이터프레임 전체 내용 해시 (값이 바뀌면 달라짐)"""
+    digest = hashlib.sha1(f'{df.shape}|'.encode())
+    for fingerprint in column_fingerprints(df).values():
+        digest.update(fingerprint.encode())
+    return digest.hexdigest()
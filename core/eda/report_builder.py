@@ -0,0 +1,162 @@
+import hashlib
+import html
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+
+from .column_profile import ColumnProfile
+from .fingerprint import column_fingerprint
+from ..preprocessor.outlier_engine import detect_outliers, iqr_bounds
+
+# 통계 계산 방식이 바뀌면 올려서 이전 캐시를 무효화
+REPORT_VERSION = 1
+
+
+def _json_value(value):
+    """numpy 스칼라/NaN을 JSON 값으로 변환"""
+    if isinstance(value, (np.integer, np.bool_)):
+        return value.item()
+    if isinstance(value, (float, np.floating)):
+        return None if np.isnan(value) else float(value)
+    return value
+
+
+def column_report(series, top_k=10, threshold=1.5, sample_size=5):
+    """컬럼 하나의 통계 (JSON 직렬화 가능한 dict)"""
+    frame = series.to_frame()
+    profile = ColumnProfile(frame, top_k=top_k)
+    col = series.name
+    missing = int(profile.nulls[col])
+    stats = {
+        'dtype': str(series.dtype),
+        'count': int(profile.counts[col]),
+        'missing': missing,
+        'missing_pct': missing / len(series) * 100 if len(series) else 0.0,
+    }
+    if col in profile.numeric.index:
+        stats.update({key: _json_value(value) for key, value in profile.numeric.loc[col].items() if key != 'count'})
+        bounds = iqr_bounds(frame, [col], threshold=threshold, quartiles=(profile.quantile(0.25), profile.quantile(0.75)))
+        outliers = detect_outliers(frame, [col], bounds=bounds, sample_size=sample_size)
+        stats['outliers'] = {
+            'count': int(outliers.counts[col]),
+            'lower': _json_value(bounds.loc[col, 'lower']),
+            'upper': _json_value(bounds.loc[col, 'upper']),
+            'sample': [_json_value(value) for value in outliers.samples[col]],
+        }
+    else:
+        stats['unique'] = int(profile.unique[col])
+        stats['top_values'] = {str(value): int(count) for value, count in profile.top_values[col].items()}
+    return stats
+
+
+class ColumnReportCache:
+    """컬럼 내용 해시 -> 컬럼 통계 JSON 캐시 (파일 경로가 없으면 메모리에만 보관)"""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.entries = {}
+        if path and os.path.exists(path):
+            with open(path) as f:
+                self.entries = json.load(f)
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def save(self, keys):
+        """이번 보고서에 쓰인 항목만 남겨 저장 (캐시 크기가 컬럼 수를 넘지 않음)"""
+        self.entries = {key: self.entries[key] for key in keys if key in self.entries}
+        if self.path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, 'w') as f:
+                json.dump(self.entries, f)
+
+
+def build_report(df, cache=None, top_k=10, threshold=1.5, sample_size=5):
+    """
+    컬럼별 통계 보고서 생성. 컬럼 내용 해시가 캐시에 있으면 재사용하고 바뀐 컬럼만 다시 계산합니다.
+
+    Args:
+        df (pd.DataFrame): 데이터프레임
+        cache (ColumnReportCache, optional): 컬럼 통계 캐시 (없으면 모두 계산)
+        top_k (int): 범주형 컬럼의 상위 빈도 개수
+        threshold (float): IQR 이상치 기준 배수
+        sample_size (int): 컬럼당 보관할 이상치 표본 개수
+
+    Returns:
+        dict: {'generated_at', 'n_rows', 'n_columns', 'columns', 'recomputed'}
+    """
+    cache = ColumnReportCache() if cache is None else cache
+    options = hashlib.sha1(json.dumps([REPORT_VERSION, top_k, threshold, sample_size]).encode()).hexdigest()[:12]
+    columns, recomputed, keys = {}, [], []
+    for col in df.columns:
+        key = f'{column_fingerprint(df[col])}:{options}'
+        stats = cache.get(key)
+        if stats is None:
+            stats = column_report(df[col], top_k=top_k, threshold=threshold, sample_size=sample_size)
+            cache.entries[key] = stats
+            recomputed.append(str(col))
+        columns[str(col)] = stats
+        keys.append(key)
+    cache.save(keys)
+    return {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'n_rows': len(df),
+        'n_columns': len(df.columns),
+        'columns': columns,
+        'recomputed': recomputed,
+    }
+
+
+def _format(value):
+    if value is None:
+        return ''
+    if isinstance(value, float):
+        return f'{value:.4g}'
+    return html.escape(str(value))
+
+
+def report_html(report):
+    """보고서 dict를 정적 HTML 한 페이지로 변환"""
+    numeric = {col: stats for col, stats in report['columns'].items() if 'mean' in stats}
+    categorical = {col: stats for col, stats in report['columns'].items() if 'mean' not in stats}
+    numeric_keys = ['dtype', 'count', 'missing_pct', 'mean', 'std', 'min', '25%', '50%', '75%', 'max', 'skew', 'kurtosis']
+    parts = [
+        '<!DOCTYPE html><html><head><meta charset="utf-8"><title>EDA Report</title>',
+        '<style>body{font-family:sans-serif;margin:2em}table{border-collapse:collapse;font-size:13px}'
+        'th,td{border:1px solid #ccc;padding:4px 8px;text-align:right}th:first-child,td:first-child{text-align:left}</style>',
+        '</head><body><h1>EDA Report</h1>',
+        f"<p>Generated {_format(report['generated_at'])} &middot; {report['n_rows']} rows &times; {report['n_columns']} columns"
+        f" &middot; {len(report['recomputed'])} columns recomputed</p>",
+    ]
+    if numeric:
+        parts.append('<h2>Numeric Columns</h2><table><tr><th>column</th>')
+        parts.extend(f'<th>{html.escape(key)}</th>' for key in numeric_keys + ['outliers'])
+        parts.append('</tr>')
+        for col, stats in numeric.items():
+            cells = [_format(stats.get(key)) for key in numeric_keys] + [_format(stats['outliers']['count'])]
+            parts.append(f'<tr><td>{html.escape(col)}</td>' + ''.join(f'<td>{cell}</td>' for cell in cells) + '</tr>')
+        parts.append('</table>')
+    if categorical:
+        parts.append('<h2>Categorical Columns</h2><table><tr><th>column</th><th>dtype</th><th>count</th>'
+                     '<th>missing_pct</th><th>unique</th><th>top values</th></tr>')
+        for col, stats in categorical.items():
+            top = ', '.join(f'{html.escape(value)} ({count})' for value, count in stats.get('top_values', {}).items())
+            cells = [_format(stats['dtype']), _format(stats['count']), _format(stats['missing_pct']), _format(stats.get('unique')), top]
+            parts.append(f'<tr><td>{html.escape(col)}</td>' + ''.join(f'<td>{cell}</td>' for cell in cells) + '</tr>')
+        parts.append('</table>')
+    parts.append('</body></html>')
+    return '\n'.join(parts)
+
+
+def write_report(report, output_dir):
+    """report.json / report.html 저장 후 경로 반환"""
+    os.makedirs(output_dir, exist_ok=True)
+    json_path = os.path.join(output_dir, 'report.json')
+    html_path = os.path.join(output_dir, 'report.html')
+    with open(json_path, 'w') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    with open(html_path, 'w', encoding='utf-8') as f:
+        f.write(report_html(report))
+    return json_path, html_path
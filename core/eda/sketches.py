@@ -0,0 +1,131 @@
+import numpy as np
+import pandas as pd
+
+
+class KLLSketch:
+    """
+    KLL 분위수 스케치: 메모리 O(k), 병합 가능.
+    rank_error는 분위수 순위 오차(단측) 추정치로, k=200이면 약 1.7%입니다.
+    """
+
+    def __init__(self, k=200, seed=None):
+        self.k = k
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def rank_error(self):
+        return 2.296 / self.k ** 0.9723
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        """용량을 넘은 레벨을 정렬 후 절반(무작위 홀/짝)만 다음 레벨로 올림 (가중치 2배)"""
+        compacted = True
+        while compacted:
+            compacted = False
+            for level in range(len(self.levels)):
+                items = self.levels[level]
+                if items.size <= self._capacity(level):
+                    continue
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                leftover = items[-1:] if items.size % 2 else items[:0]
+                items = items[:items.size - leftover.size]
+                promoted = items[self._rng.integers(2)::2]
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+                self.levels[level] = leftover
+                compacted = True
+
+    def update(self, values):
+        values = np.asarray(values, dtype='float64').ravel()
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return self
+        self.count += values.size
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """다른 청크/파티션의 스케치 병합"""
+        self.k = min(self.k, other.k)
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compress()
+        return self
+
+    def quantile(self, q):
+        """근사 분위수 (q는 스칼라 또는 배열)"""
+        q = np.asarray(q, dtype='float64')
+        if self.count == 0:
+            return np.full(q.shape, np.nan) if q.ndim else np.nan
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(level.size, 2.0 ** h) for h, level in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        items, cumulative = items[order], np.cumsum(weights[order])
+        positions = np.clip(np.searchsorted(cumulative, q * cumulative[-1], side='left'), 0, items.size - 1)
+        result = np.where(q <= 0, self.min, np.where(q >= 1, self.max, items[positions]))
+        return result if q.ndim else float(result)
+
+
+def _bit_length(values):
+    """uint64 배열의 비트 길이 (float 변환 오차가 없도록 상/하위 32비트로 나눠 계산)"""
+    high = (values >> np.uint64(32)).astype('float64')
+    low = (values & np.uint64(0xFFFFFFFF)).astype('float64')
+    return np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
+
+
+class HyperLogLog:
+    """HyperLogLog 고유값 개수 스케치: 상대 오차 약 1.04/sqrt(2^p), 레지스터 최댓값으로 병합"""
+
+    def __init__(self, error=0.01, p=None):
+        if p is None:
+            p = int(np.clip(np.ceil(np.log2((1.04 / error) ** 2)), 4, 18))
+        self.p = p
+        self.m = 1 << p
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    @property
+    def relative_error(self):
+        return 1.04 / np.sqrt(self.m)
+
+    def update(self, values):
+        values = pd.Series(values).dropna().to_numpy()
+        if values.size == 0:
+            return self
+        hashed = pd.util.hash_array(values)
+        width = 64 - self.p
+        index = (hashed >> np.uint64(width)).astype(np.intp)
+        rest = hashed & np.uint64((1 << width) - 1)
+        rank = (width - _bit_length(rest) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+        return self
+
+    def merge(self, other):
+        if other.p != self.p:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision.")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def cardinality(self):
+        m = self.m
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+        estimate = alpha * m * m / np.sum(2.0 ** -self.registers.astype('float64'))
+        zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * np.log(m / zeros)
+        return estimate
@@ -1,21 +1,51 @@
 import pandas as pd
-from sklearn.preprocessing import LabelEncoder, OneHotEncoder
+
+from .one_hot_encoder import BatchOneHotEncoder
 
 
 class FeatureEngineer:
     def __init__(self, df):
         self.df = df
+        self.encoder = None
     
     def encode_labels(self, column):
         """레이블 인코딩 (문자형 컬럼에 대해서만)"""
+        from sklearn.preprocessing import LabelEncoder
+        
         le = LabelEncoder()
         self.df[column] = le.fit_transform(self.df[column])
         return self.df
     
     def one_hot_encode(self, column):
         """원-핫 인코딩"""
-        ohe = OneHotEncoder(drop='first', sparse=False)
-        encoded = ohe.fit_transform(self.df[[column]])
-        encoded_df = pd.DataFrame(encoded, columns=ohe.get_feature_names_out([column]))
+        encoder = BatchOneHotEncoder(drop_first=True)
+        encoded = encoder.fit_transform(self.df, [column])
+        encoded_df = pd.DataFrame(encoded.toarray(), columns=encoder.feature_names_, index=self.df.index)
         self.df = pd.concat([self.df, encoded_df], axis=1).drop(column, axis=1)
         return self.df
+    
+    def one_hot_encode_many(self, columns, output='pandas', drop_first=True):
+        """
+        여러 컬럼 원-핫 인코딩을 한 번에 수행 (희소 출력).
+
+        Args:
+            columns (list): 인코딩할 컬럼 목록
+            output (str): 'pandas'면 희소 컬럼으로 self.df에 붙여 반환, 'csr'이면 SciPy CSR 행렬만 반환
+            drop_first (bool): 각 컬럼의 첫 범주 제거 여부
+        """
+        self.encoder = BatchOneHotEncoder(drop_first=drop_first).fit(self.df, columns)
+        if output == 'csr':
+            return self.encoder.transform(self.df)
+        if output != 'pandas':
+            raise ValueError("Invalid output. Choose 'pandas' or 'csr'.")
+        encoded_df = self.encoder.transform_frame(self.df)
+        self.df = pd.concat([self.df.drop(columns, axis=1), encoded_df], axis=1)
+        return self.df
+    
+    def transform_one_hot(self, df, output='pandas'):
+        """학습된 범주로 새 데이터 인코딩 (처음 보는 값은 모두 0)"""
+        if self.encoder is None:
+            raise ValueError("Call one_hot_encode_many before transform_one_hot.")
+        if output == 'csr':
+            return self.encoder.transform(df)
+        return pd.concat([df.drop(self.encoder.columns, axis=1), self.encoder.transform_frame(df)], axis=1)
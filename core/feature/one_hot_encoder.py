@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+class BatchOneHotEncoder:
+    """
+    여러 컬럼을 한 번에 원-핫 인코딩 (희소 행렬 직접 생성).
+    학습된 범주를 보관해 새 데이터에도 같은 컬럼 구성으로 변환하며, 처음 보는 값/결측치는 모두 0으로 처리합니다.
+    """
+
+    def __init__(self, drop_first=True, dtype=np.uint8):
+        self.drop_first = drop_first
+        self.dtype = dtype
+        self.columns = []
+        self.categories_ = {}
+        self.feature_names_ = []
+
+    def fit(self, df, columns):
+        self.columns = list(columns)
+        self.categories_ = {col: pd.Categorical(df[col]).categories for col in self.columns}
+        self.feature_names_ = [
+            f'{col}_{category}'
+            for col in self.columns
+            for category in self.categories_[col][1 if self.drop_first else 0:]
+        ]
+        return self
+
+    def transform(self, df):
+        """CSR 희소 행렬 반환 (행 순서는 df와 동일)"""
+        n_rows = len(df)
+        offset = 1 if self.drop_first else 0
+        rows, cols = [], []
+        start = 0
+        for col in self.columns:
+            categories = self.categories_[col]
+            codes = pd.Categorical(df[col], categories=categories).codes.astype(np.int64) - offset
+            valid = codes >= 0
+            rows.append(np.flatnonzero(valid))
+            cols.append(codes[valid] + start)
+            start += len(categories) - offset
+        rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+        cols = np.concatenate(cols) if cols else np.empty(0, dtype=np.int64)
+        data = np.ones(len(rows), dtype=self.dtype)
+        return sparse.csr_matrix((data, (rows, cols)), shape=(n_rows, start))
+
+    def fit_transform(self, df, columns):
+        return self.fit(df, columns).transform(df)
+
+    def transform_frame(self, df):
+        """pandas 희소 컬럼(SparseDtype)으로 반환, df의 인덱스 유지"""
+        return pd.DataFrame.sparse.from_spmatrix(self.transform(df), index=df.index, columns=self.feature_names_)
@@ -0,0 +1,267 @@
+"""
+여러 데이터셋에 DataAnalysisPipeline을 프로세스 풀로 일괄 실행.
+
+    python -m core.model.batch_runner 01-Kaggle batch_output --pattern '**/data/train.csv' --n-jobs 8
+"""
+import argparse
+import contextlib
+import glob
+import json
+import os
+import shutil
+import time
+import traceback
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+
+import pandas as pd
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:  # threadpoolctl이 없으면 BLAS 스레드 수를 제한하지 않음
+    threadpool_limits = None
+
+DEFAULT_PATTERNS = ('**/data/*.csv', '**/data/*.parquet')
+RESULTS_FILE = 'results.jsonl'
+
+
+def find_datasets(root, patterns=DEFAULT_PATTERNS):
+    """
+    root 아래에서 패턴에 맞는 데이터 파일 목록 (예: 01-Kaggle/01-titanic/data/train.csv).
+
+    Returns:
+        pd.DataFrame: name(root 기준 상대 경로, 확장자 포함이라 train.csv와 train.parquet은 결과 폴더가 다름), path, bytes. 큰 파일부터 정렬
+    """
+    if isinstance(patterns, str):
+        patterns = [patterns]
+    paths = sorted({path for pattern in patterns for path in glob.glob(os.path.join(root, pattern), recursive=True) if os.path.isfile(path)})
+    datasets = pd.DataFrame({
+        'name': [os.path.relpath(path, root) for path in paths],
+        'path': paths,
+        'bytes': [os.path.getsize(path) for path in paths],
+    })
+    # 큰 데이터셋을 먼저 시작해야 마지막에 큰 작업 하나만 남아 코어가 노는 시간이 줄어듦
+    return datasets.sort_values('bytes', ascending=False, kind='stable', ignore_index=True)
+
+
+def _read_frame(path):
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+    if path.endswith('.feather'):
+        return pd.read_feather(path)
+    return pd.read_csv(path)
+
+
+def _init_worker():
+    # 프로세스마다 BLAS 스레드를 1개로 제한 (코어 수만큼 프로세스를 띄울 때 스레드 과다 생성 방지)
+    if threadpool_limits is not None:
+        threadpool_limits(1)
+
+
+def _write_processed(df, dataset_dir):
+    """전처리 결과 저장 (Parquet으로 저장할 수 없는 타입이 섞여 있으면 CSV)"""
+    path = os.path.join(dataset_dir, 'processed.parquet')
+    try:
+        df.to_parquet(path)
+    except (ValueError, TypeError):
+        if os.path.exists(path):
+            os.remove(path)
+        path = os.path.join(dataset_dir, 'processed.csv')
+        df.to_csv(path)
+    return path
+
+
+def _run_dataset(name, path, output_dir, run_kwargs, cache_dir):
+    """워커에서 데이터셋 하나 실행. 결과는 임시 폴더에 쓴 뒤 한 번에 교체하고, 예외는 결과 레코드로 돌려줌"""
+    from .data_analysis_pipeline import DataAnalysisPipeline
+
+    final_dir = os.path.join(output_dir, name)
+    tmp_dir = f'{final_dir}.tmp-{os.getpid()}'
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    record = {'name': name, 'path': path, 'status': 'failed', 'rows': None, 'cols': None, 'rows_out': None, 'cols_out': None,
+              'read_s': None, 'pipeline_s': None, 'seconds': None, 'error': None, 'pid': os.getpid()}
+    start = time.perf_counter()
+    try:
+        with open(os.path.join(tmp_dir, 'log.txt'), 'w', encoding='utf-8') as log, contextlib.redirect_stdout(log):
+            df = _read_frame(path)
+            record['rows'], record['cols'] = df.shape
+            record['read_s'] = time.perf_counter() - start
+            pipeline = DataAnalysisPipeline(df, cache_dir=cache_dir, n_jobs=1)
+            pipeline_start = time.perf_counter()
+            processed = pipeline.run_pipeline(**run_kwargs)
+            record['pipeline_s'] = time.perf_counter() - pipeline_start
+        record['rows_out'], record['cols_out'] = processed.shape
+        record['output'] = _write_processed(processed, tmp_dir)
+        pipeline.preprocessor.plan.save(os.path.join(tmp_dir, 'plan.json'))
+        pipeline.profile.to_json(os.path.join(tmp_dir, 'profile.json'))
+        record['status'] = 'ok'
+    except Exception as exc:
+        record['error'] = f'{type(exc).__name__}: {exc}'
+        with open(os.path.join(tmp_dir, 'error.txt'), 'w', encoding='utf-8') as f:
+            f.write(traceback.format_exc())
+    record['seconds'] = time.perf_counter() - start
+    with open(os.path.join(tmp_dir, 'result.json'), 'w', encoding='utf-8') as f:
+        json.dump(record, f, ensure_ascii=False, indent=2, default=str)
+
+    shutil.rmtree(final_dir, ignore_errors=True)
+    os.makedirs(os.path.dirname(final_dir), exist_ok=True)
+    os.replace(tmp_dir, final_dir)
+    if 'output' in record:
+        record['output'] = os.path.join(final_dir, os.path.basename(record['output']))
+    return record
+
+
+def _run_alone(name, path, output_dir, run_kwargs, cache_dir):
+    """워커 1개짜리 풀에서 데이터셋 하나 실행 (워커가 죽으면 그 데이터셋의 실패 레코드 반환)"""
+    try:
+        with ProcessPoolExecutor(max_workers=1, initializer=_init_worker) as executor:
+            return executor.submit(_run_dataset, name, path, output_dir, run_kwargs, cache_dir).result()
+    except BrokenProcessPool as exc:
+        _remove_stale(output_dir, name)
+        return {'name': name, 'path': path, 'status': 'failed', 'seconds': None, 'error': f'{type(exc).__name__}: {exc}'}
+
+
+def _remove_stale(output_dir, name=None):
+    """죽은 워커가 남긴 임시 결과 폴더(<name>.tmp-<pid>) 삭제 (name이 없으면 output_dir 전체)"""
+    pattern = os.path.join(glob.escape(output_dir), glob.escape(name) + '.tmp-*' if name else os.path.join('**', '*.tmp-*'))
+    for tmp_dir in glob.glob(pattern, recursive=True):
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def _completed(output_dir, name):
+    """이전 실행에서 성공한 데이터셋인지 (결과 폴더는 다 쓴 뒤 교체되므로 result.json이 있으면 완성본)"""
+    try:
+        with open(os.path.join(output_dir, name, 'result.json'), encoding='utf-8') as f:
+            return json.load(f).get('status') == 'ok'
+    except (FileNotFoundError, json.JSONDecodeError):
+        return False
+
+
+def run_batch(root, output_dir, patterns=DEFAULT_PATTERNS, n_jobs=None, retries=1, skip_completed=True, cache_dir=None, verbose=True, **run_kwargs):
+    """
+    root 아래 데이터셋마다 DataAnalysisPipeline.run_pipeline을 프로세스 풀에서 실행.
+    각 워커가 파일을 직접 읽고 결과를 output_dir/<name>/에 쓰므로 부모 프로세스로는 작은 레코드만 돌아오고,
+    끝난 데이터셋은 바로 output_dir/results.jsonl에 한 줄씩 기록됩니다.
+
+    Args:
+        root (str): 데이터셋 루트 폴더
+        output_dir (str): 결과 폴더 (데이터셋별 processed.parquet/plan.json/profile.json/log.txt/result.json)
+        patterns (tuple): root 기준 glob 패턴 (기본: '**/data/*.csv', '**/data/*.parquet')
+        n_jobs (int, optional): 워커 프로세스 수 (기본: CPU 수와 데이터셋 수 중 작은 값)
+        retries (int): 실패한 데이터셋 재시도 횟수 (워커 프로세스가 죽으면 실행 중이던 데이터셋을 하나씩 단독으로 다시 실행해 다시 죽는 데이터셋만 1회 실패로 계산)
+        skip_completed (bool): 이전 실행에서 성공한 데이터셋은 건너뜀
+        cache_dir (str, optional): 단계 결과 디스크 캐시 폴더 (워커들이 공유)
+        **run_kwargs: run_pipeline 인자 (missing_strategy, scale_type, drop_columns 등)
+
+    Returns:
+        pd.DataFrame: 데이터셋별 상태, 시도 횟수, 읽기/파이프라인/전체 시간, 오류
+    """
+    datasets = find_datasets(root, patterns)
+    os.makedirs(output_dir, exist_ok=True)
+    _remove_stale(output_dir)
+    results_path = os.path.join(output_dir, RESULTS_FILE)
+    records = []
+
+    pending = deque()
+    for name, path in zip(datasets['name'], datasets['path']):
+        if skip_completed and _completed(output_dir, name):
+            records.append({'name': name, 'path': path, 'status': 'skipped', 'attempts': 0})
+        else:
+            pending.append((name, path, 1))
+    if not pending:
+        if verbose:
+            print(f"✅ [Batch] Nothing to run ({len(records)} datasets already completed)")
+        return pd.DataFrame(records)
+
+    n_jobs = n_jobs or min(len(pending), os.cpu_count() or 1)
+    started = time.perf_counter()
+
+    def finish(record, attempt):
+        record['attempts'] = attempt
+        records.append(record)
+        with open(results_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+        if verbose:
+            if record['status'] == 'ok':
+                print(f"✅ [Batch] {record['name']} {record['seconds']:.2f}s ({len(records)}/{len(datasets)})")
+            else:
+                print(f"❌ [Batch] {record['name']} failed after {attempt} attempt(s): {record['error']}")
+
+    def handle(record, name, path, attempt):
+        if record['status'] != 'ok' and attempt <= retries:
+            pending.append((name, path, attempt + 1))
+        else:
+            finish(record, attempt)
+
+    while pending:
+        running = {}
+        try:
+            with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker) as executor:
+                while pending or running:
+                    # 제출 개수를 워커 수의 2배로 제한 (작업 목록이 길어도 대기 큐가 커지지 않음)
+                    while pending and len(running) < n_jobs * 2:
+                        name, path, attempt = pending.popleft()
+                        future = executor.submit(_run_dataset, name, path, output_dir, run_kwargs, cache_dir)
+                        running[future] = (name, path, attempt)
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        record = future.result()
+                        handle(record, *running.pop(future))
+        except BrokenProcessPool:
+            # 워커가 비정상 종료됨 (메모리 부족 등): 이미 끝난 결과는 그대로 받고,
+            # 실행 중이던 데이터셋은 누가 원인인지 모르므로 하나씩 단독 풀에서 다시 실행해 원인만 실패로 계산
+            suspects = []
+            for future, (name, path, attempt) in running.items():
+                if future.done() and not future.cancelled() and future.exception() is None:
+                    handle(future.result(), name, path, attempt)
+                else:
+                    suspects.append((name, path, attempt))
+            for name, path, attempt in suspects:
+                _remove_stale(output_dir, name)
+                handle(_run_alone(name, path, output_dir, run_kwargs, cache_dir), name, path, attempt)
+
+    results = pd.DataFrame(records)
+    if verbose:
+        ok = (results['status'] == 'ok').sum()
+        failed = (results['status'] == 'failed').sum()
+        print(f"✅ [Batch] {ok} ok, {failed} failed, {len(results) - ok - failed} skipped in {time.perf_counter() - started:.1f}s -> {output_dir}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run DataAnalysisPipeline over every dataset under a directory tree.')
+    parser.add_argument('root')
+    parser.add_argument('output_dir')
+    parser.add_argument('--pattern', nargs='+', default=list(DEFAULT_PATTERNS), help="root 기준 glob 패턴 (예: '**/data/train.csv')")
+    parser.add_argument('--n-jobs', type=int, default=None)
+    parser.add_argument('--retries', type=int, default=1)
+    parser.add_argument('--rerun', action='store_true', help='이미 성공한 데이터셋도 다시 실행')
+    parser.add_argument('--cache-dir', default=None)
+    parser.add_argument('--missing-strategy', default='mean')
+    parser.add_argument('--scale-type', default='standard', help="'none'이면 스케일링 생략")
+    parser.add_argument('--drop-columns', nargs='+', default=None)
+    parser.add_argument('--optimize-memory', action='store_true')
+    args = parser.parse_args()
+    results = run_batch(
+        args.root,
+        args.output_dir,
+        patterns=args.pattern,
+        n_jobs=args.n_jobs,
+        retries=args.retries,
+        skip_completed=not args.rerun,
+        cache_dir=args.cache_dir,
+        missing_strategy=args.missing_strategy,
+        scale_type=None if args.scale_type == 'none' else args.scale_type,
+        drop_columns=args.drop_columns,
+        optimize_memory=args.optimize_memory,
+    )
+    if len(results):
+        results.to_csv(os.path.join(args.output_dir, f"summary_{datetime.now():%Y%m%d_%H%M%S}.csv"), index=False)
+    return int((results['status'] == 'failed').any()) if len(results) else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
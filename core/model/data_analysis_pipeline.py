@@ -1,27 +1,163 @@
-from data_preprocessor import DataPreprocessor
-from eda import EDA
-from model_trainer import ModelTrainer
+import json
+
+import numpy as np
+import pandas as pd
+
+from ..eda.eda_setup import EDA
+from ..eda.fingerprint import frame_fingerprint
+from ..preprocessor.data_preprocessor import DataPreprocessor
+from ..preprocessor.memory_optimizer import optimize_memory
+from ..preprocessor.transform_plan import TransformPlan
+from .pipeline_profiler import PipelineProfiler
+from .stage_cache import DEFAULT_MAX_BYTES, StageCache, stage_key
 
 
 class DataAnalysisPipeline:
-    def __init__(self, df):
+    def __init__(self, df, cache_dir=None, cache_max_bytes=DEFAULT_MAX_BYTES, cache_format='parquet', n_jobs=None):
+        """
+        Args:
+            df (pd.DataFrame): 데이터프레임
+            cache_dir (str, optional): 단계 결과 디스크 캐시 폴더. 지정하면 run_pipeline이 (입력 지문, 단계 파라미터)가
+                같은 단계를 다시 계산하지 않고, 입력 데이터프레임은 수정하지 않음
+            cache_max_bytes (int): 캐시 전체 크기 상한 (넘으면 오래 사용하지 않은 결과부터 삭제)
+            cache_format (str): 'parquet' 또는 'feather'
+            n_jobs (int, optional): 전처리 컬럼 단위 병렬 스레드 수 (여러 파이프라인을 프로세스로 나눠 돌릴 때는 1)
+        """
         self.df = df
         self.eda = EDA(df)
-        self.preprocessor = DataPreprocessor(df)
+        self.preprocessor = DataPreprocessor(df, n_jobs=n_jobs)
+        self.n_jobs = n_jobs
+        self.memory_report = None
+        self.profile = None
+        self.cache = StageCache(cache_dir, max_bytes=cache_max_bytes, format=cache_format) if cache_dir else None
+        self.cache_hits = {}
+        self._input = df
     
-    def run_pipeline(self, missing_strategy='mean', scale_type='standard', drop_columns=None, remove_outliers_cols=None):
+    def run_pipeline(self, missing_strategy='mean', scale_type='standard', drop_columns=None, remove_outliers_cols=None, optimize_memory=False, trace_memory=False):
+        """
+        EDA + 전처리 실행. 단계별 시간/CPU/메모리/행·열 수는 self.profile(PipelineProfiler)에 기록
+        (trace_memory=True면 tracemalloc 증가량/최대치까지 측정, 대신 느려짐)
+        """
+        self.profile = PipelineProfiler(trace_memory=trace_memory)
+        if self.cache is not None:
+            return self._run_cached(missing_strategy, scale_type, drop_columns, remove_outliers_cols, optimize_memory)
+        
+        # 메모리 최적화 (EDA와 전처리 모두 최적화된 데이터프레임 사용, 대체/스케일링이 수치형을 float64로 되돌리므로 결과에도 다시 적용)
+        if optimize_memory:
+            with self.profile.stage('optimize_memory', lambda: self.df):
+                self.optimize_memory()
+        
         # EDA
-        print(self.eda.summary())
+        with self.profile.stage('eda', lambda: self.df):
+            print(self.eda.summary())
         
         # 데이터 전처리
         self.df = self.preprocessor.preprocess(
             missing_strategy=missing_strategy, 
             scale_type=scale_type, 
             drop_columns=drop_columns, 
-            remove_outliers_cols=remove_outliers_cols
+            remove_outliers_cols=remove_outliers_cols,
+            optimize_memory=optimize_memory,
+            profiler=self.profile
         )
+        # 전처리기가 EDA와 공유하는 입력 데이터프레임을 제자리에서 고치므로 EDA 프로파일 무효화
+        self.eda.refresh_profile()
         
         # 추가 작업 (모델링 등)
         # 모델 학습, 평가 등의 작업을 진행
         
         return self.df
+    
+    def _stages(self, missing_strategy, scale_type, drop_columns, remove_outliers_cols):
+        """캐시 가능한 전처리 단계 (이름, 파라미터, 실행 함수). 키가 이전 단계 키에 이어지므로 바뀐 단계부터만 다시 계산"""
+        if isinstance(remove_outliers_cols, str):
+            remove_outliers_cols = [remove_outliers_cols]
+        
+        def impute(preprocessor):
+            preprocessor.clean_column_names()
+            preprocessor.handle_missing_values(strategy=missing_strategy)
+        
+        stages = [('handle_missing_values', {'strategy': missing_strategy}, impute)]
+        if remove_outliers_cols:
+            stages.append(('remove_outliers', {'cols': list(remove_outliers_cols)}, lambda p: p.remove_outliers(remove_outliers_cols)))
+        if scale_type:
+            stages.append(('scale_data', {'scaler_type': scale_type}, lambda p: p.scale_data(scaler_type=scale_type)))
+        if drop_columns:
+            stages.append(('drop_columns', {'columns': list(drop_columns)}, lambda p: p.drop_columns(drop_columns)))
+        return stages
+    
+    def _run_cached(self, missing_strategy, scale_type, drop_columns, remove_outliers_cols, optimize_memory):
+        """
+        단계 결과를 (입력 지문 → 단계별 파라미터) 체인 키로 캐시하며 실행.
+        캐시된 가장 마지막 단계의 결과/학습 상태만 읽고 그 다음 단계부터 계산합니다.
+        """
+        self.df = self._input
+        self.eda.df = self.df
+        self.cache_hits = {}
+        if optimize_memory:
+            with self.profile.stage('optimize_memory', lambda: self.df):
+                self.optimize_memory()
+        
+        with self.profile.stage('fingerprint', lambda: self.df):
+            root = frame_fingerprint(self.df)
+        
+        # EDA 요약은 입력에만 의존
+        with self.profile.stage('eda', lambda: self.df):
+            print(self._cached_summary(stage_key('eda', root)))
+        
+        stages = self._stages(missing_strategy, scale_type, drop_columns, remove_outliers_cols)
+        keys, parent = [], root
+        for name, params, _ in stages:
+            parent = stage_key(name, parent, params)
+            keys.append(parent)
+        
+        self.cache_hits.update({name: False for name, _, _ in stages})
+        start, preprocessor = 0, None
+        for i in reversed(range(len(stages))):
+            entry = self.cache.get(keys[i])
+            if entry is not None:
+                df, state = entry
+                preprocessor = DataPreprocessor.from_plan(df, TransformPlan.from_dict(state['plan']), n_jobs=self.n_jobs)
+                start = i + 1
+                for name, _, _ in stages[:start]:
+                    self.cache_hits[name] = True
+                break
+        if preprocessor is None:
+            # 입력은 그대로 두고 복사본에서 계산 (같은 입력으로 다시 실행해도 캐시 키가 유지됨)
+            preprocessor = DataPreprocessor(self.df, copy=True, n_jobs=self.n_jobs)
+        
+        done = {name for name, _, _ in stages[:start]}
+        for (name, _, run), key in zip(stages[start:], keys[start:]):
+            with self.profile.stage(name, lambda: preprocessor.df):
+                run(preprocessor)
+            done.add(name)
+            plan = preprocessor.fitted_plan(outliers='remove_outliers' in done, scaled='scale_data' in done, drop_columns=drop_columns if 'drop_columns' in done else None)
+            self.cache.put(key, preprocessor.df, {'stage': name, 'plan': plan.to_dict()})
+        
+        if optimize_memory:
+            # 결과 최적화는 캐시하지 않음 (캐시에는 단계 결과 그대로 저장)
+            with self.profile.stage('optimize_output', lambda: preprocessor.df):
+                preprocessor.optimize_memory()
+        preprocessor.plan = preprocessor.fitted_plan(outliers=bool(remove_outliers_cols), scaled=bool(scale_type), drop_columns=drop_columns)
+        self.preprocessor = preprocessor
+        self.df = preprocessor.df
+        return self.df
+    
+    def _cached_summary(self, key):
+        """EDA 요약 (describe 결과는 타입이 섞여 있어 JSON 상태로 저장)"""
+        entry = self.cache.get(key)
+        self.cache_hits['eda'] = entry is not None
+        if entry is not None:
+            table = entry[1]['summary']
+            return pd.DataFrame(table['data'], index=table['index'], columns=table['columns']).fillna(np.nan)
+        summary = self.eda.summary()
+        self.cache.put(key, state={'stage': 'eda', 'summary': json.loads(summary.to_json(orient='split'))})
+        return summary
+    
+    def optimize_memory(self, category_threshold=0.5):
+        """dtype downcast/category 변환 후 EDA와 전처리기가 같은 데이터프레임을 보도록 갱신"""
+        self.df, self.memory_report = optimize_memory(self.df, category_threshold=category_threshold)
+        self.eda.df = self.df
+        self.preprocessor.df = self.df
+        print(f"Memory: {self.memory_report['bytes_before'].sum():,} -> {self.memory_report['bytes_after'].sum():,} bytes")
+        return self.memory_report
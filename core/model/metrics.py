@@ -0,0 +1,166 @@
+import numpy as np
+import pandas as pd
+
+AVERAGES = ('binary', 'micro', 'macro', 'weighted')
+
+
+def _divide(numerator, denominator):
+    """0으로 나누면 0 (sklearn의 zero_division=0과 같음)"""
+    numerator = np.asarray(numerator, dtype='float64')
+    denominator = np.asarray(denominator, dtype='float64')
+    return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator != 0)
+
+
+def encode_labels(y_true, y_pred, labels=None):
+    """두 라벨 배열을 정렬된 공통 라벨의 정수 코드로 변환 (해시 한 번, 정렬은 고유 라벨에만)"""
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
+    codes, uniques = pd.factorize(np.concatenate([y_true, y_pred]), sort=True)
+    if labels is not None:
+        labels = np.asarray(labels)
+        mapped = pd.Index(labels).get_indexer(np.asarray(uniques))
+        codes = np.where(codes >= 0, mapped[np.maximum(codes, 0)], -1)
+        uniques = labels
+    return codes[:len(y_true)], codes[len(y_true):], np.asarray(uniques)
+
+
+def confusion_counts(y_true, y_pred, labels=None):
+    """
+    bincount 한 번으로 혼동 행렬 계산 (행: 실제, 열: 예측).
+
+    Returns:
+        (np.ndarray, np.ndarray): 혼동 행렬, 라벨 순서
+    """
+    true_codes, pred_codes, labels = encode_labels(y_true, y_pred, labels)
+    k = len(labels)
+    valid = (true_codes >= 0) & (pred_codes >= 0)
+    cm = np.bincount(true_codes[valid] * k + pred_codes[valid], minlength=k * k).reshape(k, k)
+    return cm, labels
+
+
+class ConfusionAccumulator:
+    """배치별 혼동 행렬을 누적/병합 (배치마다 나타나는 라벨이 달라도 라벨 합집합 기준으로 더함)"""
+
+    def __init__(self, labels=None):
+        self.fixed = labels is not None
+        self.labels = np.asarray(labels) if self.fixed else None
+        self.cm = np.zeros((len(self.labels), len(self.labels)), dtype=np.int64) if self.fixed else None
+        self.count = 0
+
+    def update(self, y_true, y_pred):
+        cm, labels = confusion_counts(y_true, y_pred, labels=self.labels if self.fixed else None)
+        self.count += len(y_true)
+        return self._add(cm, labels)
+
+    def merge(self, other):
+        if other.cm is not None:
+            self.count += other.count
+            self._add(other.cm, other.labels)
+        return self
+
+    def _add(self, cm, labels):
+        if self.cm is None:
+            self.cm, self.labels = cm.astype(np.int64), labels
+            return self
+        if self.fixed or np.array_equal(self.labels, labels):
+            self.cm += cm
+            return self
+        union = np.union1d(self.labels, labels)
+        merged = np.zeros((len(union), len(union)), dtype=np.int64)
+        old, new = np.searchsorted(union, self.labels), np.searchsorted(union, labels)
+        merged[np.ix_(old, old)] += self.cm
+        merged[np.ix_(new, new)] += cm
+        self.cm, self.labels = merged, union
+        return self
+
+
+def per_class_metrics(cm, labels):
+    """혼동 행렬에서 클래스별 precision/recall/f1/support"""
+    tp = np.diag(cm)
+    precision = _divide(tp, cm.sum(axis=0))
+    recall = _divide(tp, cm.sum(axis=1))
+    return pd.DataFrame({
+        'precision': precision,
+        'recall': recall,
+        'f1': _divide(2 * precision * recall, precision + recall),
+        'support': cm.sum(axis=1),
+    }, index=pd.Index(labels, name='label'))
+
+
+def metrics_from_confusion(cm, labels, average='binary', pos_label=None):
+    """
+    혼동 행렬 하나에서 accuracy/precision/recall/f1 계산 (데이터를 다시 읽지 않음).
+
+    Args:
+        average (str): 'binary' (pos_label 클래스 기준), 'micro', 'macro', 'weighted'
+        pos_label (optional): 이진 분류의 양성 라벨 (기본: 1이 있으면 1, 없으면 마지막 라벨)
+    """
+    if average not in AVERAGES:
+        raise ValueError("Invalid average. Choose 'binary', 'micro', 'macro' or 'weighted'.")
+    total = cm.sum()
+    result = {'accuracy': float(_divide(np.trace(cm), total))}
+    f1 = None
+    if average == 'binary':
+        if len(labels) > 2:
+            raise ValueError("Target is multiclass but average='binary'. Choose 'micro', 'macro' or 'weighted'.")
+        if pos_label is None:
+            pos_label = 1 if 1 in labels.tolist() else labels[-1]
+        position = np.flatnonzero(labels == pos_label)
+        tp = cm[position[0], position[0]] if len(position) else 0
+        precision = float(_divide(tp, cm[:, position].sum()))
+        recall = float(_divide(tp, cm[position].sum()))
+    elif average == 'micro':
+        # 단일 라벨 분류에서 micro 평균은 accuracy와 같음
+        precision = recall = result['accuracy']
+    else:
+        per_class = per_class_metrics(cm, labels)
+        weights = per_class['support'].to_numpy() if average == 'weighted' else np.ones(len(per_class))
+        precision = float(_divide((per_class['precision'] * weights).sum(), weights.sum()))
+        recall = float(_divide((per_class['recall'] * weights).sum(), weights.sum()))
+        f1 = float(_divide((per_class['f1'] * weights).sum(), weights.sum()))
+    result['precision'] = precision
+    result['recall'] = recall
+    result['f1'] = float(_divide(2 * precision * recall, precision + recall)) if f1 is None else f1
+    return result
+
+
+def threshold_curves(y_true, scores, pos_label=1):
+    """
+    점수 정렬 한 번으로 모든 임계값의 TP/FP를 누적 합으로 계산 (ROC/PR 곡선).
+
+    Returns:
+        pd.DataFrame: 임계값(내림차순)별 tp, fp, fn, tn, tpr, fpr, precision, recall
+    """
+    y_true = np.asarray(y_true) == pos_label
+    scores = np.asarray(scores, dtype='float64')
+    order = np.argsort(-scores, kind='stable')
+    scores, y_true = scores[order], y_true[order]
+    # 같은 점수는 하나의 임계값으로 묶음 (각 점수 구간의 마지막 위치)
+    last = np.r_[np.flatnonzero(np.diff(scores)), len(scores) - 1]
+    tp = np.cumsum(y_true)[last]
+    fp = last + 1 - tp
+    positives, negatives = y_true.sum(), len(y_true) - y_true.sum()
+    return pd.DataFrame({
+        'threshold': scores[last],
+        'tp': tp,
+        'fp': fp,
+        'fn': positives - tp,
+        'tn': negatives - fp,
+        'tpr': _divide(tp, positives),
+        'fpr': _divide(fp, negatives),
+        'precision': _divide(tp, tp + fp),
+        'recall': _divide(tp, positives),
+    })
+
+
+def roc_auc(curves):
+    """threshold_curves 결과의 ROC 곡선 아래 면적 (사다리꼴)"""
+    fpr = np.r_[0.0, curves['fpr'].to_numpy()]
+    tpr = np.r_[0.0, curves['tpr'].to_numpy()]
+    return float(np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1]) / 2))
+
+
+def average_precision(curves):
+    """threshold_curves 결과의 average precision (sklearn과 같은 계단식 합)"""
+    recall = np.r_[0.0, curves['recall'].to_numpy()]
+    return float(np.sum(np.diff(recall) * curves['precision'].to_numpy()))
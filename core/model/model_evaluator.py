@@ -1,37 +1,165 @@
-import matplotlib.pyplot as plt
-import seaborn as sns
-from sklearn.metrics import (accuracy_score, confusion_matrix, f1_score,
-                             precision_score, recall_score)
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from ..preprocessor.chunked_preprocessor import iter_chunks
+from .metrics import (ConfusionAccumulator, average_precision, confusion_counts,
+                     metrics_from_confusion, per_class_metrics, roc_auc,
+                     threshold_curves)
 
 
 class ModelEvaluator:
-    def __init__(self, model, X_test, y_test):
+    def __init__(self, model, X_test=None, y_test=None):
         self.model = model
         self.X_test = X_test
         self.y_test = y_test
+        self.labels = None
+        self.confusion = None
+        self.metrics = None
+        self.curves = None
     
-    def evaluate(self):
-        """모델 평가 지표 출력"""
-        y_pred = self.model.predict(self.X_test)
+    def evaluate(self, average=None, pos_label=None, plot=True):
+        """
+        모델 평가 지표 출력 (혼동 행렬 한 번에서 모든 지표 계산)
         
-        accuracy = accuracy_score(self.y_test, y_pred)
-        precision = precision_score(self.y_test, y_pred)
-        recall = recall_score(self.y_test, y_pred)
-        f1 = f1_score(self.y_test, y_pred)
+        Args:
+            average (str, optional): 'binary', 'micro', 'macro', 'weighted' (기본: 이진이면 'binary', 다중이면 'macro')
+            pos_label (optional): 이진 분류의 양성 라벨 (기본: 1 또는 마지막 라벨)
+            plot (bool): 혼동 행렬 시각화 여부
+        """
+        y_pred = self.model.predict(self.X_test)
+        self.confusion, self.labels = confusion_counts(self.y_test, y_pred)
+        return self._report(average, pos_label, plot)
+    
+    def _report(self, average, pos_label, plot):
+        """self.confusion에서 지표 계산/출력"""
+        if average is None:
+            average = 'binary' if len(self.labels) <= 2 else 'macro'
+        self.metrics = metrics_from_confusion(self.confusion, self.labels, average=average, pos_label=pos_label)
         
-        print(f'Accuracy: {accuracy:.4f}')
-        print(f'Precision: {precision:.4f}')
-        print(f'Recall: {recall:.4f}')
-        print(f'F1 Score: {f1:.4f}')
+        print(f"Accuracy: {self.metrics['accuracy']:.4f}")
+        print(f"Precision: {self.metrics['precision']:.4f}")
+        print(f"Recall: {self.metrics['recall']:.4f}")
+        print(f"F1 Score: {self.metrics['f1']:.4f}")
         
         # Confusion Matrix 시각화
-        cm = confusion_matrix(self.y_test, y_pred)
-        self.plot_confusion_matrix(cm)
+        if plot:
+            self.plot_confusion_matrix(self.confusion, labels=self.labels)
+        return self.metrics
+    
+    def _batches(self, source, target, features, batch_size):
+        """(X, y) 배치 순회: 파일 경로는 batch_size 청크로 읽고, 큰 청크는 batch_size로 나눔"""
+        if isinstance(source, (str, os.PathLike)):
+            source = iter_chunks(source, chunksize=batch_size)
+        for item in source:
+            if isinstance(item, pd.DataFrame):
+                if target is None:
+                    raise ValueError("target is required when chunks are DataFrames or file paths.")
+                X_chunk = item[features] if features is not None else item.drop(columns=[target])
+                y_chunk = item[target]
+            else:
+                X_chunk, y_chunk = item
+            for start in range(0, len(y_chunk), batch_size):
+                rows = slice(start, start + batch_size)
+                X_batch = X_chunk.iloc[rows] if hasattr(X_chunk, 'iloc') else X_chunk[rows]
+                y_batch = y_chunk.iloc[rows] if hasattr(y_chunk, 'iloc') else y_chunk[rows]
+                yield X_batch, np.asarray(y_batch)
+    
+    def evaluate_stream(self, source, target=None, features=None, batch_size=100_000, n_jobs=1, average=None, pos_label=None, plot=True):
+        """
+        메모리에 올릴 수 없는 평가 데이터를 배치 단위로 예측하며 혼동 행렬을 누적 (최대 메모리 ~ 배치 크기 x 동시 배치 수)
+        
+        Args:
+            source: (X_chunk, y_chunk) 이터러블, DataFrame 청크 이터러블 또는 CSV/Parquet 경로
+            target (str, optional): DataFrame 청크/파일의 정답 컬럼
+            features (list, optional): 입력 컬럼 (기본: target을 뺀 나머지)
+            batch_size (int): 한 번에 predict할 행 수
+            n_jobs (int): 동시에 예측할 스레드 수 (GIL을 놓는 모델에서 효과)
+        """
+        accumulator = ConfusionAccumulator()
+        batches = self._batches(source, target, features, batch_size)
+        if n_jobs <= 1:
+            for X_batch, y_batch in batches:
+                accumulator.update(y_batch, self.model.predict(X_batch))
+        else:
+            # 실행 중인 배치를 n_jobs * 2개로 제한해 소스를 한꺼번에 읽지 않음
+            with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+                pending = deque()
+                for X_batch, y_batch in batches:
+                    pending.append((executor.submit(self.model.predict, X_batch), y_batch))
+                    if len(pending) >= n_jobs * 2:
+                        future, y_done = pending.popleft()
+                        accumulator.update(y_done, future.result())
+                while pending:
+                    future, y_done = pending.popleft()
+                    accumulator.update(y_done, future.result())
+        
+        if accumulator.cm is None:
+            raise ValueError("Evaluation source yielded no rows.")
+        self.confusion, self.labels = accumulator.cm, accumulator.labels
+        print(f"Evaluated {accumulator.count} rows in batches of {batch_size}")
+        return self._report(average, pos_label, plot)
+    
+    def class_report(self):
+        """클래스별 precision/recall/f1/support (evaluate 결과의 혼동 행렬 재사용)"""
+        if self.confusion is None:
+            self.evaluate(plot=False)
+        return per_class_metrics(self.confusion, self.labels)
+    
+    def threshold_sweep(self, pos_label=None):
+        """
+        predict_proba 점수를 한 번 정렬해 모든 임계값의 ROC/PR 곡선 계산 (이진 분류)
+        
+        Returns:
+            pd.DataFrame: 임계값별 tp, fp, fn, tn, tpr, fpr, precision, recall
+        """
+        if not hasattr(self.model, 'predict_proba'):
+            raise ValueError("Threshold sweep requires a model with predict_proba.")
+        classes = list(self.model.classes_)
+        if len(classes) != 2:
+            raise ValueError("Threshold sweep supports binary classification only.")
+        if pos_label is None:
+            pos_label = 1 if 1 in classes else classes[-1]
+        scores = self.model.predict_proba(self.X_test)[:, classes.index(pos_label)]
+        self.curves = threshold_curves(self.y_test, scores, pos_label=pos_label)
+        self.metrics = dict(self.metrics or {}, roc_auc=roc_auc(self.curves), average_precision=average_precision(self.curves))
+        print(f"ROC AUC: {self.metrics['roc_auc']:.4f}")
+        print(f"Average Precision: {self.metrics['average_precision']:.4f}")
+        return self.curves
     
-    def plot_confusion_matrix(self, cm):
-        """혼동 행렬 시각화"""
-        plt.figure(figsize=(6, 5))
-        sns.heatmap(cm, annot=True, fmt='d', cmap='Blues', cbar=False, xticklabels=['Negative', 'Positive'], yticklabels=['Negative', 'Positive'])
+    def plot_curves(self):
+        """ROC / Precision-Recall 곡선 시각화 (threshold_sweep 결과 사용)"""
+        import matplotlib.pyplot as plt
+        
+        if self.curves is None:
+            self.threshold_sweep()
+        curves = self.curves
+        fig, axes = plt.subplots(1, 2, figsize=(12, 5))
+        axes[0].plot(np.r_[0, curves['fpr']], np.r_[0, curves['tpr']])
+        axes[0].plot([0, 1], [0, 1], linestyle='--', color='gray')
+        axes[0].set_title(f"ROC Curve (AUC = {self.metrics['roc_auc']:.4f})")
+        axes[0].set_xlabel('False Positive Rate')
+        axes[0].set_ylabel('True Positive Rate')
+        axes[1].step(np.r_[0, curves['recall']], np.r_[1, curves['precision']], where='post')
+        axes[1].set_title(f"Precision-Recall Curve (AP = {self.metrics['average_precision']:.4f})")
+        axes[1].set_xlabel('Recall')
+        axes[1].set_ylabel('Precision')
+        plt.tight_layout()
+        plt.show()
+    
+    def plot_confusion_matrix(self, cm, labels=None):
+        """혼동 행렬 시각화 (labels가 없고 2x2면 Negative/Positive)"""
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
+        if labels is None:
+            labels = ['Negative', 'Positive'] if len(cm) == 2 else list(range(len(cm)))
+        size = max(6, 0.6 * len(cm))
+        plt.figure(figsize=(size, size - 1))
+        sns.heatmap(cm, annot=len(cm) <= 30, fmt='d', cmap='Blues', cbar=False, xticklabels=labels, yticklabels=labels)
         plt.title('Confusion Matrix')
         plt.xlabel('Predicted')
         plt.ylabel('Actual')
@@ -1,18 +1,148 @@
-from sklearn.model_selection import cross_val_score
+import os
+import shutil
+import tempfile
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone, is_classifier
+from sklearn.metrics import check_scoring
+from sklearn.model_selection import check_cv, cross_val_score
+
+from .pipeline_store import load_pipeline, save_pipeline
+
+# 워커 프로세스별 공유 데이터 (초기화 시 memmap으로 한 번만 연결)
+_WORKER_DATA = {}
+
+
+def _init_worker(x_path, y):
+    _WORKER_DATA['X'] = np.load(x_path, mmap_mode='r')
+    _WORKER_DATA['y'] = y
+
+
+def _fit_and_score(model, fold, train_idx, test_idx, fold_paths, scoring):
+    """워커에서 폴드 하나 학습/평가 (전처리 캐시가 있으면 변환된 memmap 사용)"""
+    y = _WORKER_DATA['y']
+    if fold_paths is not None:
+        X_train = np.load(fold_paths[0], mmap_mode='r')
+        X_test = np.load(fold_paths[1], mmap_mode='r')
+    else:
+        X = _WORKER_DATA['X']
+        X_train, X_test = X[train_idx], X[test_idx]
+
+    start = time.perf_counter()
+    model.fit(X_train, y[train_idx])
+    fit_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    score = check_scoring(model, scoring=scoring)(model, X_test, y[test_idx])
+    score_time = time.perf_counter() - start
+    return {'fold': fold, 'score': score, 'fit_time': fit_time, 'score_time': score_time}
 
 
 class ModelTrainer:
-    def __init__(self, model, X_train, y_train):
+    def __init__(self, model, X_train, y_train, cache_dir=None):
         self.model = model
         self.X_train = X_train
         self.y_train = y_train
-    
+        self.cache_dir = cache_dir
+        self._fold_cache = {}
+        self._preprocess_cache = {}
+        self._x_path = None
+
     def train(self):
         """모델 학습"""
         self.model.fit(self.X_train, self.y_train)
-    
+
     def cross_validate(self, cv=5):
         """교차 검증 (KFold)"""
         scores = cross_val_score(self.model, self.X_train, self.y_train, cv=cv)
         print(f'Cross-Validation Scores: {scores}')
         print(f'Mean Score: {scores.mean():.4f}')
+        return scores
+
+    def save(self, path, preprocessor=None, metadata=None):
+        """학습된 모델과 전처리 상태(DataPreprocessor, TransformPlan 등)를 함께 저장 (큰 배열은 mmap 가능한 .npy)"""
+        return save_pipeline(path, self.model, preprocessing=preprocessor, metadata=metadata)
+
+    @classmethod
+    def load(cls, path, X_train=None, y_train=None, mmap_mode='r'):
+        """
+        save로 저장한 모델을 mmap으로 로드 (재학습/전체 역직렬화 없이 바로 예측 가능).
+
+        Returns:
+            (ModelTrainer, preprocessing): 로드한 모델의 트레이너, 저장된 전처리 상태 (없으면 None)
+        """
+        model, preprocessing = load_pipeline(path, mmap_mode=mmap_mode)
+        return cls(model, X_train, y_train), preprocessing
+
+    def _cache_path(self, name):
+        """memmap 파일 경로 (cache_dir이 없으면 임시 폴더를 만들고 객체 소멸 시 삭제)"""
+        if self.cache_dir is None:
+            self.cache_dir = tempfile.mkdtemp(prefix='model_trainer_')
+            weakref.finalize(self, shutil.rmtree, self.cache_dir, True)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        return os.path.join(self.cache_dir, name)
+
+    def _memmap_X(self):
+        """X_train을 .npy로 한 번만 저장하고 워커는 mmap으로 공유"""
+        if self._x_path is None:
+            X = np.ascontiguousarray(np.asarray(self.X_train))
+            if X.dtype == object:
+                raise ValueError("Parallel cross-validation requires a numeric X_train.")
+            self._x_path = self._cache_path('X_train.npy')
+            np.save(self._x_path, X)
+        return self._x_path
+
+    def fold_splits(self, cv=5):
+        """폴드 분할 (같은 cv 설정이면 캐시된 분할 재사용)"""
+        cv = check_cv(cv, self.y_train, classifier=is_classifier(self.model))
+        key = (repr(cv), len(self.y_train))
+        if key not in self._fold_cache:
+            X = np.load(self._memmap_X(), mmap_mode='r')
+            self._fold_cache[key] = list(cv.split(X, np.asarray(self.y_train)))
+        return key, self._fold_cache[key]
+
+    def fold_preprocessing(self, preprocessor, cv=5):
+        """폴드별로 학습된 전처리기와 변환된 train/test memmap 경로 (모델이 바뀌어도 재사용)"""
+        fold_key, splits = self.fold_splits(cv)
+        key = (fold_key, repr(preprocessor))
+        if key not in self._preprocess_cache:
+            X = np.load(self._memmap_X(), mmap_mode='r')
+            y = np.asarray(self.y_train)
+            folds = []
+            for fold, (train_idx, test_idx) in enumerate(splits):
+                fitted = clone(preprocessor).fit(X[train_idx], y[train_idx])
+                prefix = f'prep_{len(self._preprocess_cache)}_fold{fold}'
+                paths = (self._cache_path(f'{prefix}_train.npy'), self._cache_path(f'{prefix}_test.npy'))
+                np.save(paths[0], np.asarray(fitted.transform(X[train_idx])))
+                np.save(paths[1], np.asarray(fitted.transform(X[test_idx])))
+                folds.append((fitted, paths))
+            self._preprocess_cache[key] = folds
+        return self._preprocess_cache[key]
+
+    def cross_validate_parallel(self, cv=5, n_jobs=None, scoring=None, preprocessor=None):
+        """
+        병렬 교차 검증: 프로세스 풀 + memmap된 X_train.
+        폴드 분할과 폴드별 전처리 결과는 캐시되어 다른 모델로 다시 돌릴 때 재사용됩니다.
+
+        Returns:
+            pd.DataFrame: 폴드별 score, fit_time, score_time
+        """
+        x_path = self._memmap_X()
+        _, splits = self.fold_splits(cv)
+        fold_paths = [paths for _, paths in self.fold_preprocessing(preprocessor, cv)] if preprocessor is not None else [None] * len(splits)
+        y = np.asarray(self.y_train)
+
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker, initargs=(x_path, y)) as pool:
+            futures = [
+                pool.submit(_fit_and_score, clone(self.model), fold, train_idx, test_idx, fold_paths[fold], scoring)
+                for fold, (train_idx, test_idx) in enumerate(splits)
+            ]
+            results = pd.DataFrame([future.result() for future in futures]).set_index('fold')
+
+        print(f'Cross-Validation Scores: {results["score"].to_numpy()}')
+        print(f'Mean Score: {results["score"].mean():.4f}')
+        return results
@@ -0,0 +1,135 @@
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # Windows에는 resource 모듈이 없음 (psutil의 peak_wset 사용)
+    resource = None
+
+try:
+    import psutil
+except ImportError:  # psutil이 없으면 현재 RSS 대신 최대 RSS(ru_maxrss)만 기록
+    psutil = None
+
+
+def _current_rss_mb():
+    if psutil is None:
+        return None
+    return psutil.Process().memory_info().rss / 1024 ** 2
+
+
+def _max_rss_mb():
+    if resource is None:
+        peak = getattr(psutil.Process().memory_info(), 'peak_wset', None) if psutil is not None else None
+        return peak / 1024 ** 2 if peak is not None else None
+    # 리눅스는 KB, macOS는 byte 단위
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / 1024 ** 2 if sys.platform == 'darwin' else max_rss / 1024
+
+
+def _shape(get_frame):
+    if get_frame is None:
+        return None, None
+    df = get_frame()
+    if df is None:
+        return None, None
+    return df.shape if df.ndim == 2 else (len(df), 1)
+
+
+class PipelineProfiler:
+    """
+    파이프라인 단계별 계측: 벽시계/CPU 시간, RSS, tracemalloc 증가량/최대치, 입출력 행·열 수.
+
+    사용 예:
+        profiler = PipelineProfiler()
+        with profiler.stage('impute', lambda: df):
+            ...
+        profiler.to_frame()
+    """
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.records = []
+        self._origin = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name, get_frame=None):
+        """단계 하나 측정 (get_frame: 단계 전후 데이터프레임을 돌려주는 함수)"""
+        rows_in, cols_in = _shape(get_frame)
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            traced_before = tracemalloc.get_traced_memory()[0]
+        rss_before = _current_rss_mb()
+        max_rss_before = _max_rss_mb()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            record = {
+                'stage': name,
+                'start_s': wall_start - self._origin,
+                'wall_s': wall,
+                'cpu_s': cpu,
+                'rss_before_mb': rss_before,
+                'rss_after_mb': _current_rss_mb(),
+                'max_rss_growth_mb': None,
+                'tracemalloc_delta_mb': None,
+                'tracemalloc_peak_mb': None,
+                'rows_in': rows_in,
+                'cols_in': cols_in,
+            }
+            max_rss_after = _max_rss_mb()
+            if max_rss_before is not None and max_rss_after is not None:
+                record['max_rss_growth_mb'] = max_rss_after - max_rss_before
+            if self.trace_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                record['tracemalloc_delta_mb'] = (current - traced_before) / 1024 ** 2
+                record['tracemalloc_peak_mb'] = (peak - traced_before) / 1024 ** 2
+                if started_tracing:
+                    tracemalloc.stop()
+            record['rows_out'], record['cols_out'] = _shape(get_frame)
+            self.records.append(record)
+
+    def to_frame(self):
+        """단계별 측정 결과 DataFrame"""
+        return pd.DataFrame(self.records).set_index('stage') if self.records else pd.DataFrame()
+
+    def to_dict(self):
+        return {'total_wall_s': sum(record['wall_s'] for record in self.records), 'stages': self.records}
+
+    def to_json(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def to_chrome_trace(self, path):
+        """chrome://tracing / Perfetto에서 열 수 있는 trace 이벤트 JSON 저장"""
+        pid = os.getpid()
+        events = [
+            {
+                'name': record['stage'],
+                'ph': 'X',
+                'ts': record['start_s'] * 1e6,
+                'dur': record['wall_s'] * 1e6,
+                'pid': pid,
+                'tid': 0,
+                'args': {key: value for key, value in record.items() if key not in ('stage', 'start_s', 'wall_s')},
+            }
+            for record in self.records
+        ]
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, indent=2)
+
+    def __repr__(self):
+        return f'PipelineProfiler({len(self.records)} stages)\n{self.to_frame()}'
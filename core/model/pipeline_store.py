@@ -0,0 +1,157 @@
+import json
+import os
+import pickle
+import shutil
+import tempfile
+from datetime import datetime
+
+import numpy as np
+
+from ..preprocessor.transform_plan import TransformPlan
+
+FORMAT_VERSION = 1
+# 이보다 작은 배열은 pickle 안에 그대로 둠 (파일 수를 줄임)
+MIN_MMAP_BYTES = 1 << 16
+
+
+class _ArrayPickler(pickle.Pickler):
+    """큰 수치형 배열은 압축하지 않은 .npy 파일로 빼고 pickle에는 파일 이름만 남김"""
+
+    def __init__(self, file, array_dir, min_bytes):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.array_dir = array_dir
+        self.min_bytes = min_bytes
+        self.arrays = []
+        self._saved = {}
+
+    def persistent_id(self, obj):
+        if type(obj) is not np.ndarray or obj.dtype.hasobject or obj.nbytes < self.min_bytes:
+            return None
+        if id(obj) not in self._saved:
+            name = f'array_{len(self.arrays)}.npy'
+            np.save(os.path.join(self.array_dir, name), obj, allow_pickle=False)
+            # 같은 배열을 여러 번 참조해도 파일은 하나 (id 재사용을 막기 위해 객체도 보관)
+            self._saved[id(obj)] = (name, obj)
+            self.arrays.append({'name': name, 'shape': list(obj.shape), 'dtype': obj.dtype.str, 'bytes': int(obj.nbytes)})
+        return ('npy', self._saved[id(obj)][0])
+
+
+class _ArrayUnpickler(pickle.Unpickler):
+    """pickle 안의 .npy 참조를 mmap 배열로 연결 (같은 파일을 여는 프로세스들은 페이지를 공유)"""
+
+    def __init__(self, file, array_dir, mmap_mode):
+        super().__init__(file)
+        self.array_dir = array_dir
+        self.mmap_mode = mmap_mode
+
+    def persistent_load(self, pid):
+        kind, name = pid
+        if kind != 'npy':
+            raise pickle.UnpicklingError(f"Unsupported persistent id: {kind}")
+        return np.load(os.path.join(self.array_dir, name), mmap_mode=self.mmap_mode, allow_pickle=False)
+
+
+def _as_plan(preprocessing):
+    """DataPreprocessor/ChunkedPreprocessor처럼 학습된 plan을 가진 객체는 plan으로 저장"""
+    plan = getattr(preprocessing, 'plan', None)
+    return plan if isinstance(plan, TransformPlan) else preprocessing
+
+
+def _write_pipeline(folder, model, preprocessing, metadata, min_mmap_bytes):
+    """빈 폴더에 plan.json/model.pkl/arrays/manifest.json 쓰기"""
+    array_dir = os.path.join(folder, 'arrays')
+    os.makedirs(array_dir)
+
+    is_plan = isinstance(preprocessing, TransformPlan)
+    if is_plan:
+        preprocessing.save(os.path.join(folder, 'plan.json'))
+    with open(os.path.join(folder, 'model.pkl'), 'wb') as f:
+        pickler = _ArrayPickler(f, array_dir, min_mmap_bytes)
+        pickler.dump({'model': model, 'preprocessing': None if is_plan else preprocessing})
+
+    manifest = {
+        'format_version': FORMAT_VERSION,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'model_class': f'{type(model).__module__}.{type(model).__name__}',
+        'preprocessing': 'plan' if is_plan else (type(preprocessing).__name__ if preprocessing is not None else None),
+        'arrays': pickler.arrays,
+        'metadata': metadata or {},
+    }
+    with open(os.path.join(folder, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def save_pipeline(path, model, preprocessing=None, metadata=None, min_mmap_bytes=MIN_MMAP_BYTES):
+    """
+    학습된 모델과 전처리 상태를 폴더 하나에 저장.
+    TransformPlan은 plan.json, 나머지 객체는 model.pkl에 저장하되 큰 배열은 arrays/*.npy로 분리합니다.
+
+    Args:
+        path (str): 저장 폴더 (이전 저장본이면 교체, manifest.json이 없는 기존 폴더면 ValueError)
+        model: 학습된 모델
+        preprocessing (optional): TransformPlan, plan을 가진 전처리기, 또는 sklearn 변환기 등 pickle 가능한 객체
+        metadata (dict, optional): manifest.json에 함께 기록할 정보 (JSON 직렬화 가능해야 함)
+    """
+    path = os.path.normpath(path)
+    if os.path.exists(path) and not os.path.isfile(os.path.join(path, 'manifest.json')):
+        raise ValueError(f"Refusing to replace '{path}': it exists and is not a saved pipeline (no manifest.json)")
+    parent, name = os.path.split(os.path.abspath(path))
+    os.makedirs(parent, exist_ok=True)
+
+    # 임시/백업 폴더는 mkdtemp로 이 호출만 쓰는 고유 이름을 만들고, 삭제도 이 호출이 만든 폴더만 함
+    tmp_path = tempfile.mkdtemp(prefix=f'.{name}.tmp-', dir=parent)
+    try:
+        # mkdtemp는 0o700으로 만들므로 저장본은 일반 폴더처럼 umask 기준 권한으로
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o777 & ~umask)
+        manifest = _write_pipeline(tmp_path, model, _as_plan(preprocessing), metadata, min_mmap_bytes)
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+
+    # 쓰기가 끝난 폴더로 교체: 기존 저장본은 백업 폴더 안으로 옮겨 두었다가 교체가 성공한 뒤에 삭제 (중간에 실패해도 기존 저장본은 유지)
+    backup_dir, previous = None, None
+    if os.path.exists(path):
+        backup_dir = tempfile.mkdtemp(prefix=f'.{name}.old-', dir=parent)
+        previous = os.path.join(backup_dir, name)
+        os.replace(path, previous)
+    try:
+        os.replace(tmp_path, path)
+    except BaseException:
+        if previous is not None:
+            os.replace(previous, path)
+            os.rmdir(backup_dir)
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+    if backup_dir is not None:
+        shutil.rmtree(backup_dir, ignore_errors=True)
+    return manifest
+
+
+def read_manifest(path):
+    with open(os.path.join(path, 'manifest.json')) as f:
+        return json.load(f)
+
+
+def load_pipeline(path, mmap_mode='r'):
+    """
+    save_pipeline으로 저장한 모델/전처리 상태 로드. 큰 배열은 mmap으로 연결되어
+    로드 시간이 모델 크기와 거의 무관하고, 여러 워커 프로세스가 같은 페이지를 공유합니다.
+
+    Args:
+        mmap_mode (str, optional): 'r'(읽기 전용, 기본), 'c'(쓰기 시 복사) 또는 None(메모리로 읽기)
+
+    Returns:
+        (model, preprocessing): 모델, TransformPlan 또는 저장된 전처리 객체 (없으면 None)
+    """
+    manifest = read_manifest(path)
+    if manifest['format_version'] > FORMAT_VERSION:
+        raise ValueError(f"Unsupported pipeline format version: {manifest['format_version']}")
+    with open(os.path.join(path, 'model.pkl'), 'rb') as f:
+        payload = _ArrayUnpickler(f, os.path.join(path, 'arrays'), mmap_mode).load()
+    preprocessing = payload['preprocessing']
+    if manifest['preprocessing'] == 'plan':
+        preprocessing = TransformPlan.load(os.path.join(path, 'plan.json'))
+    return payload['model'], preprocessing
@@ -0,0 +1,148 @@
+import hashlib
+import json
+import os
+from datetime import datetime
+
+import pandas as pd
+
+# 단계 구현이 바뀌어 예전 결과를 쓰면 안 될 때 올림 (키에 포함)
+CACHE_VERSION = 1
+DEFAULT_MAX_BYTES = 1 << 30
+FORMATS = ('parquet', 'feather')
+
+
+def stage_key(stage, parent_key, params=None):
+    """단계 결과의 내용 주소: 단계 이름 + 입력(이전 단계 키 또는 데이터 지문) + 파라미터"""
+    payload = json.dumps([CACHE_VERSION, stage, parent_key, params or {}], sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+class StageCache:
+    """
+    파이프라인 단계 결과(데이터프레임 + JSON 상태)를 키별 파일로 디스크에 저장.
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다 (LRU, 파일 수정 시각 기준).
+
+    Args:
+        cache_dir (str): 캐시 폴더 (여러 파이프라인/프로세스가 공유 가능)
+        max_bytes (int): 캐시 전체 크기 상한
+        format (str): 'parquet' 또는 'feather'
+    """
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_MAX_BYTES, format='parquet'):
+        if format not in FORMATS:
+            raise ValueError("Invalid cache format. Choose 'parquet' or 'feather'.")
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.format = format
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _paths(self, key):
+        base = os.path.join(self.cache_dir, key)
+        return f'{base}.{self.format}', f'{base}.json'
+
+    def __contains__(self, key):
+        return os.path.exists(self._paths(key)[1])
+
+    def get(self, key):
+        """
+        저장된 (데이터프레임 또는 None, 상태 dict). 없으면 None.
+        읽은 항목은 최근 사용으로 표시됩니다.
+        """
+        frame_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+            df = self._read_frame(frame_path, meta) if meta['has_frame'] else None
+        except (FileNotFoundError, json.JSONDecodeError):
+            # 다른 프로세스가 삭제 중이거나 쓰는 중인 항목은 없는 것으로 처리
+            return None
+        for path in (frame_path, meta_path):
+            if os.path.exists(path):
+                os.utime(path)
+        return df, meta['state']
+
+    def put(self, key, df=None, state=None):
+        """
+        결과 저장 (임시 파일에 쓴 뒤 교체하므로 읽는 쪽은 완성된 항목만 봄).
+        Parquet/Feather로 저장할 수 없는 데이터(문자열이 아닌 컬럼명 등)는 저장하지 않고 False 반환
+        """
+        frame_path, meta_path = self._paths(key)
+        meta = {'created_at': datetime.now().isoformat(timespec='seconds'), 'has_frame': df is not None, 'state': state or {}}
+        if df is not None:
+            tmp_path = f'{frame_path}.{os.getpid()}.tmp'
+            try:
+                meta['index_names'] = self._write_frame(df, tmp_path)
+            except (ValueError, TypeError):
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                return False
+            os.replace(tmp_path, frame_path)
+        tmp_path = f'{meta_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, meta_path)
+        self.evict(keep=key)
+        return True
+
+    def _write_frame(self, df, path):
+        if self.format == 'parquet':
+            df.to_parquet(path)
+            return None
+        # feather는 기본 RangeIndex만 저장하므로 인덱스를 컬럼으로 내려 저장
+        names = [name if name is not None else f'__index_level_{i}__' for i, name in enumerate(df.index.names)]
+        df.rename_axis(names).reset_index().to_feather(path)
+        return list(df.index.names)
+
+    def _read_frame(self, path, meta):
+        if self.format == 'parquet':
+            return pd.read_parquet(path)
+        df = pd.read_feather(path)
+        names = meta['index_names']
+        df = df.set_index(list(df.columns[:len(names)]))
+        df.index.names = names
+        return df
+
+    def entries(self):
+        """캐시 항목 목록 (key, 바이트, 마지막 사용 시각), 오래된 순"""
+        sizes, used = {}, {}
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.tmp'):
+                continue
+            key = name.split('.', 1)[0]
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except FileNotFoundError:
+                continue
+            sizes[key] = sizes.get(key, 0) + stat.st_size
+            used[key] = max(used.get(key, 0), stat.st_mtime)
+        return pd.DataFrame(
+            {'key': list(sizes), 'bytes': list(sizes.values()), 'last_used': [used[key] for key in sizes]},
+            columns=['key', 'bytes', 'last_used']
+        ).sort_values('last_used', ignore_index=True)
+
+    def evict(self, keep=None):
+        """전체 크기가 max_bytes 이하가 될 때까지 오래 사용하지 않은 항목 삭제"""
+        entries = self.entries()
+        total = entries['bytes'].sum()
+        removed = []
+        for key, size in zip(entries['key'], entries['bytes']):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            self.remove(key)
+            total -= size
+            removed.append(key)
+        return removed
+
+    def remove(self, key):
+        base = os.path.join(self.cache_dir, key)
+        for ext in FORMATS + ('json',):
+            try:
+                os.remove(f'{base}.{ext}')
+            except FileNotFoundError:
+                pass
+
+    def clear(self):
+        for key in self.entries()['key']:
+            self.remove(key)
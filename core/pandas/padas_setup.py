@@ -29,7 +29,7 @@ def reset_pandas_display():
     print("🔄 [Pandas Setup] Display settings reset to default.")
 
 
-def apply_super_styling(df: pd.DataFrame) -> pd.io.formats.style.Styler:
+def apply_super_styling(df: pd.DataFrame) -> 'pd.io.formats.style.Styler':
     """
     데이터프레임에 고급 스타일 적용:
     - 중앙 정렬
@@ -36,7 +36,7 @@ def bold_names(s):
     return ['font-weight: bold;' for _ in s]
 
 
-def style_columns(df: pd.DataFrame) -> pd.io.formats.style.Styler:
+def style_columns(df: pd.DataFrame) -> 'pd.io.formats.style.Styler':
     """
     컬럼별 맞춤형 스타일 적용:
     - 이름 컬럼: 볼드체
@@ -0,0 +1,70 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+
+def _pick_mode(counts, values):
+    """개수가 가장 많은 값의 위치 (동률이면 SimpleImputer처럼 가장 작은 값)"""
+    candidates = np.flatnonzero(counts == counts.max())
+    if len(candidates) == 1:
+        return candidates[0]
+    try:
+        return min(candidates, key=lambda k: values[k])
+    except TypeError:
+        return candidates[0]
+
+
+def _impute_column(series):
+    """
+    (최빈값, 채운 컬럼 또는 결측이 없으면 None).
+    문자형은 factorize 한 번으로 개수/결측 위치/채운 컬럼을 모두 얻음 (isna/fillna로 다시 스캔하지 않음)
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+        if not counts.any():
+            return np.nan, None
+        mode = series.cat.categories[_pick_mode(counts, series.cat.categories)]
+        return mode, (series.fillna(mode) if (codes < 0).any() else None)
+
+    codes, uniques = pd.factorize(series)
+    missing = codes < 0
+    if len(uniques) == 0:
+        return np.nan, None
+    mode_code = _pick_mode(np.bincount(codes[~missing], minlength=len(uniques)), uniques)
+    if not missing.any():
+        return uniques[mode_code], None
+    filled = uniques.take(np.where(missing, mode_code, codes))
+    return uniques[mode_code], pd.Series(filled, index=series.index, name=series.name)
+
+
+def impute_categorical(df, columns, n_jobs=None):
+    """
+    범주형/문자형 컬럼 결측치를 컬럼별 최빈값으로 채움 (컬럼들은 스레드 풀에서 동시에 처리).
+    결측이 없는 컬럼은 다시 쓰지 않고, category dtype은 그대로 유지됩니다.
+
+    Args:
+        df (pd.DataFrame): 데이터프레임 (제자리에서 수정)
+        columns (list): 대상 컬럼
+        n_jobs (int, optional): 스레드 수 (기본: 컬럼 수와 CPU 수 중 작은 값, 1이면 순차 처리)
+
+    Returns:
+        dict: 컬럼별 대체값
+    """
+    columns = list(columns)
+    n_jobs = n_jobs or min(len(columns), os.cpu_count() or 1)
+    if n_jobs <= 1 or len(columns) <= 1:
+        results = [_impute_column(df[col]) for col in columns]
+    else:
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            results = list(executor.map(_impute_column, [df[col] for col in columns]))
+
+    # 데이터프레임 쓰기는 스레드 안전하지 않으므로 메인 스레드에서만
+    fill_values = {}
+    for col, (mode, filled) in zip(columns, results):
+        fill_values[col] = mode
+        if filled is not None:
+            df[col] = filled
+    return fill_values
@@ -0,0 +1,307 @@
+import os
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from .outlier_engine import inlier_mask, iqr_bounds
+from .transform_plan import TransformPlan
+
+
+class NumericAccumulator:
+    """수치형 컬럼 누적 통계: 개수/평균/분산(Welford)과 분위수용 표본을 병합 가능하게 유지"""
+
+    def __init__(self, sample_size=100_000, seed=None):
+        self.count = 0
+        self.missing = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.sample_size = sample_size
+        self._rng = np.random.default_rng(seed)
+        self._keys = np.empty(0)
+        self._values = np.empty(0)
+
+    def update(self, values):
+        """청크 하나의 값을 누적 (NaN은 결측치로 카운트)"""
+        values = np.asarray(values, dtype='float64')
+        missing = np.isnan(values)
+        self.missing += int(missing.sum())
+        observed = values[~missing]
+        if observed.size == 0:
+            return
+        mean = observed.mean()
+        m2 = ((observed - mean) ** 2).sum()
+        self._merge_moments(observed.size, mean, m2)
+        self._merge_sample(self._rng.random(observed.size), observed)
+
+    def merge(self, other):
+        """다른 누적기(다른 청크/파티션)의 결과를 병합"""
+        self.missing += other.missing
+        if other.count:
+            self._merge_moments(other.count, other.mean, other.m2)
+            self._merge_sample(other._keys, other._values)
+        return self
+
+    def _merge_moments(self, n, mean, m2):
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta ** 2 * self.count * n / total
+        self.count = total
+
+    def _merge_sample(self, keys, values):
+        # bottom-k 표본: 난수 키가 가장 작은 k개만 유지하면 병합해도 균등 표본이 유지됨
+        keys = np.concatenate([self._keys, keys])
+        values = np.concatenate([self._values, values])
+        if keys.size > self.sample_size:
+            keep = np.argpartition(keys, self.sample_size)[:self.sample_size]
+            keys, values = keys[keep], values[keep]
+        self._keys, self._values = keys, values
+
+    def quantile(self, q, fill_value=None):
+        """분위수 추정 (전체 값이 표본에 들어 있으면 정확한 값). fill_value를 주면 결측치를 그 값으로 채운 분포 기준"""
+        values = self._values
+        if fill_value is not None and self.missing:
+            n_fill = int(round(values.size * self.missing / self.count)) if self.count else self.missing
+            values = np.concatenate([values, np.full(n_fill, fill_value)])
+        if values.size == 0:
+            return np.nan
+        return np.quantile(values, q)
+
+    def imputed_moments(self, fill_value):
+        """결측치를 fill_value로 채웠을 때의 (개수, 평균, 모분산)"""
+        count, mean, m2 = self.count, self.mean, self.m2
+        if self.missing:
+            total = count + self.missing
+            delta = fill_value - mean
+            mean += delta * self.missing / total
+            m2 += delta ** 2 * count * self.missing / total
+            count = total
+        return count, mean, (m2 / count if count else np.nan)
+
+
+class CategoricalAccumulator:
+    """범주형 컬럼 누적 빈도: 청크별 value_counts를 병합해 최빈값 계산"""
+
+    def __init__(self):
+        self.counts = Counter()
+        self.missing = 0
+
+    def update(self, values):
+        values = pd.Series(values)
+        self.missing += int(values.isna().sum())
+        self.counts.update(values.value_counts(dropna=True).to_dict())
+
+    def merge(self, other):
+        self.counts.update(other.counts)
+        self.missing += other.missing
+        return self
+
+    def mode(self):
+        """최빈값 (동률이면 SimpleImputer처럼 가장 작은 값)"""
+        if not self.counts:
+            return np.nan
+        top = max(self.counts.values())
+        candidates = [value for value, count in self.counts.items() if count == top]
+        try:
+            return min(candidates)
+        except TypeError:
+            return candidates[0]
+
+
+def iter_chunks(source, chunksize=100_000):
+    """청크 소스 순회: CSV/Parquet 경로, DataFrame, 청크 리스트 또는 이터레이터를 돌려주는 함수"""
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        if path.endswith('.parquet'):
+            import pyarrow.parquet as pq
+            for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+                yield batch.to_pandas()
+        else:
+            yield from pd.read_csv(path, chunksize=chunksize)
+    elif isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), chunksize):
+            yield source.iloc[start:start + chunksize]
+    elif callable(source):
+        yield from source()
+    elif iter(source) is source:
+        raise ValueError("Chunk source is consumed after one pass. Pass a path, a list of chunks or a callable.")
+    else:
+        yield from source
+
+
+class ChunkedPreprocessor:
+    """
+    메모리보다 큰 데이터용 청크 단위 전처리.
+    1차 패스에서 병합 가능한 누적기로 대체값/IQR 경계/스케일러 통계를 모으고,
+    2차 패스에서 변환된 청크를 반환하거나 파일로 저장합니다 (최대 메모리 = 청크 크기 수준).
+    """
+
+    def __init__(self, chunksize=100_000, sample_size=100_000, random_state=42):
+        self.chunksize = chunksize
+        self.sample_size = sample_size
+        self.random_state = random_state
+        self.num_cols = []
+        self.cat_cols = []
+        self.fill_values = {}
+        self.bounds = pd.DataFrame(columns=['lower', 'upper'])
+        self.scale_mean = {}
+        self.scale_std = {}
+        self.drop = []
+        self.renames = {}
+        self.plan = None
+
+    @staticmethod
+    def _clean_column_names(chunk):
+        chunk = chunk.copy()
+        chunk.columns = chunk.columns.str.lower().str.replace(' ', '_')
+        return chunk
+
+    def _chunks(self, source):
+        for chunk in iter_chunks(source, chunksize=self.chunksize):
+            yield self._clean_column_names(chunk)
+
+    def _impute(self, chunk):
+        chunk = chunk.fillna(self.fill_values)
+        if self.num_cols:
+            chunk[self.num_cols] = chunk[self.num_cols].astype('float64')
+        return chunk
+
+    def _accumulate(self, source, categorical=()):
+        """
+        1차 패스 누적: 컬럼 타입은 값이 처음 나온 청크 기준으로 정함 (앞 청크에서 전부 결측이던 컬럼은 타입 보류).
+        categorical에 있는 컬럼은 범주형으로 고정합니다.
+
+        Returns:
+            (num_acc, cat_acc, flipped): 수치형/범주형 누적기, 수치형으로 시작했다가 문자열이 나온 컬럼
+        """
+        columns, num_acc, cat_acc = None, {}, {}
+        unseen, flipped = Counter(), set()
+        for raw_chunk in iter_chunks(source, chunksize=self.chunksize):
+            chunk = self._clean_column_names(raw_chunk)
+            if columns is None:
+                self.renames = {old: new for old, new in zip(raw_chunk.columns, chunk.columns) if old != new}
+                columns = list(chunk.columns)
+            numeric = set(chunk.select_dtypes(include='number').columns) - set(categorical)
+            for col in columns:
+                values = chunk[col]
+                if col not in num_acc and col not in cat_acc:
+                    if values.isna().all():
+                        unseen[col] += len(values)
+                        continue
+                    acc = NumericAccumulator(self.sample_size, seed=self.random_state) if col in numeric else CategoricalAccumulator()
+                    acc.missing += unseen.pop(col, 0)
+                    (num_acc if col in numeric else cat_acc)[col] = acc
+                elif col in num_acc and col not in numeric and values.notna().any():
+                    flipped.add(col)
+                    continue
+                if col in num_acc:
+                    num_acc[col].update(values)
+                else:
+                    cat_acc[col].update(values)
+        if columns is None:
+            raise ValueError("Chunk source is empty.")
+
+        # 끝까지 전부 결측인 컬럼은 전체를 한 번에 읽었을 때처럼 수치형
+        for col, missing in unseen.items():
+            num_acc[col] = NumericAccumulator(self.sample_size, seed=self.random_state)
+            num_acc[col].missing = missing
+        self.num_cols = [col for col in columns if col in num_acc]
+        self.cat_cols = [col for col in columns if col in cat_acc]
+        return {col: num_acc[col] for col in self.num_cols}, {col: cat_acc[col] for col in self.cat_cols}, flipped
+
+    def fit(self, source, missing_strategy='mean', remove_outliers_cols=None, scale_type='standard', drop_columns=None, threshold=1.5):
+        """1차 패스: 결측 대체값, IQR 경계, 스케일러 평균/표준편차 계산"""
+        if missing_strategy not in ('mean', 'median'):
+            raise ValueError("Invalid missing strategy. Choose 'mean' or 'median'.")
+        if scale_type not in (None, 'standard'):
+            raise ValueError("Invalid scaler type. Choose 'standard'.")
+
+        num_acc, cat_acc, flipped = self._accumulate(source)
+        if flipped:
+            # 앞 청크에서 수치형으로 누적하던 컬럼에 문자열이 나옴: 범주형으로 고정하고 누적을 한 번 더 수행
+            num_acc, cat_acc, _ = self._accumulate(source, categorical=flipped)
+
+        self.fill_values = {}
+        for col, acc in num_acc.items():
+            self.fill_values[col] = acc.mean if missing_strategy == 'mean' else acc.quantile(0.5)
+        for col, acc in cat_acc.items():
+            self.fill_values[col] = acc.mode()
+
+        outlier_cols = list(remove_outliers_cols or [])
+        quartiles = pd.DataFrame(
+            {col: num_acc[col].quantile([0.25, 0.75], fill_value=self.fill_values[col]) for col in outlier_cols},
+            index=[0.25, 0.75]
+        )
+        self.bounds = iqr_bounds(None, outlier_cols, threshold=threshold, quartiles=(quartiles.loc[0.25], quartiles.loc[0.75]))
+
+        self.scale_mean, self.scale_std = {}, {}
+        if scale_type:
+            if not self.bounds.empty:
+                # 이상치 제거 후 남은 행 기준 통계가 필요하므로 통계 전용 패스를 한 번 더 수행
+                moments = {col: NumericAccumulator(sample_size=0) for col in self.num_cols}
+                for chunk in self._chunks(source):
+                    chunk = self._impute(chunk)
+                    chunk = chunk[inlier_mask(chunk, self.bounds)]
+                    for col in self.num_cols:
+                        moments[col].update(chunk[col])
+                stats = {col: (acc.mean, acc.m2 / acc.count if acc.count else np.nan) for col, acc in moments.items()}
+            else:
+                stats = {col: acc.imputed_moments(self.fill_values[col])[1:] for col, acc in num_acc.items()}
+            for col, (mean, var) in stats.items():
+                std = np.sqrt(var)
+                self.scale_mean[col] = mean
+                self.scale_std[col] = std if std > 0 else 1.0
+
+        self.drop = list(drop_columns or [])
+        self.plan = TransformPlan(
+            renames=self.renames,
+            numeric_cols=self.num_cols,
+            fill_values=self.fill_values,
+            bounds=self.bounds,
+            scale_mean=self.scale_mean,
+            scale_std=self.scale_std,
+            drop_columns=self.drop
+        )
+        return self
+
+    def transform(self, source):
+        """2차 패스: 학습된 TransformPlan으로 청크별 변환 결과를 하나씩 반환 (제너레이터)"""
+        for chunk in iter_chunks(source, chunksize=self.chunksize):
+            yield self.plan.transform(chunk)
+
+    def preprocess(self, source, output_path=None, missing_strategy='mean', remove_outliers_cols=None, scale_type='standard', drop_columns=None):
+        """전처리 전체 파이프라인 (청크 단위). output_path가 없으면 변환된 청크 제너레이터 반환"""
+        self.fit(
+            source,
+            missing_strategy=missing_strategy,
+            remove_outliers_cols=remove_outliers_cols,
+            scale_type=scale_type,
+            drop_columns=drop_columns
+        )
+        chunks = self.transform(source)
+        if output_path is None:
+            return chunks
+        write_chunks(chunks, output_path)
+        return output_path
+
+
+def write_chunks(chunks, output_path):
+    """변환된 청크를 CSV 또는 Parquet 파일로 순차 저장"""
+    output_path = os.fspath(output_path)
+    if output_path.endswith('.parquet'):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        writer = None
+        try:
+            for chunk in chunks:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(output_path, table.schema)
+                writer.write_table(table.cast(writer.schema))
+        finally:
+            if writer is not None:
+                writer.close()
+    else:
+        for i, chunk in enumerate(chunks):
+            chunk.to_csv(output_path, mode='w' if i == 0 else 'a', header=(i == 0), index=False)
@@ -1,64 +1,210 @@
+from contextlib import nullcontext
+
+import numpy as np
 import pandas as pd
-from sklearn.impute import SimpleImputer
-from sklearn.preprocessing import StandardScaler
+
+from .categorical_imputer import impute_categorical
+from .chunked_preprocessor import ChunkedPreprocessor
+from .memory_optimizer import optimize_memory
+from .numeric_kernel import column_moments, fit_fill_values, fit_impute_scale, impute_scale, scale_stats
+from .outlier_engine import detect_outliers
+from .transform_plan import TransformPlan
 
 
 class DataPreprocessor:
-    def __init__(self, df):
-        self.df = df
+    def __init__(self, df, copy=False, n_jobs=None):
+        """
+        Args:
+            df (pd.DataFrame): 데이터프레임
+            copy (bool): True면 입력 데이터프레임을 복사해 원본을 변경하지 않음 (False면 컬럼명/값을 원본에 덮어씀)
+            n_jobs (int, optional): 컬럼 단위 병렬 처리 스레드 수 (기본: CPU 수, 1이면 순차 처리)
+        """
+        self.df = df.copy() if copy else df
+        self.n_jobs = n_jobs
+        self.outlier_report = None
+        self.bounds = None
+        self.memory_report = None
+        self.renames = {}
+        self.numeric_cols = []
+        self.fill_values = {}
+        self.scale_mean = {}
+        self.scale_std = {}
+        self.plan = None
+    
+    @classmethod
+    def from_plan(cls, df, plan, **kwargs):
+        """TransformPlan에 저장된 학습 상태(컬럼명 변경, 대체값, 이상치 경계, 스케일 통계)를 복원한 전처리기 (다음 단계부터 이어서 실행)"""
+        preprocessor = cls(df, **kwargs)
+        preprocessor.renames = dict(plan.renames)
+        preprocessor.numeric_cols = list(plan.numeric_cols)
+        preprocessor.fill_values = dict(plan.fill_values)
+        preprocessor.bounds = dict(plan.bounds) or None
+        preprocessor.scale_mean = dict(plan.scale_mean)
+        preprocessor.scale_std = dict(plan.scale_std)
+        return preprocessor
+    
+    def fitted_plan(self, outliers=True, scaled=True, drop_columns=None):
+        """지금까지 학습된 상태로 TransformPlan 생성"""
+        return TransformPlan(
+            renames=self.renames,
+            numeric_cols=self.numeric_cols,
+            fill_values=self.fill_values,
+            bounds=self.bounds if outliers else None,
+            scale_mean=self.scale_mean if scaled else None,
+            scale_std=self.scale_std if scaled else None,
+            drop_columns=drop_columns
+        )
     
     def clean_column_names(self):
         """컬럼명을 소문자화하고 공백을 언더스코어로 바꿈"""
+        original = self.df.columns
         self.df.columns = self.df.columns.str.lower().str.replace(' ', '_')
+        self.renames = {old: new for old, new in zip(original, self.df.columns) if old != new}
+    
+    def optimize_memory(self, category_threshold=0.5):
+        """메모리 최적화: 수치형 downcast, 저카디널리티 문자형은 category로 변환 (컬럼별 전후 바이트는 memory_report)"""
+        self.df, self.memory_report = optimize_memory(self.df, category_threshold=category_threshold)
+        return self.memory_report
+    
+    def _numeric_block(self, num_cols):
+        """수치형 컬럼을 float64 블록으로 한 번만 추출 (컬럼 선택이 이미 복사본이므로 커널이 제자리에서 변환)"""
+        X = self.df[num_cols].to_numpy(dtype='float64', na_value=np.nan)
+        return X if X.flags.writeable else X.copy()
+    
+    def _impute_categorical(self, cat_cols):
+        """문자형 컬럼 결측치를 컬럼별 최빈값(value_counts/범주 코드)으로 처리하고 대체값 보관"""
+        self.fill_values.update(impute_categorical(self.df, cat_cols, n_jobs=self.n_jobs))
     
     def handle_missing_values(self, strategy='mean'):
         """결측치 처리: 숫자형 데이터는 'mean' 또는 'median', 문자형 데이터는 'most_frequent' 처리"""
-        # 숫자형 데이터만 mean/median 처리
         num_cols = self.df.select_dtypes(include='number').columns
         cat_cols = self.df.select_dtypes(exclude='number').columns
         
-        # 숫자형 컬럼에 대해 결측치 처리
-        num_imputer = SimpleImputer(strategy=strategy)
-        self.df[num_cols] = num_imputer.fit_transform(self.df[num_cols])
+        # 숫자형 컬럼: 블록 하나를 추출해 제자리에서 대체 후 한 번만 기록
+        X = self._numeric_block(num_cols)
+        fill = fit_fill_values(X, strategy)
+        self.df[num_cols] = impute_scale(X, fill=fill)
         
-        # 문자형 컬럼에 대해 결측치 처리
-        cat_imputer = SimpleImputer(strategy='most_frequent')
-        self.df[cat_cols] = cat_imputer.fit_transform(self.df[cat_cols])
+        # 새 데이터에 그대로 적용할 수 있도록 학습된 대체값 보관
+        self.numeric_cols = list(num_cols)
+        self.fill_values = dict(zip(num_cols, fill))
+        self._impute_categorical(cat_cols)
     
-    def remove_outliers(self, col):
-        """이상치 제거: IQR 방식을 이용"""
-        Q1 = self.df[col].quantile(0.25)
-        Q3 = self.df[col].quantile(0.75)
-        IQR = Q3 - Q1
-        self.df = self.df[(self.df[col] >= (Q1 - 1.5 * IQR)) & (self.df[col] <= (Q3 + 1.5 * IQR))]
+    def remove_outliers(self, cols, threshold=1.5):
+        """이상치 제거: IQR 방식을 이용 (여러 컬럼의 경계를 한 번에 계산하고 결합 마스크로 한 번만 필터링)"""
+        if isinstance(cols, str):
+            cols = [cols]
+        self.outlier_report = detect_outliers(self.df, cols, threshold=threshold)
+        self.bounds = self.outlier_report.bounds
+        self.df = self.df.loc[self.outlier_report.inliers].copy()
     
     def scale_data(self, scaler_type='standard'):
-        """데이터 스케일링: 'standard' 또는 'minmax'"""
-        if scaler_type == 'standard':
-            scaler = StandardScaler()
-        else:
+        """데이터 스케일링: 'standard' (StandardScaler와 같은 평균/모표준편차)"""
+        if scaler_type != 'standard':
             raise ValueError("Invalid scaler type. Choose 'standard'.")
         
-        self.df[self.df.select_dtypes(include='number').columns] = scaler.fit_transform(self.df.select_dtypes(include='number'))
+        num_cols = self.df.select_dtypes(include='number').columns
+        X = self._numeric_block(num_cols)
+        mean, std = scale_stats(column_moments(X), len(X))
+        self.df[num_cols] = impute_scale(X, mean=mean, std=std)
+        self.scale_mean = dict(zip(num_cols, mean))
+        self.scale_std = dict(zip(num_cols, std))
+    
+    def impute_and_scale(self, strategy='mean', scaler_type='standard', remove_outliers_cols=None, threshold=1.5):
+        """
+        결측치 처리 → (이상치 제거) → 스케일링을 수치형 블록 하나에서 이어서 처리.
+        handle_missing_values/remove_outliers/scale_data를 차례로 부른 것과 같은 결과지만
+        수치형 데이터를 한 번만 추출/기록하고, 이상치 제거가 없으면 대체와 스케일링을 한 번의 순회로 적용합니다.
+        """
+        if scaler_type not in (None, 'standard'):
+            raise ValueError("Invalid scaler type. Choose 'standard'.")
+        num_cols = self.df.select_dtypes(include='number').columns
+        cat_cols = self.df.select_dtypes(exclude='number').columns
+        X = self._numeric_block(num_cols)
+        self.numeric_cols = list(num_cols)
+        
+        if remove_outliers_cols:
+            cols = [remove_outliers_cols] if isinstance(remove_outliers_cols, str) else list(remove_outliers_cols)
+            positions = num_cols.get_indexer(cols)
+            if (positions < 0).any():
+                raise ValueError(f"Outlier columns must be numeric: {[col for col, i in zip(cols, positions) if i < 0]}")
+            fill = fit_fill_values(X, strategy)
+            impute_scale(X, fill=fill)
+            self.fill_values = dict(zip(num_cols, fill))
+            self._impute_categorical(cat_cols)
+            imputed = pd.DataFrame(X[:, positions], columns=cols, index=self.df.index)
+            self.outlier_report = detect_outliers(imputed, cols, threshold=threshold)
+            self.bounds = self.outlier_report.bounds
+            keep = self.outlier_report.inliers
+            self.df = self.df.loc[keep].copy()
+            X = X[keep]
+            if scaler_type:
+                mean, std = scale_stats(column_moments(X), len(X))
+                impute_scale(X, mean=mean, std=std)
+        else:
+            X, fill, mean, std = fit_impute_scale(X, strategy, scale=bool(scaler_type))
+            self.fill_values = dict(zip(num_cols, fill))
+            self._impute_categorical(cat_cols)
+        
+        self.df[num_cols] = X
+        if scaler_type:
+            self.scale_mean = dict(zip(num_cols, mean))
+            self.scale_std = dict(zip(num_cols, std))
     
     def drop_columns(self, columns):
         """불필요한 컬럼 제거 (컬럼이 있을 때만 제거)"""
         # 존재하는 컬럼만 제거하도록 체크
         self.df = self.df.drop([col for col in columns if col in self.df.columns], axis=1)
     
-    def preprocess(self, missing_strategy='mean', remove_outliers_cols=None, scale_type='standard', drop_columns=None):
-        """전처리 전체 파이프라인"""
-        self.clean_column_names()
-        self.handle_missing_values(strategy=missing_strategy)
-        
-        if remove_outliers_cols:
-            for col in remove_outliers_cols:
-                self.remove_outliers(col)
+    def _stage(self, profiler, name):
+        """profiler(PipelineProfiler)가 주어지면 단계별 시간/메모리/행·열 수 기록"""
+        if profiler is None:
+            return nullcontext()
+        return profiler.stage(name, lambda: self.df)
+    
+    def preprocess(self, missing_strategy='mean', remove_outliers_cols=None, scale_type='standard', drop_columns=None, optimize_memory=False, profiler=None, fused=True):
+        """
+        전처리 전체 파이프라인 (fused=True면 결측치/이상치/스케일링을 수치형 블록 하나에서 처리).
+        optimize_memory=True면 결과에 메모리 최적화 적용 (대체/스케일링이 수치형을 float64로 다시 쓰므로 마지막에 수행,
+        스케일된 실수 컬럼은 float32로 바꾸면 값이 달라져 대부분 float64로 남음)
+        """
+        with self._stage(profiler, 'clean_column_names'):
+            self.clean_column_names()
         
-        if scale_type:
-            self.scale_data(scaler_type=scale_type)
+        if fused:
+            with self._stage(profiler, 'impute_and_scale'):
+                self.impute_and_scale(strategy=missing_strategy, scaler_type=scale_type, remove_outliers_cols=remove_outliers_cols)
+        else:
+            with self._stage(profiler, 'handle_missing_values'):
+                self.handle_missing_values(strategy=missing_strategy)
+            
+            if remove_outliers_cols:
+                with self._stage(profiler, 'remove_outliers'):
+                    self.remove_outliers(remove_outliers_cols)
+            
+            if scale_type:
+                with self._stage(profiler, 'scale_data'):
+                    self.scale_data(scaler_type=scale_type)
         
         if drop_columns:
-            self.drop_columns(drop_columns)
+            with self._stage(profiler, 'drop_columns'):
+                self.drop_columns(drop_columns)
+        
+        if optimize_memory:
+            with self._stage(profiler, 'optimize_output'):
+                self.optimize_memory()
 
+        self.plan = self.fitted_plan(outliers=bool(remove_outliers_cols), scaled=bool(scale_type), drop_columns=drop_columns)
         return self.df
+
+    @staticmethod
+    def preprocess_chunks(source, output_path=None, chunksize=100_000, missing_strategy='mean', remove_outliers_cols=None, scale_type='standard', drop_columns=None):
+        """메모리보다 큰 데이터용 청크 단위 전처리 (CSV/Parquet 경로 또는 청크 목록)"""
+        return ChunkedPreprocessor(chunksize=chunksize).preprocess(
+            source,
+            output_path=output_path,
+            missing_strategy=missing_strategy,
+            remove_outliers_cols=remove_outliers_cols,
+            scale_type=scale_type,
+            drop_columns=drop_columns
+        )
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+
+
+def _downcast_numeric(series):
+    """정수는 범위에 맞는 가장 작은 타입으로, 실수는 float32로 바꿔도 값이 그대로일 때만 변환"""
+    if pd.api.types.is_integer_dtype(series):
+        kind = 'unsigned' if len(series) and series.min() >= 0 else 'integer'
+        return pd.to_numeric(series, downcast=kind)
+    if pd.api.types.is_float_dtype(series) and series.dtype != 'float32':
+        values = series.to_numpy()
+        downcast = values.astype('float32')
+        if np.array_equal(downcast.astype(values.dtype), values, equal_nan=True):
+            return pd.Series(downcast, index=series.index, name=series.name)
+    return series
+
+
+def optimize_memory(df, category_threshold=0.5, max_categories=1000):
+    """
+    데이터프레임 메모리 최적화:
+    - 수치형 컬럼은 값 손실 없이 더 작은 타입으로 downcast
+    - 고유값 비율이 category_threshold 이하(최대 max_categories개)인 object 컬럼은 category로 변환
+
+    Returns:
+        (pd.DataFrame, pd.DataFrame): 최적화된 데이터프레임, 컬럼별 변환 전후 dtype/바이트 리포트
+    """
+    optimized = {}
+    report = {}
+    for col in df.columns:
+        series = df[col]
+        before = series.memory_usage(deep=True, index=False)
+        if pd.api.types.is_bool_dtype(series):
+            converted = series
+        elif pd.api.types.is_numeric_dtype(series):
+            converted = _downcast_numeric(series)
+        elif series.dtype == object:
+            n_unique = series.nunique(dropna=True)
+            if len(series) and n_unique <= max_categories and n_unique / len(series) <= category_threshold:
+                converted = series.astype('category')
+            else:
+                converted = series
+        else:
+            converted = series
+        optimized[col] = converted
+        report[col] = {
+            'dtype_before': str(series.dtype),
+            'dtype_after': str(converted.dtype),
+            'bytes_before': before,
+            'bytes_after': converted.memory_usage(deep=True, index=False),
+        }
+
+    result = pd.DataFrame(optimized, index=df.index)
+    report = pd.DataFrame.from_dict(report, orient='index')
+    report['saved_pct'] = (1 - report['bytes_after'] / report['bytes_before'].where(report['bytes_before'] > 0)).fillna(0) * 100
+    return result, report
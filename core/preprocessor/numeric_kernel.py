@@ -0,0 +1,107 @@
+import warnings
+
+import numpy as np
+
+# 행 타일 하나의 목표 크기: 타일이 캐시에 머무는 동안 대체/중심화/나눗셈을 이어서 적용
+TILE_BYTES = 1 << 20
+
+
+def _tiles(X):
+    """행 타일 슬라이스 (컬럼 수에 맞춰 타일 크기 조정)"""
+    rows = max(1, TILE_BYTES // (8 * max(X.shape[1], 1)))
+    for start in range(0, len(X), rows):
+        yield slice(start, start + rows)
+
+
+def column_moments(X):
+    """NaN을 제외한 컬럼별 (개수, 평균, 편차제곱합)을 행 타일 단위 한 번의 순회로 계산 (타일 결과는 Chan 공식으로 병합)"""
+    p = X.shape[1]
+    count, mean, m2 = np.zeros(p), np.zeros(p), np.zeros(p)
+    for rows in _tiles(X):
+        tile = X[rows]
+        n = (~np.isnan(tile)).sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            tile_mean = np.where(n > 0, np.nansum(tile, axis=0) / np.maximum(n, 1), 0.0)
+            tile_m2 = np.nansum((tile - tile_mean) ** 2, axis=0)
+        total = count + n
+        delta = tile_mean - mean
+        mean = mean + delta * n / np.maximum(total, 1)
+        m2 = m2 + tile_m2 + delta ** 2 * count * n / np.maximum(total, 1)
+        count = total
+    return count, mean, m2
+
+
+def fit_fill_values(X, strategy='mean', moments=None):
+    """컬럼별 결측 대체값 ('mean'은 moments 재사용, 그 외 전략은 SimpleImputer와 동일)"""
+    if strategy == 'mean':
+        count, mean, _ = column_moments(X) if moments is None else moments
+        return np.where(count > 0, mean, np.nan)
+    if strategy == 'median':
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            return np.nanmedian(X, axis=0) if len(X) else np.full(X.shape[1], np.nan)
+    from sklearn.impute import SimpleImputer
+
+    return SimpleImputer(strategy=strategy, keep_empty_features=True).fit(X).statistics_
+
+
+def scale_stats(moments, n_rows, fill=None):
+    """
+    결측치를 fill로 채운 뒤의 평균/표준편차(모표준편차, StandardScaler와 같음)를
+    데이터를 다시 읽지 않고 원래 적률에서 바로 계산. 분산이 0인 컬럼의 scale은 1
+    """
+    count, mean, m2 = moments
+    if fill is not None:
+        missing = n_rows - count
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = np.where(missing > 0, fill - mean, 0.0)
+            mean = mean + delta * missing / max(n_rows, 1)
+            m2 = m2 + delta ** 2 * count * missing / max(n_rows, 1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        std = np.sqrt(m2 / n_rows)
+    std = np.where(np.isfinite(std) & (std > 0), std, 1.0)
+    return mean, std
+
+
+def impute_scale(X, fill=None, mean=None, std=None, copy=False):
+    """
+    결측 대체와 표준화를 행 타일마다 이어서 적용 (데이터 전체를 한 번만 순회).
+
+    Args:
+        X (np.ndarray): 2차원 수치형 블록
+        fill, mean, std (np.ndarray, optional): 컬럼별 대체값 / 평균 / 표준편차 (None이면 해당 단계 생략)
+        copy (bool): False면 X를 그대로 덮어씀 (float64 쓰기 가능 배열이어야 함),
+            True면 X는 건드리지 않고 결과용 버퍼 하나에만 기록
+
+    Returns:
+        np.ndarray: 변환된 블록
+    """
+    if copy:
+        out = np.empty(X.shape, dtype='float64')
+    else:
+        if X.dtype != np.float64 or not X.flags.writeable:
+            raise ValueError("In-place transform requires a writeable float64 array. Use copy=True.")
+        out = X
+    for rows in _tiles(X):
+        tile = out[rows]
+        if out is not X:
+            tile[...] = X[rows]
+        if fill is not None:
+            np.copyto(tile, fill, where=np.isnan(tile))
+        if mean is not None:
+            tile -= mean
+            tile /= std
+    return out
+
+
+def fit_impute_scale(X, strategy='mean', scale=True, copy=False):
+    """
+    대체값과 평균/표준편차를 한 번의 적률 계산으로 함께 구하고, 대체+표준화를 한 번의 순회로 적용.
+
+    Returns:
+        (np.ndarray, np.ndarray, np.ndarray, np.ndarray): 변환된 블록, 대체값, 평균, 표준편차 (scale=False면 평균/표준편차는 None)
+    """
+    moments = column_moments(X)
+    fill = fit_fill_values(X, strategy, moments=moments)
+    mean, std = scale_stats(moments, len(X), fill=fill) if scale else (None, None)
+    return impute_scale(X, fill=fill, mean=mean, std=std, copy=copy), fill, mean, std
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+
+def iqr_bounds(df, columns, threshold=1.5, quartiles=None):
+    """여러 컬럼의 IQR 경계를 한 번의 quantile 호출로 계산 (quartiles=(Q1, Q3)을 주면 재사용)"""
+    columns = list(columns)
+    if quartiles is None:
+        q = df[columns].quantile([0.25, 0.75])
+        Q1, Q3 = q.iloc[0], q.iloc[1]
+    else:
+        Q1, Q3 = (pd.Series(quartile).reindex(columns) for quartile in quartiles)
+    IQR = Q3 - Q1
+    return pd.DataFrame({'lower': Q1 - threshold * IQR, 'upper': Q3 + threshold * IQR}, index=columns)
+
+
+def _block(df, bounds):
+    values = df[list(bounds.index)].to_numpy(dtype='float64', na_value=np.nan)
+    return values, bounds['lower'].to_numpy(dtype='float64'), bounds['upper'].to_numpy(dtype='float64')
+
+
+def inlier_mask(df, bounds):
+    """모든 컬럼 값이 경계 안에 있는 행 (결측치는 기존 remove_outliers처럼 제외)"""
+    values, lower, upper = _block(df, bounds)
+    return ((values >= lower) & (values <= upper)).all(axis=1)
+
+
+class OutlierReport:
+    """다중 컬럼 이상치 탐지 결과: 컬럼별 개수, 행 위치, 제한된 개수의 표본 값"""
+
+    def __init__(self, df, bounds, sample_size=20, random_state=42):
+        values, lower, upper = _block(df, bounds)
+        outside = (values < lower) | (values > upper)
+        self.bounds = bounds
+        self.columns = list(bounds.index)
+        self.index = df.index
+        self.counts = pd.Series(outside.sum(axis=0), index=self.columns)
+        self.outlier_rows = outside.any(axis=1)
+        self.inliers = ~self.outlier_rows & ~np.isnan(values).any(axis=1)
+        self.positions = {}
+        self.sample_positions = {}
+        self.samples = {}
+        rng = np.random.default_rng(random_state)
+        for i, col in enumerate(self.columns):
+            positions = np.flatnonzero(outside[:, i])
+            self.positions[col] = positions
+            if len(positions) > sample_size:
+                positions = np.sort(rng.choice(positions, sample_size, replace=False))
+            self.sample_positions[col] = positions
+            self.samples[col] = values[positions, i].tolist()
+
+    def indices(self, col):
+        """이상치 행의 인덱스 라벨"""
+        return self.index[self.positions[col]]
+
+    def to_dict(self):
+        """JSON으로 저장 가능한 요약 (인덱스/값은 표본만, 전체 인덱스는 indices(col))"""
+        return {
+            col: {
+                'outlier_count': int(self.counts[col]),
+                'outlier_indices': self.index[self.sample_positions[col]].tolist(),
+                'outlier_values': self.samples[col]
+            }
+            for col in self.columns
+        }
+
+
+def detect_outliers(df, columns, threshold=1.5, bounds=None, sample_size=20, random_state=42):
+    """IQR 기준 이상치 탐지 (하나의 결합 마스크, 표본 값은 컬럼당 sample_size개까지)"""
+    if bounds is None:
+        bounds = iqr_bounds(df, columns, threshold=threshold)
+    return OutlierReport(df, bounds, sample_size=sample_size, random_state=random_state)
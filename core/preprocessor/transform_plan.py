@@ -0,0 +1,132 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+
+def _to_builtin(value):
+    """JSON 저장용으로 numpy 스칼라/NaN을 파이썬 기본 타입으로 변환"""
+    if hasattr(value, 'item'):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
+
+class TransformPlan:
+    """
+    학습된 전처리 계획: 컬럼명 변경, 결측 대체값, 이상치 경계, 스케일러 평균/표준편차.
+    한 번 학습한 통계를 새 데이터(단일 행 또는 마이크로 배치)에 NumPy 연산 한 번으로 적용합니다.
+    """
+
+    def __init__(self, renames=None, numeric_cols=None, fill_values=None, bounds=None, scale_mean=None, scale_std=None, drop_columns=None):
+        self.renames = dict(renames or {})
+        self.numeric_cols = list(numeric_cols or [])
+        self.fill_values = dict(fill_values or {})
+        if isinstance(bounds, pd.DataFrame):
+            bounds = {col: (row['lower'], row['upper']) for col, row in bounds.iterrows()}
+        self.bounds = {col: tuple(bound) for col, bound in (bounds or {}).items()}
+        self.scale_mean = dict(scale_mean or {})
+        self.scale_std = dict(scale_std or {})
+        self.drop_columns = list(drop_columns or [])
+        self._compile()
+
+    def _compile(self):
+        """적용 시 파이썬 루프가 없도록 컬럼 순서대로 배열을 미리 만들어 둠"""
+        cols = self.numeric_cols
+        self._num_index = {col: i for i, col in enumerate(cols)}
+        self._fill = np.array([self.fill_values.get(col, np.nan) for col in cols], dtype='float64')
+        self._lower = np.array([self.bounds.get(col, (-np.inf, np.inf))[0] for col in cols], dtype='float64')
+        self._upper = np.array([self.bounds.get(col, (-np.inf, np.inf))[1] for col in cols], dtype='float64')
+        self._mean = np.array([self.scale_mean.get(col, 0.0) for col in cols], dtype='float64')
+        self._std = np.array([self.scale_std.get(col, 1.0) for col in cols], dtype='float64')
+        self._cat_fill = {col: value for col, value in self.fill_values.items() if col not in self._num_index}
+
+    def transform_array(self, X, copy=True):
+        """
+        numeric_cols 순서의 2차원 배열에 결측 대체 → 이상치 판정 → 스케일링 적용.
+
+        Returns:
+            (np.ndarray, np.ndarray): 변환된 배열, 이상치가 아닌 행 마스크
+        """
+        X = np.array(X, dtype='float64') if copy else np.asarray(X, dtype='float64')
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        np.copyto(X, self._fill, where=np.isnan(X))
+        keep = ((X >= self._lower) & (X <= self._upper)).all(axis=1) if self.bounds else np.ones(len(X), dtype=bool)
+        if self.scale_mean:
+            X -= self._mean
+            X /= self._std
+        return X, keep
+
+    def transform(self, df):
+        """DataFrame 변환 (preprocess와 같은 결과, 이상치 행은 제거)"""
+        df = df.rename(columns=self.renames)
+        if self._cat_fill:
+            df = df.fillna(self._cat_fill)
+        else:
+            df = df.copy()
+        if self.numeric_cols:
+            X, keep = self.transform_array(df[self.numeric_cols].to_numpy(dtype='float64'))
+            df[self.numeric_cols] = X
+            if self.bounds:
+                df = df[keep]
+        return df.drop([col for col in self.drop_columns if col in df.columns], axis=1)
+
+    def transform_records(self, records):
+        """dict 행(들) 변환 (서빙용, pandas를 거치지 않음). 이상치 행은 결과에서 제외"""
+        if isinstance(records, dict):
+            records = [records]
+        records = [{self.renames.get(key, key): value for key, value in record.items()} for record in records]
+        X = np.array([[record.get(col, np.nan) for col in self.numeric_cols] for record in records], dtype='float64').reshape(len(records), -1)
+        X, keep = self.transform_array(X, copy=False)
+        drop = set(self.drop_columns)
+        results = []
+        for record, row, kept in zip(records, X, keep):
+            if not kept:
+                continue
+            out = {}
+            for key, value in record.items():
+                if key in drop:
+                    continue
+                if key in self._num_index:
+                    value = row[self._num_index[key]]
+                elif key in self._cat_fill and pd.isna(value):
+                    value = self._cat_fill[key]
+                out[key] = value
+            results.append(out)
+        return results
+
+    def to_dict(self):
+        return {
+            'renames': self.renames,
+            'numeric_cols': self.numeric_cols,
+            'fill_values': {col: _to_builtin(value) for col, value in self.fill_values.items()},
+            'bounds': {col: [_to_builtin(lower), _to_builtin(upper)] for col, (lower, upper) in self.bounds.items()},
+            'scale_mean': {col: _to_builtin(value) for col, value in self.scale_mean.items()},
+            'scale_std': {col: _to_builtin(value) for col, value in self.scale_std.items()},
+            'drop_columns': self.drop_columns,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        fill_values = {col: (np.nan if value is None else value) for col, value in data.get('fill_values', {}).items()}
+        return cls(
+            renames=data.get('renames'),
+            numeric_cols=data.get('numeric_cols'),
+            fill_values=fill_values,
+            bounds=data.get('bounds'),
+            scale_mean=data.get('scale_mean'),
+            scale_std=data.get('scale_std'),
+            drop_columns=data.get('drop_columns')
+        )
+
+    def save(self, path):
+        """JSON 파일로 저장"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
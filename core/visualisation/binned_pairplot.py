@@ -0,0 +1,97 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from matplotlib.colors import LogNorm
+
+from ..eda.correlation import correlation
+
+# 이보다 행이 많으면 sns.pairplot 대신 구간화 모드를 자동 사용
+LARGE_DATA_ROWS = 50_000
+
+
+def use_binned_mode(df, columns, max_columns=6):
+    """행 수나 컬럼 수가 커서 구간화 쌍플롯을 써야 하는지 여부"""
+    return len(df) > LARGE_DATA_ROWS or len(columns) > max_columns
+
+
+def select_pair_columns(df, columns=None, max_columns=6, select_by='variance'):
+    """쌍플롯 컬럼 자동 제한: 분산(표준화 전) 또는 평균 |상관|이 큰 max_columns개"""
+    columns = list(df.select_dtypes(include='number').columns if columns is None else columns)
+    if len(columns) <= max_columns:
+        return columns
+    if select_by == 'variance':
+        score = df[columns].var()
+    elif select_by == 'correlation':
+        score = correlation(df, columns=columns).abs().mean()
+    else:
+        raise ValueError("Invalid select_by. Choose 'variance' or 'correlation'.")
+    return list(score.sort_values(ascending=False).index[:max_columns])
+
+
+def stratified_sample(df, n_rows, hue=None, random_state=42):
+    """행 예산 n_rows 안에서 hue 그룹 비율을 유지하는 층화 샘플링"""
+    if len(df) <= n_rows:
+        return df
+    if hue is None:
+        return df.sample(n=n_rows, random_state=random_state)
+    frac = n_rows / len(df)
+    return df.groupby(hue, group_keys=False, observed=True).sample(frac=frac, random_state=random_state)
+
+
+def _bin_codes(values, bins):
+    """컬럼 값을 구간 번호로 변환 (양쪽 0.1% 꼬리는 끝 구간으로 모음)"""
+    finite = values[np.isfinite(values)]
+    if finite.size == 0:
+        return np.full(values.shape, -1), np.linspace(0, 1, bins + 1)
+    lo, hi = np.percentile(finite, [0.1, 99.9])
+    if hi <= lo:
+        lo, hi = finite.min(), finite.max() + 1e-9
+    edges = np.linspace(lo, hi, bins + 1)
+    valid = np.isfinite(values)
+    codes = np.clip(((np.where(valid, values, lo) - lo) / (hi - lo) * bins).astype(np.int64), 0, bins - 1)
+    return np.where(valid, codes, -1), edges
+
+
+def binned_pairplot(df, columns=None, hue=None, row_budget=1_000_000, max_columns=6, bins=50, select_by='variance', random_state=42):
+    """
+    대용량 쌍플롯: 비대각은 2D 히스토그램(bincount 한 번), 대각은 hue별 1D 히스토그램.
+    렌더링 비용이 행 수가 아니라 bins²에 비례합니다.
+
+    Returns:
+        matplotlib.figure.Figure
+    """
+    columns = select_pair_columns(df, columns, max_columns=max_columns, select_by=select_by)
+    data = stratified_sample(df[columns + ([hue] if hue else [])], row_budget, hue=hue, random_state=random_state)
+    values = data[columns].to_numpy(dtype='float64', na_value=np.nan)
+    binned = [_bin_codes(values[:, i], bins) for i in range(len(columns))]
+
+    k = len(columns)
+    fig, axes = plt.subplots(k, k, figsize=(2.5 * k, 2.5 * k), squeeze=False)
+    groups = [(None, np.ones(len(data), dtype=bool))]
+    if hue:
+        hue_values = data[hue].to_numpy()
+        groups = [(level, hue_values == level) for level in pd.unique(data[hue].dropna())]
+
+    for i in range(k):
+        codes_i, edges_i = binned[i]
+        for j in range(k):
+            ax = axes[i, j]
+            if i == j:
+                centers = (edges_i[:-1] + edges_i[1:]) / 2
+                for level, mask in groups:
+                    selected = codes_i[mask & (codes_i >= 0)]
+                    ax.step(centers, np.bincount(selected, minlength=bins), where='mid', label=level)
+            else:
+                codes_j, edges_j = binned[j]
+                valid = (codes_i >= 0) & (codes_j >= 0)
+                counts = np.bincount(codes_i[valid] * bins + codes_j[valid], minlength=bins * bins).reshape(bins, bins)
+                if counts.any():
+                    ax.pcolormesh(edges_j, edges_i, np.ma.masked_equal(counts, 0), norm=LogNorm(), cmap='viridis')
+            if i == k - 1:
+                ax.set_xlabel(columns[j])
+            if j == 0:
+                ax.set_ylabel(columns[i])
+    if hue and k:
+        axes[0, 0].legend(title=hue, fontsize='small')
+    fig.tight_layout()
+    return fig
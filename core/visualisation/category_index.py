@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+
+
+class CategoryIndex:
+    """
+    범주 필터 인덱스: 범주 컬럼을 한 번만 factorize/정렬해 두고
+    범주별 행 위치를 O(1) 슬라이스로 반환합니다. 필터를 바꿀 때마다 전체 행을 스캔하지 않습니다.
+    히스토그램/범주 개수 같은 탭 집계는 처음 요청될 때 모든 범주에 대해 한 번에 계산해 둡니다.
+    """
+
+    def __init__(self, df, column, bins=20):
+        self.df = df
+        self.column = column
+        self.bins = bins
+        codes, uniques = pd.factorize(df[column])
+        self.values = list(uniques)
+        self._code = {value: code for code, value in enumerate(self.values)}
+        # 결측 범주(-1)는 마지막 그룹으로 보냄
+        self._codes = np.where(codes < 0, len(self.values), codes)
+        self._order = np.argsort(self._codes, kind='stable')
+        counts = np.bincount(self._codes, minlength=len(self.values) + 1)
+        self._offsets = np.concatenate([[0], np.cumsum(counts)])
+        self.counts = pd.Series(counts[:-1], index=pd.Index(self.values, name=column), name='count')
+        self._histograms = None
+
+    def __len__(self):
+        return len(self.values)
+
+    def positions(self, value):
+        """범주 값의 행 위치 (value가 None이면 전체)"""
+        if value is None:
+            return np.arange(len(self.df))
+        code = self._code[value]
+        return self._order[self._offsets[code]:self._offsets[code + 1]]
+
+    def frame(self, value):
+        """범주 값으로 필터링한 데이터프레임 (value가 None이면 원본 그대로)"""
+        if value is None:
+            return self.df
+        return self.df.take(self.positions(value))
+
+    def top_counts(self, value, top_n=10):
+        """필터 적용 시 범주 컬럼의 상위 빈도 (미리 계산된 개수 사용)"""
+        counts = self.counts if value is None else self.counts.loc[[value]]
+        return counts.sort_values(ascending=False, kind='stable').head(top_n)
+
+    def histograms(self, value):
+        """
+        숫자형 컬럼별 (개수, 구간 경계). 구간은 전체 데이터 기준으로 고정하고,
+        범주 x 구간 개수를 bincount 한 번으로 미리 계산해 둡니다.
+        """
+        if self._histograms is None:
+            self._histograms = self._build_histograms()
+        group = slice(None) if value is None else self._code[value]
+        return {
+            col: (counts[group].sum(axis=0) if value is None else counts[group], edges)
+            for col, (counts, edges) in self._histograms.items()
+        }
+
+    def _build_histograms(self):
+        n_groups = len(self.values) + 1
+        result = {}
+        for col in self.df.select_dtypes(include='number').columns:
+            values = self.df[col].to_numpy(dtype='float64', na_value=np.nan)
+            valid = np.isfinite(values)
+            if not valid.any():
+                result[col] = (np.zeros((n_groups, self.bins), dtype=np.int64), np.linspace(0, 1, self.bins + 1))
+                continue
+            lo, hi = values[valid].min(), values[valid].max()
+            edges = np.histogram_bin_edges([lo, hi], bins=self.bins)
+            bin_codes = np.clip(np.searchsorted(edges, values[valid], side='right') - 1, 0, self.bins - 1)
+            counts = np.bincount(self._codes[valid] * self.bins + bin_codes, minlength=n_groups * self.bins)
+            result[col] = (counts.reshape(n_groups, self.bins), edges)
+        return result
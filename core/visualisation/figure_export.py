@@ -0,0 +1,133 @@
+"""
+헤드리스 그림 일괄 내보내기 (Jupyter/ipywidgets 없이 야간 리포트 작업용).
+
+    python -m core.visualisation.figure_export data.parquet reports/ --formats png svg --n-jobs 4
+"""
+import argparse
+import os
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+import pandas as pd
+
+# 워커 프로세스별 데이터 (초기화 시 한 번만 전달/로드)
+_WORKER_DATA = {}
+
+# kind -> visualization_setup 함수 이름 (show=False로 호출)
+PLOT_KINDS = {
+    'histograms': 'plot_numeric_columns',
+    'heatmap': 'plot_correlation_heatmap',
+    'top_categories': 'plot_top_categories',
+    'pairplot': 'plot_pairplot',
+}
+
+DEFAULT_SPECS = [
+    {'kind': 'histograms', 'name': 'numeric_histograms'},
+    {'kind': 'heatmap', 'name': 'correlation_heatmap'},
+    {'kind': 'pairplot', 'name': 'pairplot'},
+    {'kind': 'eda', 'method': 'missing_values_visual', 'name': 'missing_values'},
+]
+
+
+def load_frame(source):
+    """데이터프레임 또는 파일 경로(.parquet/.feather/.csv)"""
+    if isinstance(source, pd.DataFrame):
+        return source
+    if source.endswith('.parquet'):
+        return pd.read_parquet(source)
+    if source.endswith('.feather'):
+        return pd.read_feather(source)
+    return pd.read_csv(source)
+
+
+def _init_worker(source):
+    matplotlib.use('Agg')
+    warnings.filterwarnings('ignore', message='.*non-interactive.*')
+    _WORKER_DATA['df'] = load_frame(source)
+
+
+def _draw(spec, df):
+    """spec 하나를 현재 pyplot 상태에 그리기"""
+    kind = spec['kind']
+    options = spec.get('options', {})
+    if kind == 'eda':
+        from ..eda.eda_setup import EDA
+
+        getattr(EDA(df), spec['method'])(**options)
+    elif kind in PLOT_KINDS:
+        from . import visualization_setup
+
+        getattr(visualization_setup, PLOT_KINDS[kind])(df, show=False, **options)
+    else:
+        raise ValueError("Invalid plot kind. Choose 'histograms', 'heatmap', 'top_categories', 'pairplot' or 'eda'.")
+
+
+def _render_spec(position, spec, output_dir, formats, dpi):
+    """워커에서 spec 하나를 렌더링해 파일로 저장하고, 그린 그림은 모두 닫음"""
+    import matplotlib.pyplot as plt
+
+    name = spec.get('name') or f"{position:02d}_{spec.get('method', spec['kind'])}"
+    start = time.perf_counter()
+    paths, error = [], None
+    try:
+        _draw(spec, _WORKER_DATA['df'])
+        # 빈 그림(예: sns.pairplot 전에 만든 plt.figure)은 건너뜀
+        figures = [plt.figure(num) for num in plt.get_fignums() if plt.figure(num).axes]
+        for k, fig in enumerate(figures):
+            suffix = f'_{k + 1}' if len(figures) > 1 else ''
+            for fmt in formats:
+                path = os.path.join(output_dir, f'{name}{suffix}.{fmt}')
+                fig.savefig(path, format=fmt, dpi=dpi, bbox_inches='tight')
+                paths.append(path)
+    except Exception as exc:
+        error = f'{type(exc).__name__}: {exc}'
+    finally:
+        plt.close('all')
+    return {'name': name, 'kind': spec['kind'], 'paths': paths, 'seconds': time.perf_counter() - start, 'error': error}
+
+
+def export_figures(source, specs=None, output_dir='figures', formats=('png',), n_jobs=None, dpi=100):
+    """
+    plot spec 목록을 Agg 백엔드 워커 프로세스에서 병렬로 그려 output_dir에 PNG/SVG로 저장.
+
+    Args:
+        source (pd.DataFrame | str): 데이터프레임 또는 파일 경로 (경로면 각 워커가 직접 읽음)
+        specs (list[dict]): {'kind': 'histograms'|'heatmap'|'top_categories'|'pairplot', 'options': {...}}
+            또는 {'kind': 'eda', 'method': 'plot_kde', 'options': {...}}. 'name'은 파일 이름 (선택)
+        formats (tuple): 'png', 'svg' 등 저장 형식
+        n_jobs (int, optional): 워커 수 (기본: spec 수와 CPU 수 중 작은 값)
+
+    Returns:
+        pd.DataFrame: spec별 저장 경로, 소요 시간, 오류
+    """
+    specs = DEFAULT_SPECS if specs is None else specs
+    os.makedirs(output_dir, exist_ok=True)
+    n_jobs = n_jobs or min(len(specs), os.cpu_count() or 1) or 1
+    with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker, initargs=(source,)) as executor:
+        futures = [
+            executor.submit(_render_spec, position, spec, output_dir, tuple(formats), dpi)
+            for position, spec in enumerate(specs)
+        ]
+        results = pd.DataFrame([future.result() for future in futures])
+
+    failed = results['error'].notna().sum() if len(results) else 0
+    print(f"✅ [Export] {len(results) - failed}/{len(results)} plots saved to {output_dir}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export default EDA/visualization figures without Jupyter.')
+    parser.add_argument('source', help='Input data (.parquet, .feather or .csv)')
+    parser.add_argument('output_dir')
+    parser.add_argument('--formats', nargs='+', default=['png'])
+    parser.add_argument('--n-jobs', type=int, default=None)
+    parser.add_argument('--dpi', type=int, default=100)
+    args = parser.parse_args()
+    results = export_figures(args.source, output_dir=args.output_dir, formats=args.formats, n_jobs=args.n_jobs, dpi=args.dpi)
+    print(results[['name', 'seconds', 'error']].to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,208 @@
+import io
+import os
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import nullcontext
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import matplotlib.pyplot as plt
+import pandas as pd
+
+from ..eda.fingerprint import frame_fingerprint
+
+_MISSING = object()
+_EXECUTOR = None
+# 렌더링 프로세스에서 재사용하는 데이터프레임: 파일 경로 -> {'df', 'memo'} (최근 것 몇 개만 유지)
+_FRAMES = OrderedDict()
+_MAX_FRAMES = 2
+_FRAMES_LOCK = threading.Lock()
+# 렌더링 프로세스는 Agg 백엔드를 유지해야 하므로 스타일로 넘기지 않는 설정
+_SKIP_RC = ('backend', 'backend_fallback', 'interactive')
+
+
+class PlotCache:
+    """(탭, 필터 값, 데이터 지문) -> PNG 바이트 LRU 캐시 (스레드 안전)"""
+
+    def __init__(self, max_entries=32):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key, png):
+        with self._lock:
+            self._entries[key] = png
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# plot_all_tabs 호출 간에 공유되는 기본 캐시
+DEFAULT_CACHE = PlotCache()
+
+
+def _init_render_worker():
+    # 렌더링 프로세스는 화면 없이 PNG만 만들면 되므로 노트북 백엔드 대신 Agg 사용
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def _default_executor(reset=False):
+    """
+    pyplot 전역 상태는 스레드 안전하지 않아 노트북 메인 스레드와 같은 프로세스에서 그리면 서로의 그림을 건드리므로,
+    별도 프로세스 하나에서 렌더링을 직렬화 (spawn: 노트북 커널의 스레드를 fork하지 않음)
+    """
+    global _EXECUTOR
+    if _EXECUTOR is None or reset:
+        _EXECUTOR = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'), initializer=_init_render_worker)
+    return _EXECUTOR
+
+
+def render_png(plot_func, kwargs):
+    """plot_func가 그린 그림을 PNG 바이트로 렌더링하고 닫음 (그린 그림이 없으면 None)"""
+    before = set(plt.get_fignums())
+    result = plot_func(**kwargs)
+    created = [num for num in plt.get_fignums() if num not in before]
+    try:
+        if isinstance(result, io.BytesIO):
+            return result.getvalue()
+        if not created:
+            return None
+        buf = io.BytesIO()
+        plt.figure(created[-1]).savefig(buf, format='png', bbox_inches='tight')
+        return buf.getvalue()
+    finally:
+        for num in created:
+            plt.close(num)
+
+
+def plot_style():
+    """현재 프로세스의 그림 스타일 (setup_plotting/seaborn 테마가 바꾼 rcParams 포함)"""
+    return {key: value for key, value in plt.rcParams.items() if key not in _SKIP_RC}
+
+
+def _load_frame(path):
+    """렌더링 프로세스에서 데이터프레임 파일을 한 번만 읽어 두고 재사용"""
+    with _FRAMES_LOCK:
+        entry = _FRAMES.get(path)
+        if entry is None:
+            entry = {'df': pd.read_pickle(path), 'memo': {}}
+            _FRAMES[path] = entry
+            while len(_FRAMES) > _MAX_FRAMES:
+                _FRAMES.popitem(last=False)
+        _FRAMES.move_to_end(path)
+        return entry
+
+
+def render_tab(source, build_plot, options, tab, filter_value, rc=None):
+    """
+    렌더링 쪽에서 build_plot(df, tab, filter_value, memo, **options)로 (plot_func, kwargs)를 만들어 PNG로 렌더링.
+    source는 데이터프레임 파일 경로(프로세스 실행기) 또는 {'df', 'memo'} 딕셔너리(같은 프로세스 실행기)입니다.
+    """
+    entry = _load_frame(source) if isinstance(source, str) else source
+    with plt.rc_context(rc) if rc is not None else nullcontext():
+        request = build_plot(entry['df'], tab, filter_value, entry['memo'], **options)
+        return None if request is None else render_png(*request)
+
+
+class TabRenderer:
+    """
+    탭 지연 렌더링: 요청된 탭만 백그라운드(기본: 렌더링 전용 프로세스 1개)에서 그리고,
+    결과 PNG를 (탭, 필터 값, 데이터 지문) 키로 캐시해 탭/필터를 다시 고르면 즉시 재사용합니다.
+    build_plot(df, tab, filter_value, memo, **options)는 렌더링 쪽에서 호출되는 모듈 수준 함수로 (plot_func, kwargs) 또는 None을 반환하고,
+    memo에는 필터 인덱스처럼 요청 간에 재사용할 값을 둡니다. options(hue, top_n 등)는 캐시 키에도 들어갑니다.
+    프로세스 실행기에는 데이터프레임을 첫 캐시 미스 때 임시 파일로 한 번만 넘기고, 요청마다 탭/필터 값과 현재 스타일만 보냅니다.
+    executor로 스레드 풀을 넘기면 렌더링 중 메인 스레드에서 연 그림까지 저장/닫힐 수 있으니 그동안 다른 그림을 그리지 마세요.
+    """
+
+    def __init__(self, df, build_plot, options=None, cache=None, executor=None):
+        self.df = df
+        self.fingerprint = frame_fingerprint(df)
+        self.build_plot = build_plot
+        self.options = dict(options or {})
+        self.namespace = (build_plot.__module__, build_plot.__qualname__) + tuple(sorted(self.options.items()))
+        self.cache = DEFAULT_CACHE if cache is None else cache
+        self.executor = _default_executor() if executor is None else executor
+        self._source = None
+        self._pending = {}
+        # 이미 끝난 future에 콜백을 붙이면 즉시 같은 스레드에서 _finish가 호출되므로 재진입 가능 락 사용
+        self._lock = threading.RLock()
+
+    def key(self, tab, filter_value=None):
+        return (tab, filter_value, self.fingerprint) + self.namespace
+
+    def _frame_source(self):
+        """렌더링 쪽에 넘길 데이터: 프로세스 실행기면 한 번만 쓴 pickle 파일 경로, 아니면 프레임 자체"""
+        if self._source is None:
+            if isinstance(self.executor, ProcessPoolExecutor):
+                fd, path = tempfile.mkstemp(prefix='tab-frame-', suffix='.pkl')
+                os.close(fd)
+                self.df.to_pickle(path)
+                weakref.finalize(self, os.remove, path)
+                self._source = path
+            else:
+                self._source = {'df': self.df, 'memo': {}}
+        return self._source
+
+    def _submit(self, tab, filter_value):
+        source = self._frame_source()
+        # 같은 프로세스 실행기는 이미 같은 스타일을 쓰므로 rcParams를 넘기지 않음
+        rc = plot_style() if isinstance(source, str) else None
+        return self.executor.submit(render_tab, source, self.build_plot, self.options, tab, filter_value, rc)
+
+    def request(self, tab, filter_value, callback):
+        """
+        캐시에 있으면 바로 callback(png, None), 없으면 백그라운드 렌더링 후 callback(png, error).
+        필터링과 그림 준비는 캐시 미스일 때만 렌더링 쪽에서 합니다.
+        같은 키의 렌더링이 진행 중이면 새로 그리지 않고 결과를 기다립니다.
+
+        Returns:
+            bool: 캐시 적중 여부
+        """
+        key = self.key(tab, filter_value)
+        png = self.cache.get(key, _MISSING)
+        if png is not _MISSING:
+            callback(png, None)
+            return True
+
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                try:
+                    future = self._submit(tab, filter_value)
+                except BrokenProcessPool:
+                    # 렌더링 프로세스가 죽었으면 기본 실행기만 새로 만들어 다시 제출 (새 프로세스는 같은 파일에서 다시 읽음)
+                    if self.executor is not _EXECUTOR:
+                        raise
+                    self.executor = _default_executor(reset=True)
+                    future = self._submit(tab, filter_value)
+                self._pending[key] = future
+                future.add_done_callback(lambda done: self._finish(key, done))
+        future.add_done_callback(lambda done: callback(None if done.exception() else done.result(), done.exception()))
+        return False
+
+    def _finish(self, key, future):
+        with self._lock:
+            self._pending.pop(key, None)
+        if future.exception() is None:
+            self.cache.put(key, future.result())
@@ -1,10 +1,12 @@
 # 📊 노트북 최적화 시각화 자동화 (with Tabs)
 
-import ipywidgets as widgets
 import matplotlib.pyplot as plt
 import pandas as pd
 import seaborn as sns
-from IPython.display import clear_output, display
+
+from ..eda.correlation import correlation, heatmap_view
+from .binned_pairplot import binned_pairplot, use_binned_mode
+from .tab_renderer import TabRenderer
 
 
 def setup_plotting():
@@ -24,7 +26,7 @@ def setup_plotting():
     print("✅ [Visualization Setup] Plotting style applied!")
 
 
-def plot_numeric_columns(df):
+def plot_numeric_columns(df, show=True):
     """숫자형 컬럼 히스토그램."""
     numeric_cols = df.select_dtypes(include='number').columns
     if numeric_cols.empty:
@@ -33,23 +35,25 @@ def plot_numeric_columns(df):
     df[numeric_cols].hist(bins=20, figsize=(15, 10), color='skyblue', edgecolor='black')
     plt.suptitle('Numeric Columns Distribution', fontsize=20)
     plt.tight_layout()
-    plt.show()
+    if show:
+        plt.show()
 
 
-def plot_correlation_heatmap(df):
-    """상관관계 히트맵."""
-    numeric_cols = df.select_dtypes(include='number')
+def plot_correlation_heatmap(df, method='pearson', max_features=50, annot_limit=20, show=True):
+    """상관관계 히트맵 (컬럼이 많으면 상위 max_features개를 군집 순서로 표시)."""
+    numeric_cols = df.select_dtypes(include='number').columns
     if numeric_cols.empty:
         print("⚠️ No numeric columns for correlation heatmap.")
         return
-    corr = numeric_cols.corr()
+    corr = heatmap_view(correlation(df, columns=numeric_cols, method=method), max_features=max_features)
     plt.figure(figsize=(10, 8))
-    sns.heatmap(corr, annot=True, cmap='coolwarm', fmt=".2f")
+    sns.heatmap(corr, annot=len(corr) <= annot_limit, cmap='coolwarm', fmt=".2f")
     plt.title('Correlation Heatmap', fontsize=18)
-    plt.show()
+    if show:
+        plt.show()
 
 
-def plot_top_categories(df, column, top_n=10):
+def plot_top_categories(df, column, top_n=10, show=True):
     """범주형 컬럼 Top N 시각화."""
     if column not in df.columns:
         print(f"⚠️ Column '{column}' not found.")
@@ -60,28 +64,52 @@ def plot_top_categories(df, column, top_n=10):
     plt.title(f'Top {top_n} Categories in {column}', fontsize=18)
     plt.xlabel('Count')
     plt.ylabel(column)
-    plt.show()
+    if show:
+        plt.show()
 
 
-def plot_pairplot(df, hue=None):
-    """숫자형 컬럼 쌍플롯(pairplot)."""
+def plot_pairplot(df, hue=None, large_data=None, row_budget=1_000_000, max_columns=6, show=True):
+    """숫자형 컬럼 쌍플롯(pairplot). 큰 데이터는 샘플링 + 2D 히스토그램 모드."""
     numeric_cols = df.select_dtypes(include='number')
     if numeric_cols.empty:
         print("⚠️ No numeric columns for pairplot.")
         return
-    sns.pairplot(df, hue=hue, palette='pastel')
+    if large_data is None:
+        large_data = use_binned_mode(df, numeric_cols.columns, max_columns=max_columns)
+    if large_data:
+        columns = [col for col in numeric_cols.columns if col != hue]
+        binned_pairplot(df, columns=columns, hue=hue, row_budget=row_budget, max_columns=max_columns)
+    else:
+        sns.pairplot(df, hue=hue, palette='pastel')
     plt.suptitle('Pairplot of Numeric Columns', fontsize=20, y=1.02)
-    plt.show()
+    if show:
+        plt.show()
+
+
+def _tab_plot(df, tab_title, filter_value, memo, category_col=None, hue=None, top_n=10):
+    """plot_all_tabs 탭별 (그림 함수, 인자) - 렌더링 프로세스에서 호출"""
+    if tab_title == 'Numeric Columns':
+        return plot_numeric_columns, {'df': df, 'show': False}
+    if tab_title == 'Correlation Heatmap':
+        return plot_correlation_heatmap, {'df': df, 'show': False}
+    if tab_title == 'Top Categories':
+        if not category_col:
+            return None
+        return plot_top_categories, {'df': df, 'column': category_col, 'top_n': top_n, 'show': False}
+    return plot_pairplot, {'df': df, 'hue': hue, 'show': False}
 
 
 def plot_all_tabs(
     df,
     category_col=None,
     hue=None,
-    top_n=10
+    top_n=10,
+    cache=None,
+    executor=None
 ):
     """
-    모든 기본 시각화를 Tab으로 구분해서 한 번에 보여줍니다.
+    모든 기본 시각화를 Tab으로 구분해서 보여줍니다.
+    탭은 선택될 때만 백그라운드에서 그려지고, 결과는 (탭, 데이터 지문)별로 캐시됩니다.
     노트북 전용!
 
     Args:
@@ -89,36 +117,45 @@ def plot_all_tabs(
         category_col (str, optional): 범주형 컬럼명
         hue (str, optional): 페어플롯 구분 기준 컬럼
         top_n (int, optional): 범주형 상위 몇 개까지만
+        cache (PlotCache, optional): 렌더링 결과 캐시 (기본: 모듈 공용 LRU)
+        executor (Executor, optional): 렌더링 실행기 (기본: 렌더링 전용 프로세스 1개)
     """
+    # 위젯 의존성은 노트북에서만 필요하므로 여기서 import (헤드리스 내보내기는 figure_export 사용)
+    import ipywidgets as widgets
+    from IPython.display import display
 
     tab_titles = ['Numeric Columns', 'Correlation Heatmap', 'Top Categories', 'Pairplot']
-    tab_contents = []
-
-    # 탭별로 그래프 그리기
-    for tab_title in tab_titles:
-        output = widgets.Output()
-
-        with output:
-            clear_output(wait=True)
-            if tab_title == 'Numeric Columns':
-                plot_numeric_columns(df)
-            elif tab_title == 'Correlation Heatmap':
-                plot_correlation_heatmap(df)
-            elif tab_title == 'Top Categories':
-                if category_col:
-                    plot_top_categories(df, column=category_col, top_n=top_n)
-                else:
-                    print("⚠️ No category column specified.")
-            elif tab_title == 'Pairplot':
-                plot_pairplot(df, hue=hue)
-
-        tab_contents.append(output)
-
-    # Tab 위젯 만들기
+    renderer = TabRenderer(
+        df, _tab_plot, options={'category_col': category_col, 'hue': hue, 'top_n': top_n}, cache=cache, executor=executor
+    )
+    statuses = [widgets.HTML() for _ in tab_titles]
+    images = [widgets.Image(format='png') for _ in tab_titles]
+    tab_contents = [widgets.VBox([status, image]) for status, image in zip(statuses, images)]
+
+    # 선택된 탭만 그리기 (캐시에 있으면 즉시 표시)
+    def show_tab(index):
+        if tab_titles[index] == 'Top Categories' and not category_col:
+            statuses[index].value = "⚠️ No category column specified."
+            return
+
+        def on_rendered(png, error):
+            if error is not None:
+                statuses[index].value = f"❌ Rendering failed: {error}"
+            elif png is None:
+                statuses[index].value = "⚠️ Nothing to plot."
+            else:
+                images[index].value = png
+                statuses[index].value = ""
+
+        statuses[index].value = "⏳ Rendering..."
+        renderer.request(tab_titles[index], None, on_rendered)
+
     tabs = widgets.Tab(children=tab_contents)
     for i, title in enumerate(tab_titles):
         tabs.set_title(i, title)
+    tabs.observe(lambda change: show_tab(change['new']), names='selected_index')
 
     display(tabs)
+    show_tab(tabs.selected_index or 0)
 
-    print("\n✅ [Visualization] All plots generated in Tabs!")
+    print("\n✅ [Visualization] Plots render lazily in Tabs!")
@@ -1,12 +1,16 @@
 # 📊 노트북 최적화 시각화 프로페셔널 버전
 
 import io
+import math
 
-import ipywidgets as widgets
 import matplotlib.pyplot as plt
 import pandas as pd
 import seaborn as sns
-from IPython.display import clear_output, display
+
+from ..eda.correlation import correlation, heatmap_view
+from .binned_pairplot import binned_pairplot, use_binned_mode
+from .category_index import CategoryIndex
+from .tab_renderer import TabRenderer
 
 
 def setup_plotting():
@@ -26,11 +30,20 @@ def setup_plotting():
     print("✅ [Visualization Setup] Plotting style applied!")
 
 
-def save_current_plot(filename='plot.png'):
-    """현재 플롯 저장하기."""
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png')
-    buf.seek(0)
+def save_current_plot(filename=None, fig=None):
+    """
+    현재(또는 주어진) 플롯을 PNG 버퍼로 저장한 뒤 그림을 닫습니다.
+    filename이 있으면 파일로도 저장합니다 (형식은 확장자 기준, 예: .svg).
+    """
+    fig = plt.gcf() if fig is None else fig
+    try:
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png')
+        buf.seek(0)
+        if filename:
+            fig.savefig(filename)
+    finally:
+        plt.close(fig)
     return buf
 
 
@@ -45,14 +58,32 @@ def plot_numeric_columns(df):
     return save_current_plot()
 
 
-def plot_correlation_heatmap(df):
-    numeric_cols = df.select_dtypes(include='number')
+def plot_numeric_histograms(histograms):
+    """미리 계산된 (개수, 구간 경계)로 숫자형 컬럼 히스토그램 그리기."""
+    if not histograms:
+        print("⚠️ No numeric columns to plot.")
+        return None
+    n_cols = math.ceil(math.sqrt(len(histograms)))
+    n_rows = math.ceil(len(histograms) / n_cols)
+    fig, axes = plt.subplots(n_rows, n_cols, figsize=(15, 10), squeeze=False)
+    for ax, (col, (counts, edges)) in zip(axes.flat, histograms.items()):
+        ax.stairs(counts, edges, fill=True, color='skyblue', edgecolor='black')
+        ax.set_title(col)
+    for ax in axes.flat[len(histograms):]:
+        ax.set_visible(False)
+    fig.suptitle('Numeric Columns Distribution', fontsize=20)
+    fig.tight_layout()
+    return save_current_plot()
+
+
+def plot_correlation_heatmap(df, method='pearson', max_features=50, annot_limit=20):
+    numeric_cols = df.select_dtypes(include='number').columns
     if numeric_cols.empty:
         print("⚠️ No numeric columns for correlation heatmap.")
         return None
-    corr = numeric_cols.corr()
+    corr = heatmap_view(correlation(df, columns=numeric_cols, method=method), max_features=max_features)
     plt.figure(figsize=(10, 8))
-    sns.heatmap(corr, annot=True, cmap='coolwarm', fmt=".2f")
+    sns.heatmap(corr, annot=len(corr) <= annot_limit, cmap='coolwarm', fmt=".2f")
     plt.title('Correlation Heatmap', fontsize=18)
     return save_current_plot()
 
@@ -61,7 +92,11 @@ def plot_top_categories(df, column, top_n=10):
     if column not in df.columns:
         print(f"⚠️ Column '{column}' not found.")
         return None
-    counts = df[column].value_counts().head(top_n)
+    return plot_category_counts(df[column].value_counts().head(top_n), column, top_n=top_n)
+
+
+def plot_category_counts(counts, column, top_n=10):
+    """미리 계산된 범주 개수로 Top N 막대 그래프 그리기."""
     plt.figure(figsize=(10, 6))
     sns.barplot(x=counts.values, y=counts.index, palette='muted')
     plt.title(f'Top {top_n} Categories in {column}', fontsize=18)
@@ -70,18 +105,27 @@ def plot_top_categories(df, column, top_n=10):
     return save_current_plot()
 
 
-def plot_pairplot(df, hue=None):
+def plot_pairplot(df, hue=None, large_data=None, row_budget=1_000_000, max_columns=6):
     numeric_cols = df.select_dtypes(include='number')
     if numeric_cols.empty:
         print("⚠️ No numeric columns for pairplot.")
         return None
-    pair = sns.pairplot(df, hue=hue, palette='pastel')
+    if large_data is None:
+        large_data = use_binned_mode(df, numeric_cols.columns, max_columns=max_columns)
+    if large_data:
+        columns = [col for col in numeric_cols.columns if col != hue]
+        binned_pairplot(df, columns=columns, hue=hue, row_budget=row_budget, max_columns=max_columns)
+    else:
+        sns.pairplot(df, hue=hue, palette='pastel')
     plt.suptitle('Pairplot of Numeric Columns', fontsize=20, y=1.02)
     return save_current_plot()
 
 
 def plot_with_download(plot_func, **kwargs):
     """그래프 그리고, 다운로드 버튼 만들기."""
+    import ipywidgets as widgets
+    from IPython.display import clear_output, display
+
     output = widgets.Output()
     download_button = widgets.Button(
         description="Download Plot",
@@ -95,27 +139,55 @@ def plot_with_download(plot_func, **kwargs):
     def on_button_click(b):
         if img_data is not None:
             with output:
-                clear_output(wait=True)
                 print("✅ Download ready!")
-                display(widgets.Image(value=img_data.getvalue()))
 
     with output:
         clear_output(wait=True)
         img_data = plot_func(**kwargs)
+        # save_current_plot이 그림을 닫으므로 저장된 PNG를 바로 표시
+        if img_data is not None:
+            display(widgets.Image(value=img_data.getvalue()))
 
     download_button.on_click(on_button_click)
     display(widgets.VBox([download_button, output]))
 
 
-def plot_all_tabs(df, category_col=None, hue=None, top_n=10):
+def _tab_plot(df, tab_title, filter_value, memo, category_col=None, hue=None, top_n=10):
+    """plot_all_tabs 탭별 (그림 함수, 인자) - 렌더링 프로세스에서 호출"""
+    # 범주별 행 위치/집계를 한 번만 만들어 두고 필터 전환 시 재사용
+    category_index = None
+    if category_col:
+        if 'category_index' not in memo:
+            memo['category_index'] = CategoryIndex(df, category_col)
+        category_index = memo['category_index']
+    if tab_title == 'Numeric Columns':
+        if category_index is not None:
+            return plot_numeric_histograms, {'histograms': category_index.histograms(filter_value)}
+        return plot_numeric_columns, {'df': df}
+    if tab_title == 'Correlation Heatmap':
+        return plot_correlation_heatmap, {'df': df if category_index is None else category_index.frame(filter_value)}
+    if tab_title == 'Top Categories':
+        return plot_category_counts, {'counts': category_index.top_counts(filter_value, top_n), 'column': category_col, 'top_n': top_n}
+    return plot_pairplot, {'df': df if category_index is None else category_index.frame(filter_value), 'hue': hue}
+
+
+def plot_all_tabs(df, category_col=None, hue=None, top_n=10, cache=None, executor=None):
     """
     프로페셔널: 각 그래프별 다운로드 버튼 + 필터링 기능
+    탭은 선택될 때만 백그라운드에서 그려지고, 필터를 바꾸면 현재 탭만 다시 그립니다.
+    결과는 (탭, 필터 값, 데이터 지문)별로 캐시되어 탭/필터 전환 시 재사용됩니다.
     """
+    # 위젯 의존성은 노트북에서만 필요하므로 여기서 import (헤드리스 내보내기는 figure_export 사용)
+    import ipywidgets as widgets
+    from IPython.display import clear_output, display
 
     tab_titles = ['Numeric Columns', 'Correlation Heatmap', 'Top Categories', 'Pairplot']
-    tab_contents = []
+    renderer = TabRenderer(
+        df, _tab_plot, options={'category_col': category_col, 'hue': hue, 'top_n': top_n}, cache=cache, executor=executor
+    )
 
-    category_options = [None] + list(df[category_col].dropna().unique()) if category_col else [None]
+    # 필터 목록은 CategoryIndex와 같은 순서(처음 나온 순서, 결측 제외)로
+    category_options = [None] + list(pd.factorize(df[category_col])[1]) if category_col else [None]
 
     # 범주 필터 드롭다운
     category_filter = widgets.Dropdown(
@@ -125,37 +197,60 @@ def plot_all_tabs(df, category_col=None, hue=None, top_n=10):
         layout=widgets.Layout(width='300px')
     )
 
-    def filter_df(selected_value):
-        if selected_value and category_col:
-            return df[df[category_col] == selected_value]
-        return df
-
-    # 탭별로 그래프 그리기
-    for tab_title in tab_titles:
-        output = widgets.Output()
-
-        with output:
-            clear_output(wait=True)
-            filtered_df = filter_df(category_filter.value)
-            if tab_title == 'Numeric Columns':
-                plot_with_download(plot_numeric_columns, df=filtered_df)
-            elif tab_title == 'Correlation Heatmap':
-                plot_with_download(plot_correlation_heatmap, df=filtered_df)
-            elif tab_title == 'Top Categories':
-                if category_col:
-                    plot_with_download(plot_top_categories, df=filtered_df, column=category_col, top_n=top_n)
-                else:
-                    print("⚠️ No category column specified.")
-            elif tab_title == 'Pairplot':
-                plot_with_download(plot_pairplot, df=filtered_df, hue=hue)
-
-        tab_contents.append(output)
+    statuses = [widgets.HTML() for _ in tab_titles]
+    images = [widgets.Image(format='png') for _ in tab_titles]
+    download_outputs = [widgets.Output() for _ in tab_titles]
+    tab_contents = []
+
+    for index in range(len(tab_titles)):
+        download_button = widgets.Button(
+            description="Download Plot",
+            icon='download',
+            button_style='success',
+            layout=widgets.Layout(width='150px')
+        )
+
+        def on_button_click(b, index=index):
+            if images[index].value:
+                with download_outputs[index]:
+                    clear_output(wait=True)
+                    print("✅ Download ready!")
+                    display(widgets.Image(value=images[index].value))
+
+        download_button.on_click(on_button_click)
+        tab_contents.append(widgets.VBox([download_button, statuses[index], images[index], download_outputs[index]]))
+
+    # 선택된 탭만 현재 필터 값으로 그리기 (캐시에 있으면 필터링/렌더링 없이 즉시 표시)
+    def show_tab(index):
+        tab_title = tab_titles[index]
+        selected_value = category_filter.value
+        if tab_title == 'Top Categories' and not category_col:
+            statuses[index].value = "⚠️ No category column specified."
+            return
+
+        def on_rendered(png, error):
+            # 렌더링 중에 필터가 바뀌었으면 오래된 결과는 버림 (캐시에는 남음)
+            if category_filter.value != selected_value:
+                return
+            if error is not None:
+                statuses[index].value = f"❌ Rendering failed: {error}"
+            elif png is None:
+                statuses[index].value = "⚠️ Nothing to plot."
+            else:
+                images[index].value = png
+                statuses[index].value = ""
+
+        statuses[index].value = "⏳ Rendering..."
+        renderer.request(tab_title, selected_value if selected_value and category_col else None, on_rendered)
 
     tabs = widgets.Tab(children=tab_contents)
     for i, title in enumerate(tab_titles):
         tabs.set_title(i, title)
+    tabs.observe(lambda change: show_tab(change['new']), names='selected_index')
+    category_filter.observe(lambda change: show_tab(tabs.selected_index or 0), names='value')
 
     display(category_filter)
     display(tabs)
+    show_tab(tabs.selected_index or 0)
 
-    print("\n✅ [Professional Visualization] All plots ready in Tabs with Download and Filters!")
\ No newline at end of file
+    print("\n✅ [Professional Visualization] Plots render lazily in Tabs with Download and Filters!")